@@ -0,0 +1,116 @@
+"""Compare peak memory of the in-memory and streaming ISO builders.
+
+Creates a synthetic directory tree, then packs it into an ISO twice, each in
+a fresh subprocess so peak RSS is measured independently:
+
+* ``buffered`` - the previous implementation, which read every file into a
+  ``BytesIO`` before writing the image.
+* ``streaming`` - :func:`pytopomojo.iso.build_iso`, which lets pycdlib open
+  each file only while it is being written.
+
+Usage (from the repository root, Linux; ``ru_maxrss`` is read as KiB):
+    PYTHONPATH=. python benchmarks/iso_memory.py --files 64 --file-size-mb 8
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from io import BytesIO
+from typing import List
+
+
+def build_iso_buffered(directory_path: str, iso_output_path: str) -> None:
+    """The original upload_directory ISO builder, kept here as the baseline."""
+
+    import pycdlib
+    from pytopomojo.iso import _iso9660_name
+
+    open_files: List[BytesIO] = []
+    iso = pycdlib.PyCdlib()
+    iso.new(joliet=3)
+    try:
+        for root, dirs, files in os.walk(directory_path):
+            rel_root = os.path.relpath(root, directory_path)
+            if rel_root == '.':
+                iso9660_dir = '/'
+                joliet_dir = '/'
+            else:
+                parts = rel_root.replace(os.sep, '/').split('/')
+                iso9660_dir = '/' + '/'.join(_iso9660_name(p, True) for p in parts)
+                joliet_dir = '/' + '/'.join(parts)
+                iso.add_directory(iso9660_dir, joliet_path=joliet_dir)
+            for filename in files:
+                with open(os.path.join(root, filename), 'rb') as f:
+                    data = f.read()
+                fp = BytesIO(data)
+                open_files.append(fp)
+                iso.add_fp(fp, len(data),
+                           iso_path=iso9660_dir.rstrip('/') + '/' + _iso9660_name(filename, False),
+                           joliet_path=joliet_dir.rstrip('/') + '/' + filename)
+        iso.write(iso_output_path)
+    finally:
+        iso.close()
+
+
+def make_tree(root: str, files: int, file_size: int, per_dir: int = 16) -> None:
+    """Write ``files`` files of ``file_size`` random-ish bytes under ``root``."""
+
+    block = os.urandom(1024 * 1024)
+    for index in range(files):
+        directory = os.path.join(root, f"dir{index // per_dir:03d}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"file{index:05d}.bin"), 'wb') as f:
+            remaining = file_size
+            while remaining > 0:
+                chunk = block[:min(remaining, len(block))]
+                f.write(chunk)
+                remaining -= len(chunk)
+
+
+def run_child(variant: str, tree: str, output: str) -> None:
+    from pytopomojo.iso import build_iso
+
+    builder = build_iso if variant == 'streaming' else build_iso_buffered
+    started = time.perf_counter()
+    builder(tree, output)
+    elapsed = time.perf_counter() - started
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{elapsed:.3f} {peak_kib}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=64, help="Number of files in the tree.")
+    parser.add_argument("--file-size-mb", type=float, default=8, help="Size of each file in MiB.")
+    parser.add_argument("--child", nargs=3, metavar=("VARIANT", "TREE", "OUTPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    file_size = int(args.file_size_mb * 1024 * 1024)
+    with tempfile.TemporaryDirectory() as workdir:
+        tree = os.path.join(workdir, "tree")
+        make_tree(tree, args.files, file_size)
+        total_mib = args.files * file_size / (1024 * 1024)
+        print(f"Synthetic tree: {args.files} files, {total_mib:.0f} MiB")
+        print(f"{'variant':<10} {'seconds':>8} {'peak RSS MiB':>13} {'ISO MiB':>8}")
+
+        for variant in ("buffered", "streaming"):
+            output = os.path.join(workdir, f"{variant}.iso")
+            result = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", variant, tree, output],
+                check=True, capture_output=True, text=True)
+            elapsed, peak_kib = result.stdout.split()
+            iso_mib = os.path.getsize(output) / (1024 * 1024)
+            print(f"{variant:<10} {float(elapsed):>8.2f} {int(peak_kib) / 1024:>13.1f} {iso_mib:>8.1f}")
+            os.remove(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measure the per-call cost of the client's debug logging.
+
+Times the log statements of ``update_workspace`` and ``export_workspaces``
+with a realistic payload in three styles:
+
+* ``f-string`` - the previous implementation, which formatted the whole
+  payload before ``Logger.debug`` could discard the record.
+* ``lazy`` - :func:`pytopomojo.logs.client_logger` with %-style arguments;
+  nothing is formatted unless the record is emitted.
+* ``lazy+emit`` - the same with ``debug=True``, writing to a null stream,
+  which shows the cost of the bounded ``Abbreviated`` payload rendering.
+
+It also counts the console handlers left on the module logger after
+creating several ``debug=True`` clients.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/logging_overhead.py --ids 5000 --calls 20000
+"""
+
+import argparse
+import io
+import logging
+import timeit
+import uuid
+from typing import Any, Callable, Dict, List
+
+from pytopomojo.logs import Abbreviated, client_logger
+
+LOGGER_NAME = "pytopomojo.benchmark"
+
+
+def make_payload(ids: int) -> Dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": "Benchmark workspace",
+        "description": "x" * 2000,
+        "challenge": "y" * 20000,
+        "templateIds": [str(uuid.uuid4()) for _ in range(ids)],
+    }
+
+
+def old_style(logger: logging.Logger, payload: Dict[str, Any], ids: List[str]) -> Callable[[], None]:
+    def call() -> None:
+        logger.debug(f"Updating workspace {payload['id']} with payload {payload}")
+        logger.debug(f"Exporting {len(ids)} workspaces with IDs: {ids}")
+    return call
+
+
+def new_style(logger: logging.LoggerAdapter, payload: Dict[str, Any], ids: List[str]) -> Callable[[], None]:
+    def call() -> None:
+        logger.debug("Updating workspace %s with payload %s", payload['id'], Abbreviated(payload))
+        logger.debug("Exporting %s workspaces with IDs: %s", len(ids), Abbreviated(ids))
+    return call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ids", type=int, default=5000, help="Workspace IDs in the payloads.")
+    parser.add_argument("--calls", type=int, default=20000, help="Calls timed per variant.")
+    parser.add_argument("--clients", type=int, default=10, help="debug=True clients created.")
+    args = parser.parse_args()
+
+    payload = make_payload(args.ids)
+    ids = list(payload["templateIds"])
+
+    disabled = logging.getLogger(LOGGER_NAME + ".old")
+    disabled.disabled = True
+    quiet = client_logger(LOGGER_NAME + ".quiet", debug=False)
+    loud = client_logger(LOGGER_NAME + ".loud", debug=True)
+    for handler in loud.logger.handlers:
+        handler.setStream(io.StringIO())
+
+    variants = [
+        ("f-string", old_style(disabled, payload, ids), args.calls // 100 or 1),
+        ("lazy", new_style(quiet, payload, ids), args.calls),
+        ("lazy+emit", new_style(loud, payload, ids), args.calls // 10 or 1),
+    ]
+    print(f"Payload: {args.ids} IDs, {len(repr(payload)) / 1024:.0f} KiB as text")
+    print(f"{'variant':<10} {'calls':>8} {'us/call':>10}")
+    for name, call, calls in variants:
+        seconds = min(timeit.repeat(call, number=calls, repeat=3))
+        print(f"{name:<10} {calls:>8} {seconds / calls * 1e6:>10.2f}")
+
+    name = LOGGER_NAME + ".handlers"
+    for _ in range(args.clients):
+        client_logger(name, debug=True)
+    print(f"Console handlers after {args.clients} debug clients: {len(logging.getLogger(name).handlers)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""Local stand-in for the TopoMojo API used by the benchmark suite.
+
+Implements the endpoints :class:`pytopomojo.Topomojo` calls with synthetic
+data, plus knobs for the conditions a benchmark wants to control:
+
+* ``latency`` - seconds added before every response (with optional
+  ``jitter``), standing in for network and server time.
+* ``workspaces`` / ``templates`` / ``item_bytes`` - catalog size and the
+  padding added to every catalog item, which sets list payload sizes.
+* ``archive_bytes`` - size of every export package served by
+  ``/api/admin/download``. Packages are valid zips with a ``topo.json``.
+* ``failure_rate`` / ``failure_status`` - fraction of requests answered with
+  an error status instead of being served, to exercise retries.
+
+Responses are written with a single ``write`` of headers and body so small
+responses are not held back by Nagle's algorithm and delayed ACKs, which
+would otherwise add ~40 ms to every request on Linux loopback.
+
+Run standalone (e.g. to point the examples at it):
+    PYTHONPATH=. python benchmarks/mock_server.py --port 8080 --latency 0.02
+"""
+
+import argparse
+import functools
+import io
+import json
+import random
+import re
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass
+class MockConfig:
+    latency: float = 0.0
+    jitter: float = 0.0
+    workspaces: int = 200
+    templates: int = 400
+    item_bytes: int = 512
+    archive_bytes: int = 4 * 1024 * 1024
+    failure_rate: float = 0.0
+    failure_status: int = 503
+    seed: int = 0
+
+
+@functools.lru_cache(maxsize=4)
+def _filler(size: int) -> bytes:
+    # Random.randbytes needs Python 3.9; getrandbits works on 3.8 as well but
+    # rejects 0 bits there.
+    if not size:
+        return b''
+    return random.Random(size).getrandbits(size * 8).to_bytes(size, 'little')
+
+
+def build_archive(workspace_ids: List[str], size: int) -> bytes:
+    """Return an export package of roughly ``size`` bytes for ``workspace_ids``."""
+
+    buffer = io.BytesIO()
+    filler = _filler(max(0, size // max(1, len(workspace_ids))))
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for workspace_id in workspace_ids:
+            archive.writestr(f"{workspace_id}/topo.json", json.dumps({"id": workspace_id, "name": workspace_id}))
+            archive.writestr(f"{workspace_id}/docs/data.bin", filler)
+    return buffer.getvalue()
+
+
+class MockTopomojo:
+    """Threaded HTTP server emulating the TopoMojo API.
+
+    Use as a context manager, or call :meth:`start` and :meth:`stop`.
+    ``url`` is the base URL to pass as ``Topomojo(app_url=...)``; any API key
+    is accepted. ``stats`` counts requests, injected failures and bytes
+    received and sent.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or MockConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._archives: Dict[Tuple[str, ...], bytes] = {}
+        self.stats = {"requests": 0, "failures": 0, "bytes_received": 0, "bytes_sent": 0}
+        pad = "x" * self.config.item_bytes
+        self.workspaces = [{"id": f"ws{i:05d}", "name": f"Workspace {i}", "description": pad,
+                            "templates": [{"id": f"tm{(i * 2 + j) % max(1, self.config.templates):05d}"}
+                                          for j in range(2)]}
+                           for i in range(self.config.workspaces)]
+        self.templates = [{"id": f"tm{i:05d}", "name": f"Template {i}", "description": pad,
+                           "workspaceId": f"ws{i % max(1, self.config.workspaces):05d}"}
+                          for i in range(self.config.templates)]
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockTopomojo":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockTopomojo":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def archive(self, workspace_ids: List[str]) -> bytes:
+        key = tuple(workspace_ids)
+        with self._lock:
+            if key not in self._archives:
+                self._archives[key] = build_archive(workspace_ids, self.config.archive_bytes)
+            return self._archives[key]
+
+    def _should_fail(self) -> bool:
+        if not self.config.failure_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.config.failure_rate
+
+    def _delay(self) -> float:
+        if not self.config.jitter:
+            return self.config.latency
+        with self._lock:
+            return max(0.0, self.config.latency + self._random.uniform(-self.config.jitter, self.config.jitter))
+
+    def _handler(self) -> type:
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def respond(self, status: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None,
+                        content_type: str = "application/json") -> None:
+                lines = [f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}",
+                         f"Content-Type: {content_type}", f"Content-Length: {len(body)}"]
+                lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+                self.wfile.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body)
+                with mock._lock:
+                    mock.stats["bytes_sent"] += len(body)
+
+            def send_json(self, value: Any, status: int = 200) -> None:
+                self.respond(status, json.dumps(value).encode())
+
+            def read_body(self) -> bytes:
+                """Read the request body (also chunked), keeping at most the first 64 KiB."""
+
+                kept, total = bytearray(), 0
+
+                def consume(length: int) -> None:
+                    nonlocal total
+                    while length > 0:
+                        block = self.rfile.read(min(length, 1024 * 1024))
+                        if not block:
+                            break
+                        if len(kept) < 65536:
+                            kept.extend(block[:65536 - len(kept)])
+                        total += len(block)
+                        length -= len(block)
+
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    while True:
+                        length = int(self.rfile.readline().split(b';')[0].strip() or b'0', 16)
+                        if length == 0:
+                            self.rfile.readline()
+                            break
+                        consume(length)
+                        self.rfile.readline()
+                else:
+                    consume(int(self.headers.get("Content-Length") or 0))
+                with mock._lock:
+                    mock.stats["bytes_received"] += total
+                return bytes(kept)
+
+            def handle_request(self, method: str) -> None:
+                body = self.read_body() if method in ("POST", "PUT") else b""
+                with mock._lock:
+                    mock.stats["requests"] += 1
+                delay = mock._delay()
+                if delay:
+                    time.sleep(delay)
+                if mock._should_fail():
+                    with mock._lock:
+                        mock.stats["failures"] += 1
+                    return self.send_json({"message": "injected failure"}, mock.config.failure_status)
+                url = urlparse(self.path)
+                try:
+                    self.route(method, url.path, parse_qs(url.query), body)
+                except (ValueError, KeyError) as exc:
+                    self.send_json({"message": str(exc)}, 400)
+
+            def page(self, items: List[Dict[str, Any]], query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+                skip = int(query.get("Skip", ["0"])[0])
+                take = query.get("Take", [None])[0]
+                return items[skip:skip + int(take)] if take else items[skip:]
+
+            def route(self, method: str, path: str, query: Dict[str, List[str]], body: bytes) -> None:
+                if method == "GET":
+                    if path == "/api/workspaces":
+                        return self.send_json(self.page(mock.workspaces, query))
+                    if path == "/api/templates":
+                        return self.send_json(self.page(mock.templates, query))
+                    if path == "/api/gamespaces":
+                        return self.send_json(self.page([{"id": f"gs{i:05d}"} for i in range(50)], query))
+                    match = re.fullmatch(r"/api/workspace/([^/]+)", path)
+                    if match:
+                        workspace = next((w for w in mock.workspaces if w["id"] == match[1]), None)
+                        if workspace is None:
+                            return self.send_json({"message": "not found"}, 404)
+                        return self.send_json(workspace)
+                    match = re.fullmatch(r"/api/vm-template/([^/]+)", path)
+                    if match:
+                        return self.send_json({"id": match[1], "name": match[1], "task": None})
+                    match = re.fullmatch(r"/api/template-detail/([^/]+)", path)
+                    if match:
+                        detail = {"Disks": [{"Path": f"[ds] disks/{match[1]}.vmdk"}]}
+                        return self.send_json({"id": match[1], "detail": json.dumps(detail)})
+                    if re.fullmatch(r"/api/file/progress/[^/]+", path):
+                        # Uploads are processed as soon as they are received.
+                        return self.send_json(100)
+                elif method == "POST":
+                    if path == "/api/admin/download":
+                        return self.download(json.loads(body))
+                    if path == "/api/admin/upload":
+                        return self.send_json([w["id"] for w in mock.workspaces[:1]])
+                    if path == "/api/file/upload":
+                        return self.send_json(True)
+                    if path == "/api/admin/export":
+                        return self.send_json(json.loads(body))
+                    if re.fullmatch(r"/api/gamespace/[^/]+/(stop|complete)", path):
+                        return self.send_json({"id": path.split('/')[3]})
+                    if path in ("/api/workspace", "/api/template", "/api/template/unlink") or \
+                            re.fullmatch(r"/api/vm-template/[^/]+", path):
+                        return self.send_json(json.loads(body) if body else {})
+                elif method == "PUT":
+                    if path in ("/api/workspace", "/api/template"):
+                        return self.send_json(json.loads(body))
+                    match = re.fullmatch(r"/api/vm-template/([^/]+)", path)
+                    if match:
+                        return self.send_json({"id": match[1], "task": None})
+                    if re.fullmatch(r"/api/workspace/[^/]+/invite", path):
+                        return self.send_json({"code": "invite"})
+                elif method == "DELETE":
+                    if re.fullmatch(r"/api/workspace/[^/]+", path):
+                        return self.respond(200)
+                self.send_json({"message": f"no route for {method} {path}"}, 404)
+
+            def download(self, workspace_ids: List[str]) -> None:
+                data = mock.archive(workspace_ids)
+                requested = self.headers.get("Range")
+                match = re.fullmatch(r"bytes=(\d+)-", requested or "")
+                if match and int(match[1]) < len(data):
+                    start = int(match[1])
+                    content_range = f"bytes {start}-{len(data) - 1}/{len(data)}"
+                    return self.respond(206, data[start:], {"Content-Range": content_range}, "application/zip")
+                self.respond(200, data, content_type="application/zip")
+
+            def do_GET(self) -> None:
+                self.handle_request("GET")
+
+            def do_POST(self) -> None:
+                self.handle_request("POST")
+
+            def do_PUT(self) -> None:
+                self.handle_request("PUT")
+
+            def do_DELETE(self) -> None:
+                self.handle_request("DELETE")
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds added to the latency.")
+    parser.add_argument("--workspaces", type=int, default=200)
+    parser.add_argument("--templates", type=int, default=400)
+    parser.add_argument("--item-bytes", type=int, default=512, help="Padding added to each catalog item.")
+    parser.add_argument("--archive-mb", type=float, default=4, help="Size of each export package in MiB.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests that fail.")
+    parser.add_argument("--failure-status", type=int, default=503)
+    args = parser.parse_args()
+
+    config = MockConfig(latency=args.latency, jitter=args.jitter, workspaces=args.workspaces,
+                        templates=args.templates, item_bytes=args.item_bytes,
+                        archive_bytes=int(args.archive_mb * 1024 * 1024), failure_rate=args.failure_rate,
+                        failure_status=args.failure_status)
+    server = MockTopomojo(config, args.host, args.port)
+    print(f"Mock TopoMojo listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
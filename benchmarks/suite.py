@@ -0,0 +1,253 @@
+"""Offline benchmark suite for the client's main workflows.
+
+Starts :mod:`mock_server` in its own process, then runs each workflow in a
+fresh child process so its peak RSS is measured on its own:
+
+* ``list`` - ``get_workspaces`` pages fetched on ``--concurrency`` threads.
+* ``download`` - ``download_workspaces_parallel`` of ``--items`` export
+  packages of ``--archive-mb`` each.
+* ``upload`` - ``upload_workspaces_parallel`` of ``--items`` archives.
+* ``iso`` - ``upload_directory`` (ISO packing plus upload) of a synthetic
+  tree, ``--items`` times.
+
+For each workflow it reports operations and MiB per second, per-request
+latency percentiles of the workflow's main endpoint (from the client's
+``after_request`` hook) and peak RSS. Save a run with ``--json`` and pass
+it to a later run with ``--compare`` to see the change.
+
+Usage (from the repository root, Linux; ``ru_maxrss`` is read as KiB):
+    PYTHONPATH=. python benchmarks/suite.py --latency 0.005 --json baseline.json
+    PYTHONPATH=. python benchmarks/suite.py --latency 0.005 --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from mock_server import build_archive
+
+WORKFLOWS = ("list", "download", "upload", "iso")
+
+# Endpoint whose request latencies are reported for each workflow.
+ENDPOINTS = {
+    "list": "/api/workspaces",
+    "download": "/api/admin/download",
+    "upload": "/api/admin/upload",
+    "iso": "/api/file/upload",
+}
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[int(fraction * 100) - 1]
+
+
+def make_fixtures(workdir: str, items: int, archive_bytes: int, iso_files: int, iso_file_bytes: int) -> None:
+    """Write the upload archives and the ISO source tree used by the child processes."""
+
+    archives = os.path.join(workdir, "archives")
+    os.makedirs(archives)
+    for index in range(items):
+        with open(os.path.join(archives, f"archive{index:04d}.zip"), 'wb') as f:
+            f.write(build_archive([f"upload{index:04d}"], archive_bytes))
+
+    tree = os.path.join(workdir, "tree")
+    block = os.urandom(min(iso_file_bytes, 1024 * 1024) or 1)
+    for index in range(iso_files):
+        directory = os.path.join(tree, f"dir{index // 16:03d}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"file{index:04d}.bin"), 'wb') as f:
+            remaining = iso_file_bytes
+            while remaining > 0:
+                chunk = block[:min(remaining, len(block))]
+                f.write(chunk)
+                remaining -= len(chunk)
+
+
+def run_child(workflow: str, url: str, workdir: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    from pytopomojo import Hooks, RequestEvent, Topomojo, TopomojoException, TransportConfig
+
+    concurrency = options["concurrency"]
+    items = options["items"]
+    latencies: List[float] = []
+    transferred = [0]
+
+    def record(event: RequestEvent) -> None:
+        transferred[0] += event.bytes_sent + event.bytes_received
+        if event.endpoint == ENDPOINTS[workflow] and event.error is None:
+            latencies.append(event.elapsed)
+
+    hooks = Hooks()
+    hooks.on('after_request', record)
+    client = Topomojo(url, "benchmark", hooks=hooks, coalesce=False,
+                      transport=TransportConfig(pool_maxsize=max(10, concurrency), backoff_factor=0.05))
+
+    def succeeded(func: Callable[[int], Any], count: int) -> int:
+        """Run ``func(0..count-1)`` on the thread pool and count the calls that did not raise."""
+
+        def attempt(index: int) -> bool:
+            try:
+                func(index)
+                return True
+            except TopomojoException:
+                return False
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return sum(executor.map(attempt, range(count)))
+
+    run: Callable[[], int]
+    if workflow == "list":
+        page_size = options["page_size"]
+        pages = max(1, -(-options["workspaces"] // page_size))
+
+        def run() -> int:
+            return succeeded(lambda i: client.get_workspaces(Skip=(i % pages) * page_size, Take=page_size),
+                             options["requests"])
+    elif workflow == "download":
+        output = os.path.join(workdir, "downloads")
+        os.makedirs(output, exist_ok=True)
+
+        def run() -> int:
+            report = client.download_workspaces_parallel([f"ws{i:05d}" for i in range(items)], output,
+                                                         max_workers=concurrency)
+            return len(report.succeeded)
+    elif workflow == "upload":
+        archives = sorted(os.path.join(workdir, "archives", name)
+                          for name in os.listdir(os.path.join(workdir, "archives")))
+
+        def run() -> int:
+            report = client.upload_workspaces_parallel(archives, max_workers=concurrency, backoff=0.05)
+            return len(report.succeeded)
+    else:
+        tree = os.path.join(workdir, "tree")
+
+        def run() -> int:
+            return succeeded(lambda i: client.upload_directory(tree, f"ws{i:05d}", wait=True,
+                                                               stream=options["iso_stream"]), items)
+
+    attempted = options["requests"] if workflow == "list" else items
+    started = time.perf_counter()
+    operations = run()
+    elapsed = time.perf_counter() - started
+    if workflow == "download":
+        shutil.rmtree(os.path.join(workdir, "downloads"), ignore_errors=True)
+    return {
+        "operations": operations,
+        "failed": attempted - operations,
+        "seconds": elapsed,
+        "ops_per_second": operations / elapsed if elapsed else 0.0,
+        "mib_per_second": transferred[0] / elapsed / (1024 * 1024) if elapsed else 0.0,
+        "requests": len(latencies),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p90_ms": percentile(latencies, 0.90) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def start_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, str]:
+    command = [sys.executable, os.path.join(HERE, "mock_server.py"), "--port", "0",
+               "--latency", str(args.latency), "--jitter", str(args.jitter),
+               "--workspaces", str(args.workspaces), "--item-bytes", str(args.item_bytes),
+               "--archive-mb", str(args.archive_mb), "--failure-rate", str(args.failure_rate)]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = server.stdout.readline()
+    if not line:
+        server.kill()
+        raise RuntimeError("mock server failed to start")
+    return server, line.rsplit(" ", 1)[-1].strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", default=",".join(WORKFLOWS),
+                        help=f"Comma-separated subset of {', '.join(WORKFLOWS)}.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Client threads per workflow.")
+    parser.add_argument("--items", type=int, default=16, help="Archives downloaded/uploaded and ISO uploads.")
+    parser.add_argument("--requests", type=int, default=400, help="List requests sent.")
+    parser.add_argument("--page-size", type=int, default=50, help="Workspaces per list request.")
+    parser.add_argument("--workspaces", type=int, default=500, help="Workspaces in the mock catalog.")
+    parser.add_argument("--item-bytes", type=int, default=512, help="Padding per catalog item.")
+    parser.add_argument("--archive-mb", type=float, default=4, help="Size of each archive in MiB.")
+    parser.add_argument("--iso-files", type=int, default=32, help="Files in the ISO source tree.")
+    parser.add_argument("--iso-file-mb", type=float, default=1, help="Size of each ISO source file in MiB.")
+    parser.add_argument("--iso-stream", action="store_true", help="Stream ISOs instead of building a temp file.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock server latency in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Mock server latency jitter in seconds.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests the server fails.")
+    parser.add_argument("--json", help="Write the results to this file.")
+    parser.add_argument("--compare", help="Results file from an earlier run to compare against.")
+    parser.add_argument("--child", nargs=4, metavar=("WORKFLOW", "URL", "WORKDIR", "OPTIONS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        workflow, url, workdir, options = args.child
+        print(json.dumps(run_child(workflow, url, workdir, json.loads(options))))
+        return
+
+    workflows = [name.strip() for name in args.workflows.split(",") if name.strip()]
+    unknown = set(workflows) - set(WORKFLOWS)
+    if unknown:
+        parser.error(f"unknown workflows: {', '.join(sorted(unknown))}")
+    options = {"concurrency": args.concurrency, "items": args.items, "requests": args.requests,
+               "page_size": args.page_size, "workspaces": args.workspaces, "iso_stream": args.iso_stream}
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    server, url = start_server(args)
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            make_fixtures(workdir, args.items if "upload" in workflows else 0, int(args.archive_mb * 1024 * 1024),
+                          args.iso_files if "iso" in workflows else 0, int(args.iso_file_mb * 1024 * 1024))
+            print(f"Mock server {url}: latency {args.latency}s, failure rate {args.failure_rate}")
+            print(f"{'workflow':<10} {'ops':>6} {'failed':>6} {'ops/s':>9} {'MiB/s':>9} {'p50 ms':>8} {'p90 ms':>8} "
+                  f"{'p99 ms':>8} {'peak MiB':>9}")
+            for workflow in workflows:
+                completed = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--child", workflow, url, workdir,
+                     json.dumps(options)], capture_output=True, text=True)
+                if completed.returncode != 0:
+                    sys.stderr.write(completed.stderr)
+                    raise SystemExit(f"{workflow} workflow failed")
+                result = results[workflow] = json.loads(completed.stdout.splitlines()[-1])
+                print(f"{workflow:<10} {result['operations']:>6} {result['failed']:>6} "
+                      f"{result['ops_per_second']:>9.1f} {result['mib_per_second']:>9.1f} "
+                      f"{result['p50_ms']:>8.1f} {result['p90_ms']:>8.1f} {result['p99_ms']:>8.1f} "
+                      f"{result['peak_rss_mib']:>9.1f}")
+                if workflow in baseline:
+                    before = baseline[workflow]
+                    changes = []
+                    for key in ("ops_per_second", "p50_ms", "p99_ms", "peak_rss_mib"):
+                        if before.get(key):
+                            changes.append(f"{key} {(result[key] - before[key]) / before[key] * 100:+.1f}%")
+                    print(f"{'':<10} vs baseline: {', '.join(changes)}")
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"options": {**options, "latency": args.latency, "jitter": args.jitter,
+                                   "failure_rate": args.failure_rate, "archive_mb": args.archive_mb},
+                       "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,16 @@
 from .pytopomojo import Topomojo, TopomojoException
+from .async_pytopomojo import AsyncTopomojo
+from .bulk import BulkReport, ItemResult
+from .cache import ResponseCache
+from .singleflight import SingleFlight, AsyncSingleFlight
+from .transport import TransportConfig
+from .iso import IsoCache
+from .graph import WorkspaceGraph, normalize_disk_path, extract_disks_from_detail
+from .diskindex import DiskIndex
+from .mirror import CatalogMirror, ChangeEvent
+from .backup import IncrementalBackup, BackupResult
+from .ledger import UploadLedger
+from .archives import ArchiveCatalog, slugify
+from .throttle import Governor, RateLimiter
+from .polling import PollPolicy, PollTimeoutError, PollCancelledError
+from .instrumentation import Hooks, MetricsCollector, OpenTelemetryExporter, RequestEvent
@@ -0,0 +1,210 @@
+import os
+import re
+import json
+import difflib
+import zipfile
+import tempfile
+import unicodedata
+from dataclasses import asdict, dataclass, field
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_INDEX_VERSION = 1
+
+
+def slugify(name: str) -> str:
+    """Convert a workspace name into a slug to match export filenames."""
+
+    normalized = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    lowered = normalized.lower()
+    lowered = lowered.replace("&", " and ")
+    slug = re.sub(r"[^a-z0-9]+", "-", lowered)
+    slug = re.sub(r"-{2,}", "-", slug).strip("-")
+    return slug
+
+
+def read_archive_metadata(path: str) -> List[Dict[str, Any]]:
+    """Return ``{"id", "name"}`` for every workspace in an export package.
+
+    Only each workspace's ``topo.json`` is read. Unreadable archives yield
+    an empty list.
+    """
+
+    workspaces: List[Dict[str, Any]] = []
+    try:
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                folder, _, rest = name.partition('/')
+                if rest != 'topo.json':
+                    continue
+                try:
+                    topo = json.loads(archive.read(name)) or {}
+                except ValueError:
+                    topo = {}
+                workspaces.append({'id': topo.get('id') or folder, 'name': topo.get('name')})
+    except (OSError, zipfile.BadZipFile):
+        return []
+    return workspaces
+
+
+@dataclass
+class ArchiveEntry:
+    """An export package found by :class:`ArchiveCatalog`."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    workspaces: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def stem(self) -> str:
+        return os.path.splitext(os.path.basename(self.path))[0]
+
+
+class ArchiveCatalog:
+    """Index of workspace export packages under a directory tree.
+
+    :meth:`scan` lists directories with ``os.scandir`` on ``max_workers``
+    threads. With ``cache_path``, each zip's embedded workspace metadata is
+    saved and reused while the file's size and mtime (taken from the same
+    ``scandir`` pass) are unchanged, so only new or rewritten archives are
+    opened. Every directory is listed on every scan, because a directory's
+    mtime does not change when a file in it is rewritten in place.
+
+    Archives can be found by file stem, by slug of the stem or of any
+    embedded workspace name, and by embedded workspace ID, each with one
+    dictionary lookup. :meth:`fuzzy` ranks close slug matches.
+
+    Parameters
+    ----------
+    root: str
+        Directory to scan recursively for ``*.zip`` files.
+    cache_path: str, optional
+        JSON file for the persistent scan cache.
+    max_workers: int
+        Threads used for directory listing and metadata reads.
+    read_metadata: bool
+        Read ``topo.json`` from each new or changed archive.
+    """
+
+    def __init__(self, root: str, cache_path: Optional[str] = None, max_workers: int = 8,
+                 read_metadata: bool = True) -> None:
+        self.root = os.path.abspath(root)
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.read_metadata = read_metadata
+        self.entries: Dict[str, ArchiveEntry] = {}
+        self._by_key: Dict[str, str] = {}
+        self._directories: Dict[str, Dict[str, Any]] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get('version') != _INDEX_VERSION or cache.get('root') != self.root:
+            return {}
+        return cache.get('directories', {})
+
+    def _save_cache(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.cache_path)) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.archive-index-', suffix='.part')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': _INDEX_VERSION, 'root': self.root, 'directories': self._directories}, f)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _scan_directory(self, path: str) -> Tuple[str, Dict[str, Any]]:
+        """List one directory, reusing cached metadata of zips whose size and mtime are unchanged."""
+
+        cached = self._directories.get(path)
+        previous = {entry['path']: entry for entry in (cached or {}).get('files', [])}
+        files: List[Dict[str, Any]] = []
+        subdirs: List[str] = []
+        with os.scandir(path) as it:
+            for item in it:
+                if item.is_dir(follow_symlinks=False):
+                    subdirs.append(item.path)
+                elif item.is_file() and item.name.lower().endswith('.zip'):
+                    stat = item.stat()
+                    old = previous.get(item.path)
+                    if old is not None and old['size'] == stat.st_size and old['mtime_ns'] == stat.st_mtime_ns:
+                        files.append(old)
+                        continue
+                    entry = ArchiveEntry(item.path, stat.st_size, stat.st_mtime_ns)
+                    if self.read_metadata:
+                        entry.workspaces = read_archive_metadata(item.path)
+                    files.append(asdict(entry))
+        return path, {'files': files, 'subdirs': subdirs}
+
+    def scan(self) -> "ArchiveCatalog":
+        """(Re)build the index from disk and save the cache. Returns ``self``."""
+
+        if not os.path.isdir(self.root):
+            raise FileNotFoundError(f"Workspaces directory not found: {self.root}")
+
+        directories: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._scan_directory, self.root)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, listing = future.result()
+                    directories[path] = listing
+                    for subdir in listing['subdirs']:
+                        pending.add(executor.submit(self._scan_directory, subdir))
+        self._directories = directories
+
+        self.entries = {}
+        self._by_key = {}
+        for path in sorted(directories):
+            for data in directories[path]['files']:
+                self._add(ArchiveEntry(**data))
+
+        if self.cache_path:
+            self._save_cache()
+        return self
+
+    def _add(self, entry: ArchiveEntry) -> None:
+        self.entries[entry.path] = entry
+        keys = [entry.stem.lower(), slugify(entry.stem)]
+        for workspace in entry.workspaces:
+            if workspace.get('id'):
+                keys.append(str(workspace['id']).lower())
+            if workspace.get('name'):
+                keys.append(slugify(workspace['name']))
+        for key in keys:
+            # The first archive found for a key wins, matching a stable sorted scan.
+            if key:
+                self._by_key.setdefault(key, entry.path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup(self, name: str) -> Optional[ArchiveEntry]:
+        """Return the archive for a workspace name, slug, file stem or workspace ID."""
+
+        for key in (name.lower(), slugify(name)):
+            path = self._by_key.get(key)
+            if path is not None:
+                return self.entries[path]
+        return None
+
+    def fuzzy(self, name: str, limit: int = 5, cutoff: float = 0.6) -> List[ArchiveEntry]:
+        """Return up to ``limit`` archives whose keys resemble ``name``, best first."""
+
+        matches = difflib.get_close_matches(slugify(name), list(self._by_key), n=limit * 3, cutoff=cutoff)
+        results: List[ArchiveEntry] = []
+        for key in matches:
+            entry = self.entries[self._by_key[key]]
+            if entry not in results:
+                results.append(entry)
+        return results[:limit]
@@ -0,0 +1,646 @@
+import os
+import json
+import time
+import uuid
+import asyncio
+import tempfile
+from typing import List, Dict, Any, Optional, Callable, Awaitable, AsyncIterator, Tuple
+from urllib.parse import urlencode
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .bulk import BulkReport, ItemResult
+from .iso import build_iso
+from .logs import Abbreviated, client_logger
+from .multipart import MultipartEncoder
+from .polling import PollPolicy, apoll_until
+from .singleflight import AsyncSingleFlight
+from .pytopomojo import Topomojo, TopomojoException
+from .cache import cache_key
+from .graph import WorkspaceGraph
+
+
+def _clean_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop ``None`` values and render booleans the way ``requests`` does.
+
+    ``httpx`` sends ``None`` as an empty value and lowercases booleans, which
+    would change the query strings the TopoMojo API receives compared with
+    the synchronous client.
+    """
+
+    cleaned: Dict[str, Any] = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = str(value)
+        cleaned[key] = value
+    return cleaned
+
+
+async def _stream_body(body: MultipartEncoder) -> AsyncIterator[bytes]:
+    """Yield ``body`` in chunks read in the default executor.
+
+    ``httpx`` reads synchronous file objects on the event loop thread, which
+    stalls every other task for the length of a disk read. Reading through
+    the executor keeps large uploads from blocking the loop.
+    """
+
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, body.read, body.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        body.close()
+
+
+class AsyncTopomojo:
+    """Asyncio client for interacting with a TopoMojo instance.
+
+    Mirrors the :class:`~pytopomojo.Topomojo` API with coroutine methods so
+    many requests can be in flight on one event loop. Requires ``httpx``
+    (``pip install pytopomojo[async]``).
+    """
+
+    _json_or_none = Topomojo._json_or_none
+
+    def __init__(self, app_url: Optional[str] = None, api_key: Optional[str] = None, debug: bool = False,
+                 max_connections: int = 100, max_keepalive_connections: int = 20,
+                 timeout: Optional[float] = None, coalesce: bool = True) -> None:
+        """Create a new :class:`AsyncTopomojo` client.
+
+        Parameters
+        ----------
+        app_url: str, optional
+            Base URL to the TopoMojo application (e.g. ``https://example.com/topomojo``).
+            Falls back to the ``TOPOMOJO_URL`` environment variable if not provided.
+        api_key: str, optional
+            API key used for authentication.
+            Falls back to the ``TOPOMOJO_API_KEY`` environment variable if not provided.
+        debug: bool, optional
+            When ``True`` debug logging is enabled.
+        max_connections: int, optional
+            Upper bound on concurrent connections in the pool. Requests beyond
+            this wait for a free connection. Defaults to 100.
+        max_keepalive_connections: int, optional
+            Number of idle connections kept open for reuse. Defaults to 20.
+        timeout: float, optional
+            Timeout in seconds applied to connect, read, write and pool waits.
+            Defaults to ``None`` (no timeout), matching :class:`Topomojo`.
+        coalesce: bool, optional
+            When ``True`` (default), identical GET requests awaited
+            concurrently share a single HTTP request. See
+            ``singleflight.stats()``.
+        """
+
+        if httpx is None:
+            raise ImportError(
+                "AsyncTopomojo requires httpx; install it with 'pip install pytopomojo[async]'")
+
+        resolved_url = app_url if app_url is not None else os.environ.get("TOPOMOJO_URL")
+        resolved_key = api_key if api_key is not None else os.environ.get("TOPOMOJO_API_KEY")
+        if not resolved_url:
+            raise ValueError("app_url is required or set TOPOMOJO_URL environment variable")
+        if not resolved_key:
+            raise ValueError("api_key is required or set TOPOMOJO_API_KEY environment variable")
+        self.app_url = resolved_url
+        self.api_key = resolved_key
+        self.session = httpx.AsyncClient(
+            headers={'accept': 'application/json', 'x-api-key': self.api_key},
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_keepalive_connections),
+            timeout=timeout,
+        )
+        self.singleflight = AsyncSingleFlight() if coalesce else None
+
+        # Setup logger
+        self.logger = client_logger(__name__, debug)
+        self.logger.debug("AsyncTopomojo class initialized with logging enabled")
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncTopomojo":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _call(self, method: str, url: str, **kwargs) -> Optional[Any]:
+        """Send a request and return its JSON body, raising on non-200 responses."""
+
+        if 'params' in kwargs:
+            kwargs['params'] = _clean_params(kwargs['params'])
+
+        async def send() -> Tuple[Optional[Any], bytes]:
+            response = await self.session.request(method, url, **kwargs)
+            if response.status_code == 200:
+                return self._json_or_none(response), response.content
+            else:
+                raise TopomojoException(response.status_code, response.text)
+
+        if method != "GET" or self.singleflight is None or set(kwargs) - {'params'}:
+            return (await send())[0]
+        (value, content), shared = await self.singleflight.do(
+            (method,) + cache_key(url, kwargs.get('params')), send)
+        if shared:
+            self.logger.debug("Coalesced GET %s with an in-flight request", url)
+            return json.loads(content) if content else None
+        return value
+
+    async def _iter_pages(self, fetch: Callable[..., Awaitable[Optional[List[Any]]]], page_size: int,
+                          prefetch: bool, params: Dict[str, Any]) -> AsyncIterator[Any]:
+        """Async counterpart of :meth:`Topomojo._iter_pages`.
+
+        With ``prefetch`` the next page request runs as a task while the
+        caller consumes the current page.
+        """
+
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if 'Skip' in params or 'Take' in params:
+            raise ValueError("Skip and Take are managed by the iterator; use page_size instead")
+
+        async def load(skip: int) -> List[Any]:
+            self.logger.debug("Fetching page Skip=%s Take=%s", skip, page_size)
+            return await fetch(Skip=skip, Take=page_size, **params) or []
+
+        skip = 0
+        pending = asyncio.ensure_future(load(skip))
+        try:
+            while True:
+                page = await pending
+                if not page:
+                    return
+                skip += len(page)
+                if prefetch:
+                    pending = asyncio.ensure_future(load(skip))
+                    for item in page:
+                        yield item
+                else:
+                    for item in page:
+                        yield item
+                    pending = asyncio.ensure_future(load(skip))
+        finally:
+            pending.cancel()
+
+    ################################## TEMPLATE FUNCTIONS#####################################################################################
+    async def get_templates(self, WantsAudience=None, WantsPublished=None, WantsParents=None,
+                            aud=None, pid=None, sib=None, Term=None,
+                            Skip=None, Take=None, Sort=None, Filter=None) -> Optional[Any]:
+        """Get templates from TopoMojo. See :meth:`Topomojo.get_templates`."""
+
+        params = {
+            'WantsAudience': WantsAudience,
+            'WantsPublished': WantsPublished,
+            'WantsParents': WantsParents,
+            'aud': aud,
+            'pid': pid,
+            'sib': sib,
+            'Term': Term,
+            'Skip': Skip,
+            'Take': Take,
+            'Sort': Sort,
+            'Filter': Filter,
+        }
+        self.logger.debug("Getting templates with query params: %s", params)
+        return await self._call("GET", f"{self.app_url}/api/templates", params=params)
+
+    def iter_templates(self, page_size: int = 100, prefetch: bool = False, **params) -> AsyncIterator[Dict[str, Any]]:
+        """Asynchronously iterate over templates. See :meth:`Topomojo.iter_templates`."""
+
+        return self._iter_pages(self.get_templates, page_size, prefetch, params)
+
+    async def update_template(self, changed_template: Dict[str, Any]) -> Optional[Any]:
+        """Update an existing template. See :meth:`Topomojo.update_template`."""
+
+        self.logger.debug("Updating template with content %s", Abbreviated(changed_template))
+        return await self._call("PUT", f"{self.app_url}/api/template", json=changed_template)
+
+    async def update_template_detail(self, changed_detail: Dict[str, Any]) -> Optional[Any]:
+        """Update a template's detail. See :meth:`Topomojo.update_template_detail`."""
+
+        self.logger.debug("Updating template detail with content %s", Abbreviated(changed_detail))
+        return await self._call("PUT", f"{self.app_url}/api/template-detail", json=changed_detail)
+
+    async def new_workspace_template(self, template_link_data: Dict[str, Any]) -> Optional[Any]:
+        """Add a template to a workspace. See :meth:`Topomojo.new_workspace_template`."""
+
+        self.logger.debug("Adding template with data %s", Abbreviated(template_link_data))
+        return await self._call("POST", f"{self.app_url}/api/template", json=template_link_data)
+
+    async def unlink_template(self, template_link_data: Dict[str, Any]) -> Optional[Any]:
+        """Unlink a template from a parent. See :meth:`Topomojo.unlink_template`."""
+
+        self.logger.debug("Unlinking Template %s", Abbreviated(template_link_data))
+        return await self._call("POST", f"{self.app_url}/api/template/unlink", json=template_link_data)
+
+    async def get_template(self, template_id) -> Optional[Any]:
+        """Get a template by ID. See :meth:`Topomojo.get_template`."""
+
+        self.logger.debug("Getting template %s", template_id)
+        return await self._call("GET", f"{self.app_url}/api/vm-template/{template_id}")
+
+    async def get_template_detail(self, template_id) -> Optional[Any]:
+        """Get full template details by ID. See :meth:`Topomojo.get_template_detail`."""
+
+        self.logger.debug("Loading template detail for template ID: %s", template_id)
+        return await self._call("GET", f"{self.app_url}/api/template-detail/{template_id}")
+
+    async def initialize_template(self, template_id, wait: bool = True, poll: Optional[PollPolicy] = None,
+                                  cancel: Optional[asyncio.Event] = None,
+                                  on_progress: Optional[Callable[[int], None]] = None) -> Optional[Any]:
+        """Initialize a template after it has been unlinked.
+        Optionally wait for completion. See :meth:`Topomojo.initialize_template`.
+        """
+
+        self.logger.debug("Initializing template %s", template_id)
+        result = await self._call("PUT", f"{self.app_url}/api/vm-template/{template_id}")
+
+        if wait:
+            def tick(template: Optional[Dict[str, Any]]) -> None:
+                percent = Topomojo._template_progress(template)
+                self.logger.debug("Template %s task at %s%%", template_id, percent)
+                if on_progress is not None:
+                    on_progress(percent)
+
+            await apoll_until(lambda: self.get_template(template_id), Topomojo._template_task_done,
+                              policy=poll, cancel=cancel, on_tick=tick)
+        return result
+
+    async def deploy_vm_from_template(self, template_id) -> Optional[Any]:
+        """Deploy a VM from an existing template. See :meth:`Topomojo.deploy_vm_from_template`."""
+
+        self.logger.debug("Deploying VM template %s", template_id)
+        return await self._call("POST", f"{self.app_url}/api/vm-template/{template_id}")
+
+    ################################## WORKSPACE FUNCTIONS#####################################################################################
+
+    async def get_workspaces(self, aud: Optional[str] = None, scope: Optional[str] = None, doc: Optional[int] = None,
+                             WantsAudience: Optional[bool] = None, WantsManaged: Optional[bool] = None,
+                             WantsDoc: Optional[bool] = None, WantsPartialDoc: Optional[bool] = None,
+                             Term: Optional[str] = None, Skip: Optional[int] = None, Take: Optional[int] = None,
+                             Sort: Optional[str] = None, Filter: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """List workspaces matching the provided criteria. See :meth:`Topomojo.get_workspaces`."""
+
+        params = {
+            "aud": aud,
+            "scope": scope,
+            "doc": doc,
+            "WantsAudience": WantsAudience,
+            "WantsManaged": WantsManaged,
+            "WantsDoc": WantsDoc,
+            "WantsPartialDoc": WantsPartialDoc,
+            "Term": Term,
+            "Skip": Skip,
+            "Take": Take,
+            "Sort": Sort,
+            "Filter": Filter
+        }
+        self.logger.debug("Calling get_workspaces API with params: %s", params)
+        return await self._call("GET", f"{self.app_url}/api/workspaces", params=params)
+
+    def iter_workspaces(self, page_size: int = 100, prefetch: bool = False, **params) -> AsyncIterator[Dict[str, Any]]:
+        """Asynchronously iterate over workspaces. See :meth:`Topomojo.iter_workspaces`."""
+
+        return self._iter_pages(self.get_workspaces, page_size, prefetch, params)
+
+    async def get_workspace(self, workspace_id: str) -> Optional[Dict[str, Any]]:
+        """Get a workspace by ID. See :meth:`Topomojo.get_workspace`."""
+
+        self.logger.debug("Getting workspace %s", workspace_id)
+        return await self._call("GET", f"{self.app_url}/api/workspace/{workspace_id}")
+
+    async def load_workspace_graph(self, workspace_ids: List[str], max_workers: int = 8) -> WorkspaceGraph:
+        """Load workspaces, template details and disks into a :class:`WorkspaceGraph`.
+
+        At most ``max_workers`` requests are in flight. See
+        :meth:`Topomojo.load_workspace_graph`.
+        """
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        graph = WorkspaceGraph()
+        requested = set()
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def load_template(template_id: str) -> None:
+            try:
+                async with semaphore:
+                    detail = await self.get_template_detail(template_id)
+            except Exception as exc:
+                graph.errors[f"template:{template_id}"] = exc
+                return
+            graph.add_template_detail(template_id, detail)
+
+        async def load_workspace(workspace_id: str) -> None:
+            try:
+                async with semaphore:
+                    workspace = await self.get_workspace(workspace_id)
+            except Exception as exc:
+                graph.errors[f"workspace:{workspace_id}"] = exc
+                return
+            loads = []
+            for template_id in graph.add_workspace(workspace_id, workspace):
+                if template_id not in requested:
+                    requested.add(template_id)
+                    loads.append(load_template(template_id))
+            await asyncio.gather(*loads)
+
+        await asyncio.gather(*(load_workspace(workspace_id) for workspace_id in dict.fromkeys(workspace_ids)))
+        return graph
+
+    async def create_workspace(self, new_workspace_data: Dict[str, Any]) -> Optional[Any]:
+        """Create a new workspace. See :meth:`Topomojo.create_workspace`."""
+
+        self.logger.debug("Creating workspace %s", Abbreviated(new_workspace_data))
+        return await self._call("POST", f"{self.app_url}/api/workspace", json=new_workspace_data)
+
+    async def update_workspace(self, workspace_id: str, changed_workspace_data: Dict[str, Any]) -> Optional[Any]:
+        """Modify an existing workspace, merging unspecified fields from the
+        current workspace. See :meth:`Topomojo.update_workspace`.
+        """
+
+        changes = dict(
+            changed_workspace_data) if changed_workspace_data is not None else {}
+        payload: Dict[str, Any] = {'id': workspace_id}
+        allowed_fields = ["name", "description", "tags", "author", "audience"]
+
+        current: Dict[str, Any] = {}
+        try:
+            current = await self.get_workspace(workspace_id) or {}
+        except TopomojoException as e:
+            self.logger.debug(
+                "Could not load current workspace %s (status %s); will require 'name' in changes.",
+                workspace_id, e.status_code)
+        except Exception as e:
+            self.logger.debug("Error loading current workspace %s: %s", workspace_id, e)
+
+        for field in allowed_fields:
+            if field in changes:
+                payload[field] = changes[field]
+            elif current and field in current:
+                payload[field] = current[field]
+
+        if 'name' not in payload or payload['name'] is None or (isinstance(payload['name'], str) and payload['name'].strip() == ''):
+            if 'name' not in changes and not current:
+                raise ValueError(
+                    "Workspace name is required for update and could not be loaded from server.")
+
+        self.logger.debug("Updating workspace %s with payload %s", workspace_id, Abbreviated(payload))
+        return await self._call("PUT", f"{self.app_url}/api/workspace", json=payload)
+
+    async def get_workspace_invite(self, workspace_id) -> Optional[Any]:
+        """Generate an invite code for a workspace. See :meth:`Topomojo.get_workspace_invite`."""
+
+        self.logger.debug("Generating invitation code for workspace ID: %s", workspace_id)
+        return await self._call("PUT", f"{self.app_url}/api/workspace/{workspace_id}/invite")
+
+    async def delete_workspace(self, workspace_id) -> Optional[Any]:
+        """Delete a workspace. See :meth:`Topomojo.delete_workspace`."""
+
+        self.logger.debug("Deleting workspace with ID: %s", workspace_id)
+        return await self._call("DELETE", f"{self.app_url}/api/workspace/{workspace_id}")
+
+    async def export_workspaces(self, ids: List[str]) -> Optional[Any]:
+        """Export multiple workspaces by their IDs. See :meth:`Topomojo.export_workspaces`."""
+
+        self.logger.debug("Exporting %s workspaces with IDs: %s", len(ids), Abbreviated(ids))
+        return await self._call("POST", f"{self.app_url}/api/admin/export", json=ids)
+
+    async def export_workspace(self, workspace_id: str) -> Optional[Any]:
+        """Export a single workspace by ID."""
+
+        self.logger.debug("Exporting workspace with ID: %s", workspace_id)
+        return await self.export_workspaces([workspace_id])
+
+    async def download_workspaces(self, workspace_ids: List[str], output_file: str) -> bool:
+        """Download an export package containing one or more workspaces.
+        See :meth:`Topomojo.download_workspaces`.
+        """
+
+        self.logger.debug("Downloading an export package for workspaces: %s", Abbreviated(workspace_ids))
+
+        await self._download_to_file(workspace_ids, output_file)
+        return True
+
+    async def _download_to_file(self, workspace_ids: List[str], output_file: str) -> int:
+        """Stream an export package to ``output_file`` atomically and return the bytes written."""
+
+        url = f"{self.app_url}/api/admin/download"
+        async with self.session.stream("POST", url, json=workspace_ids) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise TopomojoException(response.status_code, response.text)
+
+            self.logger.debug("Saving export package to file: %s", output_file)
+            directory = os.path.dirname(os.path.abspath(output_file))
+            fd, temp_path = tempfile.mkstemp(
+                dir=directory, prefix=os.path.basename(output_file) + '.', suffix='.part')
+            written = 0
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                        file.write(chunk)
+                        written += len(chunk)
+                os.replace(temp_path, output_file)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        return written
+
+    async def download_workspaces_parallel(self, workspace_ids: List[str], output_dir: str, max_workers: int = 4,
+                                           filename: Optional[Callable[[str], str]] = None) -> BulkReport:
+        """Download one export package per workspace with at most ``max_workers``
+        transfers in flight. See :meth:`Topomojo.download_workspaces_parallel`.
+        """
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        os.makedirs(output_dir, exist_ok=True)
+        name_for = filename or (lambda workspace_id: f"{workspace_id}.zip")
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def download(workspace_id: str) -> ItemResult:
+            output_file = os.path.join(output_dir, name_for(workspace_id))
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    written = await self._download_to_file([workspace_id], output_file)
+                except Exception as exc:
+                    return ItemResult(key=workspace_id, ok=False, error=exc,
+                                      elapsed=time.monotonic() - started)
+                return ItemResult(key=workspace_id, ok=True, value=output_file, bytes=written,
+                                  elapsed=time.monotonic() - started)
+
+        started = time.monotonic()
+        results = await asyncio.gather(*(download(workspace_id) for workspace_id in workspace_ids))
+        report = BulkReport(results={result.key: result for result in results},
+                            elapsed=time.monotonic() - started)
+        self.logger.debug("Parallel download finished: %s", report.summary())
+        return report
+
+    async def download_workspace(self, workspace_id: str, output_file: str) -> bool:
+        """Download a single workspace export package."""
+
+        self.logger.debug("Downloading an export package for workspace: %s", workspace_id)
+        return await self.download_workspaces([workspace_id], output_file)
+
+    async def upload_workspace(self, archive_path: str) -> Optional[List[str]]:
+        """Upload a single workspace export package. See :meth:`Topomojo.upload_workspace`."""
+
+        self.logger.debug("Uploading workspace archive: %s", archive_path)
+
+        body = MultipartEncoder()
+        body.add_file("files", archive_path)
+        return await self._call("POST", f"{self.app_url}/api/admin/upload", content=_stream_body(body),
+                                headers={"Content-Type": body.content_type, "Content-Length": str(len(body))})
+
+    async def upload_workspaces(self, archive_paths: List[str]) -> List[str]:
+        """Upload multiple workspace export packages concurrently.
+
+        Returns the uploaded workspace IDs in the order of ``archive_paths``.
+        A failed upload does not cancel the others. Once all have finished,
+        each failure is written to the debug log with its archive path and
+        the first one (in ``archive_paths`` order) is raised. Use
+        :meth:`Topomojo.upload_workspaces_parallel` for a per-archive report.
+        """
+
+        results = await asyncio.gather(*(self.upload_workspace(path) for path in archive_paths),
+                                       return_exceptions=True)
+        uploaded_ids: List[str] = []
+        failures: List[BaseException] = []
+        for path, uploaded in zip(archive_paths, results):
+            if isinstance(uploaded, BaseException):
+                self.logger.debug("Upload of %s failed: %r", path, uploaded)
+                failures.append(uploaded)
+            elif uploaded:
+                uploaded_ids.extend(uploaded)
+        if failures:
+            raise failures[0]
+        return uploaded_ids
+
+    async def upload_iso(self, iso_path: str, workspace_id: str, is_global: bool = False, wait: bool = False,
+                         poll: Optional[PollPolicy] = None) -> Optional[Any]:
+        """Upload a file to a workspace. See :meth:`Topomojo.upload_iso`."""
+
+        self.logger.debug("Uploading ISO %s to workspace %s (is_global=%s)", iso_path, workspace_id, is_global)
+
+        if not os.path.isfile(iso_path):
+            raise ValueError(f"iso_path must be a file, not a directory or missing path: {iso_path}")
+
+        url = f"{self.app_url}/api/file/upload"
+        size = os.path.getsize(iso_path)
+        monitor_key = str(uuid.uuid4()) if wait else None
+
+        params: Dict[str, Any] = {"size": size}
+        if not is_global:
+            params["group-key"] = workspace_id
+        if monitor_key:
+            params["monitor-key"] = monitor_key
+
+        # Same single-section form encoding as Topomojo.upload_iso.
+        encoded_params = urlencode(params)
+
+        body = MultipartEncoder()
+        body.add_field("data", encoded_params, "text/plain")
+        body.add_file("file", iso_path)
+        response = await self.session.post(
+            url, content=_stream_body(body),
+            headers={"Content-Type": body.content_type, "Content-Length": str(len(body))})
+
+        if response.status_code != 200:
+            raise TopomojoException(response.status_code, response.text)
+
+        if wait and monitor_key:
+            progress_url = f"{self.app_url}/api/file/progress/{monitor_key}"
+
+            async def check() -> Optional[Any]:
+                progress_response = await self.session.get(progress_url)
+                if progress_response.status_code != 200:
+                    return None
+                return self._json_or_none(progress_response)
+
+            await apoll_until(check, lambda percent: percent is None or percent >= 100 or percent < 0,
+                              policy=poll, on_tick=lambda percent: self.logger.debug("ISO upload progress: %s%%", percent))
+
+        return self._json_or_none(response)
+
+    async def upload_directory(self, directory_path: str, workspace_id: str,
+                               is_global: bool = False, wait: bool = False,
+                               save_iso: Optional[str] = None,
+                               poll: Optional[PollPolicy] = None) -> Optional[Any]:
+        """Pack a local directory into an ISO and upload it to a workspace.
+
+        The ISO is built in the default executor so the event loop keeps
+        serving other requests. See :meth:`Topomojo.upload_directory`.
+        """
+
+        if not os.path.isdir(directory_path):
+            raise ValueError(f"directory_path must be a directory: {directory_path}")
+
+        if save_iso:
+            iso_output_path = save_iso
+            cleanup = False
+        else:
+            fd, iso_output_path = tempfile.mkstemp(suffix='.iso')
+            os.close(fd)
+            cleanup = True
+
+        self.logger.debug("Building ISO from directory %s -> %s", directory_path, iso_output_path)
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, build_iso, directory_path, iso_output_path)
+            self.logger.debug("ISO written to %s, uploading", iso_output_path)
+            return await self.upload_iso(iso_output_path, workspace_id, is_global=is_global, wait=wait,
+                                         poll=poll)
+        finally:
+            if cleanup:
+                os.remove(iso_output_path)
+
+    ################################## GAMESPACE FUNCTIONS#####################################################################################
+
+    async def get_gamespaces(self, WantsAll: Optional[bool] = None, WantsActive: Optional[bool] = None,
+                             Term: Optional[str] = None, Skip: Optional[int] = None, Take: Optional[int] = None,
+                             Sort: Optional[str] = None, Filter: Optional[List[str]] = None) -> Optional[Any]:
+        """List gamespaces available to the user. See :meth:`Topomojo.get_gamespaces`."""
+
+        params = {
+            "WantsAll": WantsAll,
+            "WantsActive": WantsActive,
+            "Term": Term,
+            "Skip": Skip,
+            "Take": Take,
+            "Sort": Sort,
+            "Filter": Filter
+        }
+        self.logger.debug("Listing gamespaces with params: %s", params)
+        return await self._call("GET", f"{self.app_url}/api/gamespaces", params=params)
+
+    def iter_gamespaces(self, page_size: int = 100, prefetch: bool = False, **params) -> AsyncIterator[Dict[str, Any]]:
+        """Asynchronously iterate over gamespaces. See :meth:`Topomojo.iter_gamespaces`."""
+
+        return self._iter_pages(self.get_gamespaces, page_size, prefetch, params)
+
+    async def stop_gamespace(self, gamespace_id: str) -> Optional[Any]:
+        """Stop a running gamespace."""
+
+        self.logger.debug("Stopping gamespace %s", gamespace_id)
+        return await self._call("POST", f"{self.app_url}/api/gamespace/{gamespace_id}/stop")
+
+    async def complete_gamespace(self, gamespace_id: str) -> Optional[Any]:
+        """Mark a gamespace as complete."""
+
+        self.logger.debug("Completing gamespace %s", gamespace_id)
+        return await self._call("POST", f"{self.app_url}/api/gamespace/{gamespace_id}/complete")
@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .bulk import BulkReport, run_bulk
+from .ledger import sha256_file
+from .mirror import fingerprint
+
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from .pytopomojo import Topomojo
+
+
+_MANIFEST_VERSION = 1
+
+
+@dataclass
+class BackupResult:
+    """Outcome of one :meth:`IncrementalBackup.run`.
+
+    ``downloaded`` lists workspaces whose export was fetched, of which
+    ``deduplicated`` matched an archive already in the store. ``unchanged``
+    workspaces reuse their previous archive. ``failed`` maps workspace IDs to
+    the download error; their last good archive, if any, stays in the new
+    generation. ``report`` is the underlying download :class:`BulkReport`.
+    """
+
+    generation: str
+    downloaded: List[str] = field(default_factory=list)
+    deduplicated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    failed: Dict[str, BaseException] = field(default_factory=dict)
+    pruned_generations: List[str] = field(default_factory=list)
+    pruned_bytes: int = 0
+    report: BulkReport = field(default_factory=BulkReport)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "generation": self.generation,
+            "downloaded": len(self.downloaded),
+            "deduplicated": len(self.deduplicated),
+            "unchanged": len(self.unchanged),
+            "failed": len(self.failed),
+            "pruned_generations": len(self.pruned_generations),
+            "pruned_bytes": self.pruned_bytes,
+            "bytes": self.report.total_bytes,
+        }
+
+
+class IncrementalBackup:
+    """Generational, deduplicated backups of workspace export packages.
+
+    Archives are stored once under ``objects/`` by SHA-256, so identical
+    exports (the same workspace on consecutive nights, or two identical
+    workspaces) take space once. ``manifest.json`` records each workspace's
+    fingerprint and archive, and every run appends a generation mapping
+    workspace IDs to archives. A workspace is downloaded again only when
+    its catalog entry (and, with ``deep``, its full workspace document,
+    including linked templates) has changed or its archive is missing.
+    Generations beyond ``keep_generations`` are dropped together with the
+    archives only they referenced.
+
+    Parameters
+    ----------
+    directory: str
+        Backup root. Created if missing.
+    keep_generations: int
+        Number of most recent generations retained. Defaults to 7.
+    """
+
+    def __init__(self, directory: str, keep_generations: int = 7) -> None:
+        if keep_generations < 1:
+            raise ValueError("keep_generations must be at least 1")
+        self.directory = directory
+        self.keep_generations = keep_generations
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if not os.path.exists(self.manifest_path):
+            return {'version': _MANIFEST_VERSION, 'workspaces': {}, 'generations': []}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != _MANIFEST_VERSION:
+            raise ValueError(f"{self.manifest_path}: unsupported manifest version {manifest.get('version')}")
+        return manifest
+
+    def _save_manifest(self) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.manifest-', suffix='.part')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def object_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, 'objects', sha256[:2], sha256 + '.zip')
+
+    def generations(self) -> List[Dict[str, Any]]:
+        """Retained generations, oldest first."""
+
+        return list(self.manifest['generations'])
+
+    def archive_path(self, workspace_id: str, generation: Optional[str] = None) -> Optional[str]:
+        """Return the archive backing ``workspace_id`` in ``generation`` (default: latest)."""
+
+        for entry in reversed(self.manifest['generations']):
+            if generation is None or entry['id'] == generation:
+                sha256 = entry['archives'].get(workspace_id)
+                return self.object_path(sha256) if sha256 else None
+        return None
+
+    def _new_generation_id(self) -> str:
+        base = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())
+        existing = {entry['id'] for entry in self.manifest['generations']}
+        generation, counter = base, 1
+        while generation in existing:
+            counter += 1
+            generation = f"{base}-{counter}"
+        return generation
+
+    def run(self, client: "Topomojo", max_workers: int = 4, deep: bool = False,
+            page_size: int = 100, **params) -> BackupResult:
+        """Back up every workspace listed by ``client.iter_workspaces(**params)``.
+
+        Changed workspaces are downloaded on ``max_workers`` threads. With
+        ``deep`` each workspace is also loaded with :meth:`Topomojo.get_workspace`
+        so changes to linked templates are detected; a workspace that fails
+        to load is treated as changed. Toggling ``deep`` between runs changes
+        every fingerprint, so the following run downloads everything once.
+        """
+
+        workspaces = {w['id']: w for w in client.iter_workspaces(page_size=page_size, **params) if w.get('id')}
+        fingerprints = {workspace_id: fingerprint(w) for workspace_id, w in workspaces.items()}
+        if deep:
+            details = run_bulk(workspaces, lambda workspace_id: client.get_workspace(workspace_id, use_cache=False),
+                               max_workers=max_workers)
+            for workspace_id, item in details.results.items():
+                fingerprints[workspace_id] = (fingerprint({'summary': workspaces[workspace_id], 'detail': item.value})
+                                              if item.ok else '')
+
+        known = self.manifest['workspaces']
+        changed = [workspace_id for workspace_id in workspaces
+                   if not fingerprints[workspace_id]
+                   or known.get(workspace_id, {}).get('fingerprint') != fingerprints[workspace_id]
+                   or not os.path.exists(self.object_path(known[workspace_id]['sha256']))]
+
+        result = BackupResult(generation=self._new_generation_id())
+        stale = set(changed)
+        result.unchanged = [workspace_id for workspace_id in workspaces if workspace_id not in stale]
+        staging = tempfile.mkdtemp(dir=self.directory, prefix='.staging-')
+        try:
+            result.report = client.download_workspaces_parallel(changed, staging, max_workers=max_workers)
+            for item in result.report.results.values():
+                if not item.ok:
+                    result.failed[item.key] = item.error
+                    continue
+                sha256 = sha256_file(item.value)
+                target = self.object_path(sha256)
+                if os.path.exists(target):
+                    result.deduplicated.append(item.key)
+                    os.remove(item.value)
+                else:
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.replace(item.value, target)
+                result.downloaded.append(item.key)
+                known[item.key] = {
+                    'fingerprint': fingerprints[item.key],
+                    'sha256': sha256,
+                    'size': item.bytes,
+                    'name': workspaces[item.key].get('name'),
+                    'backed_up_at': time.time(),
+                }
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        archives = {workspace_id: known[workspace_id]['sha256'] for workspace_id in workspaces
+                    if workspace_id in known}
+        for workspace_id in list(known):
+            if workspace_id not in workspaces:
+                del known[workspace_id]
+        self.manifest['generations'].append({'id': result.generation, 'created': time.time(), 'archives': archives})
+        result.pruned_generations, result.pruned_bytes = self._prune()
+        self._save_manifest()
+        return result
+
+    def _prune(self) -> Tuple[List[str], int]:
+        generations = self.manifest['generations']
+        dropped = generations[:-self.keep_generations]
+        self.manifest['generations'] = generations[-self.keep_generations:]
+        if not dropped:
+            return [], 0
+
+        referenced = {sha256 for entry in self.manifest['generations'] for sha256 in entry['archives'].values()}
+        referenced |= {entry['sha256'] for entry in self.manifest['workspaces'].values()}
+        freed = 0
+        for sha256 in {sha256 for entry in dropped for sha256 in entry['archives'].values()} - referenced:
+            path = self.object_path(sha256)
+            if os.path.exists(path):
+                freed += os.path.getsize(path)
+                os.remove(path)
+        return [entry['id'] for entry in dropped], freed
@@ -0,0 +1,112 @@
+import time
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+@dataclass
+class ItemResult:
+    """Outcome of one item in a bulk operation."""
+
+    key: str
+    ok: bool
+    value: Any = None
+    error: Optional[BaseException] = None
+    bytes: int = 0
+    elapsed: float = 0.0
+    attempts: int = 1
+    skipped: bool = False
+
+
+@dataclass
+class BulkReport:
+    """Per-item results and aggregate numbers for a bulk operation.
+
+    ``results`` is keyed by the item identifier (workspace ID, archive path,
+    gamespace ID, ...) in the order the items were submitted.
+    """
+
+    results: Dict[str, ItemResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> List[ItemResult]:
+        return [r for r in self.results.values() if r.ok]
+
+    @property
+    def failed(self) -> List[ItemResult]:
+        return [r for r in self.results.values() if not r.ok]
+
+    @property
+    def skipped(self) -> List[ItemResult]:
+        """Items that succeeded without doing any work (e.g. already uploaded)."""
+
+        return [r for r in self.results.values() if r.skipped]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(r.bytes for r in self.results.values())
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.total_bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the aggregate numbers as a plain dict (handy for logging)."""
+
+        return {
+            "total": len(self.results),
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "skipped": len(self.skipped),
+            "bytes": self.total_bytes,
+            "elapsed": round(self.elapsed, 3),
+            "bytes_per_second": round(self.bytes_per_second, 1),
+            "items_per_second": round(self.items_per_second, 3),
+        }
+
+
+def run_bulk(items: Iterable[Any], func: Callable[[Any], Any], max_workers: int = 4,
+             key: Callable[[Any], str] = str,
+             size: Optional[Callable[[Any, Any], int]] = None) -> BulkReport:
+    """Run ``func`` over ``items`` on a thread pool and collect every outcome.
+
+    Exceptions are captured per item rather than aborting the batch. ``size``
+    may map ``(item, value)`` to a byte count for throughput reporting.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    items = list(items)
+    report = BulkReport()
+    for item in items:
+        report.results[key(item)] = ItemResult(key=key(item), ok=False)
+
+    def timed(item: Any) -> ItemResult:
+        started = time.monotonic()
+        try:
+            value = func(item)
+        except Exception as exc:
+            return ItemResult(key=key(item), ok=False, error=exc,
+                              elapsed=time.monotonic() - started)
+        return ItemResult(key=key(item), ok=True, value=value,
+                          bytes=size(item, value) if size else 0,
+                          elapsed=time.monotonic() - started)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(timed, item) for item in items]
+        for future in as_completed(futures):
+            result = future.result()
+            report.results[result.key] = result
+    report.elapsed = time.monotonic() - started
+    return report
@@ -0,0 +1,170 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+# Cacheable read endpoints and the default number of seconds their responses
+# stay fresh. Lists change more often than individual template details.
+DEFAULT_TTLS: Dict[str, float] = {
+    'templates': 30.0,
+    'template': 60.0,
+    'template_detail': 300.0,
+    'workspaces': 30.0,
+    'workspace': 60.0,
+    'gamespaces': 10.0,
+}
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Normalize a GET request into a hashable key, ignoring ``None`` params like ``requests`` does."""
+
+    items: List[Tuple[str, str]] = []
+    for name, value in (params or {}).items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        items.extend((name, str(v)) for v in values)
+    return url, tuple(sorted(items))
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and its freshness metadata."""
+
+    content: bytes
+    expires: float
+    etag: Optional[str] = None
+    tags: FrozenSet[str] = field(default_factory=frozenset)
+
+    def value(self) -> Any:
+        """Parse a fresh copy of the body so callers cannot mutate the cache."""
+
+        return json.loads(self.content) if self.content else None
+
+
+class ResponseCache:
+    """Bounded LRU cache with per-endpoint TTLs for idempotent TopoMojo reads.
+
+    Pass an instance as ``Topomojo(cache=...)``. Responses are stored as raw
+    bytes and parsed on every hit. Entries past their TTL are revalidated
+    with ``If-None-Match`` when the server supplied an ``ETag``. Each entry
+    carries tags such as ``"templates"`` or ``"template:<id>"`` that
+    mutating client calls use to invalidate it. A response fetched while one
+    of its tags was invalidated is not stored (see :meth:`generation`).
+
+    Parameters
+    ----------
+    max_entries: int
+        Number of responses kept; the least recently used entry is evicted
+        beyond this.
+    ttls: dict, optional
+        Per-endpoint TTL overrides in seconds, merged over
+        :data:`DEFAULT_TTLS`. A TTL of 0 disables caching for that endpoint.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttls: Optional[Dict[str, float]] = None) -> None:
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self._entries: "OrderedDict[Any, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Invalidation counter, and the value it had when each tag was last
+        # invalidated. Tags invalidated before ``_floor`` have been forgotten.
+        self._generation = 0
+        self._invalidated: Dict[str, int] = {}
+        self._floor = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, 0.0)
+
+    def get(self, key: Any) -> Tuple[Optional[CacheEntry], bool]:
+        """Return ``(entry, fresh)``; stale entries are returned for revalidation."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            fresh = entry.expires > time.monotonic()
+            if fresh:
+                self.hits += 1
+            return entry, fresh
+
+    def generation(self) -> int:
+        """Return a token to pass to :meth:`put` as ``since`` before fetching a response."""
+
+        with self._lock:
+            return self._generation
+
+    def put(self, key: Any, endpoint: str, content: bytes, etag: Optional[str] = None,
+            tags: Iterable[str] = (), since: Optional[int] = None) -> None:
+        """Store a response.
+
+        With ``since`` (from :meth:`generation`), the response is dropped if
+        any of its tags was invalidated after the token was taken, since it
+        may predate that mutation.
+        """
+
+        ttl = self.ttl(endpoint)
+        if ttl <= 0:
+            return
+        entry = CacheEntry(content=content, expires=time.monotonic() + ttl, etag=etag,
+                           tags=frozenset(tags) | {endpoint})
+        with self._lock:
+            if since is not None and (since < self._floor or any(
+                    self._invalidated.get(tag, -1) > since for tag in entry.tags)):
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def refresh(self, key: Any, endpoint: str) -> None:
+        """Extend a stale entry after the server confirmed it with ``304 Not Modified``."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires = time.monotonic() + self.ttl(endpoint)
+                self.revalidations += 1
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every entry carrying any of ``tags``; returns how many were removed."""
+
+        wanted = set(tags)
+        with self._lock:
+            self._generation += 1
+            if len(self._invalidated) >= 4 * self.max_entries:
+                self._invalidated.clear()
+                self._floor = self._generation
+            for tag in wanted:
+                self._invalidated[tag] = self._generation
+            doomed = [key for key, entry in self._entries.items() if entry.tags & wanted]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,187 @@
+import time
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .bulk import run_bulk
+from .graph import extract_disks_from_detail, normalize_disk_path
+from .mirror import fingerprint
+
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from .pytopomojo import Topomojo
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    id TEXT PRIMARY KEY,
+    workspace_id TEXT,
+    name TEXT,
+    fingerprint TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS templates_workspace ON templates (workspace_id);
+CREATE TABLE IF NOT EXISTS template_disks (
+    disk_path TEXT NOT NULL,
+    template_id TEXT NOT NULL REFERENCES templates (id) ON DELETE CASCADE,
+    PRIMARY KEY (disk_path, template_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS template_disks_template ON template_disks (template_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class DiskIndex:
+    """Persistent SQLite index from disk paths to the templates and workspaces using them.
+
+    :meth:`refresh` walks the template catalog, loads template details and
+    rewrites only the templates whose list entry or detail changed since the
+    previous refresh, then removes templates that no longer exist. Lookups
+    are single indexed queries and never touch the API. Disk paths are
+    normalized with :func:`normalize_disk_path`, so ``ds://`` prefixes may be
+    passed or omitted.
+
+    Parameters
+    ----------
+    path: str
+        SQLite database file; ``":memory:"`` keeps the index in memory.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "DiskIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _query(self, sql: str, *args: Any) -> List[Any]:
+        with self._lock:
+            return [row[0] for row in self._db.execute(sql, args)]
+
+    def attach(self, client: "Topomojo") -> "DiskIndex":
+        """Mark templates stale whenever ``client`` changes them (e.g. :meth:`Topomojo.update_template_detail`)."""
+
+        def on_invalidate(tags: Tuple[str, ...]) -> None:
+            for tag in tags:
+                if tag.startswith('template:'):
+                    self.mark_stale(tag[len('template:'):])
+
+        client.invalidation_listeners.append(on_invalidate)
+        return self
+
+    def mark_stale(self, template_id: str) -> None:
+        """Force the next :meth:`refresh` to reload and rewrite ``template_id``."""
+
+        with self._lock, self._db:
+            self._db.execute("UPDATE templates SET fingerprint = '' WHERE id = ?", (template_id,))
+
+    def refresh(self, client: "Topomojo", full: bool = False, check_details: bool = True,
+                max_workers: int = 8, page_size: int = 100, **template_params) -> Dict[str, Any]:
+        """Bring the index up to date with the server.
+
+        Disk paths live in template details, which template list entries do
+        not carry, so by default the detail of every template is fetched on
+        ``max_workers`` threads and fingerprinted together with its list
+        entry. Only templates whose fingerprint changed are written. With
+        ``check_details=False`` details are only fetched for new templates,
+        templates whose list entry changed and templates marked stale (see
+        :meth:`attach`); this is cheaper but misses detail edits made by
+        other clients. ``full`` rewrites every template.
+
+        A template whose detail fails to load keeps its previous disks and is
+        retried on the next refresh. Extra keyword arguments are passed to
+        :meth:`Topomojo.iter_templates`.
+
+        Returns counts of ``added``, ``updated``, ``removed`` and
+        ``unchanged`` templates plus the ``failed`` template IDs.
+        """
+
+        with self._lock:
+            # Stored as "<list entry fingerprint>:<detail fingerprint>".
+            known = dict(self._db.execute("SELECT id, fingerprint FROM templates"))
+
+        summaries: Dict[str, Dict[str, Any]] = {}
+        for template in client.iter_templates(page_size=page_size, **template_params):
+            if template.get('id'):
+                summaries[template['id']] = template
+        summary_fingerprints = {template_id: fingerprint(summary) for template_id, summary in summaries.items()}
+        if check_details or full:
+            candidates = list(summaries)
+        else:
+            candidates = [template_id for template_id, digest in summary_fingerprints.items()
+                          if known.get(template_id, '').partition(':')[0] != digest]
+
+        report = run_bulk(candidates, lambda template_id: client.get_template_detail(template_id, use_cache=False),
+                          max_workers=max_workers)
+        changed = []
+        for item in report.succeeded:
+            digest = f"{summary_fingerprints[item.key]}:{fingerprint(item.value or {})}"
+            if full or known.get(item.key) != digest:
+                changed.append((item, digest))
+        removed = [template_id for template_id in known if template_id not in summaries]
+        now = time.time()
+        with self._lock, self._db:
+            for item, digest in changed:
+                summary = summaries[item.key]
+                self._db.execute(
+                    "INSERT INTO templates (id, workspace_id, name, fingerprint, synced_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET workspace_id = excluded.workspace_id, name = excluded.name, "
+                    "fingerprint = excluded.fingerprint, synced_at = excluded.synced_at",
+                    (item.key, summary.get('workspaceId'), summary.get('name'), digest, now))
+                self._db.execute("DELETE FROM template_disks WHERE template_id = ?", (item.key,))
+                self._db.executemany(
+                    "INSERT INTO template_disks (disk_path, template_id) VALUES (?, ?)",
+                    [(disk, item.key) for disk in extract_disks_from_detail(item.value)])
+            self._db.executemany("DELETE FROM templates WHERE id = ?", [(template_id,) for template_id in removed])
+            self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_sync', ?)", (str(now),))
+
+        updated = [item.key for item, _ in changed if item.key in known]
+        return {
+            "added": len(changed) - len(updated),
+            "updated": len(updated),
+            "removed": len(removed),
+            "unchanged": len(summaries) - len(changed) - len(report.failed),
+            "failed": [item.key for item in report.failed],
+        }
+
+    @property
+    def last_sync(self) -> Optional[float]:
+        """Unix time of the last completed refresh, or ``None``."""
+
+        rows = self._query("SELECT value FROM meta WHERE key = 'last_sync'")
+        return float(rows[0]) if rows else None
+
+    def templates_for_disk(self, path: str) -> List[str]:
+        return self._query("SELECT template_id FROM template_disks WHERE disk_path = ? ORDER BY template_id",
+                           normalize_disk_path(path))
+
+    def workspaces_for_disk(self, path: str) -> List[str]:
+        return self._query(
+            "SELECT DISTINCT t.workspace_id FROM template_disks d JOIN templates t ON t.id = d.template_id "
+            "WHERE d.disk_path = ? AND t.workspace_id IS NOT NULL ORDER BY t.workspace_id",
+            normalize_disk_path(path))
+
+    def disks_for_template(self, template_id: str) -> List[str]:
+        return self._query("SELECT disk_path FROM template_disks WHERE template_id = ? ORDER BY disk_path",
+                           template_id)
+
+    def disks_for_workspace(self, workspace_id: str) -> List[str]:
+        return self._query(
+            "SELECT DISTINCT d.disk_path FROM templates t JOIN template_disks d ON d.template_id = t.id "
+            "WHERE t.workspace_id = ? ORDER BY d.disk_path", workspace_id)
+
+    def disks(self) -> List[str]:
+        """Every indexed disk path."""
+
+        return self._query("SELECT DISTINCT disk_path FROM template_disks ORDER BY disk_path")
@@ -2,14 +2,27 @@
 # It accepts an optional command-line argument to specify the output directory for the downloaded files.
 # Arguments:
 #   --output-directory (-o): Directory to save downloaded workspaces. Defaults to the current directory.
+#   --workers (-w): Number of concurrent downloads. Defaults to 4.
+#   --incremental (-i): Keep deduplicated backup generations in the output directory and only
+#                       download workspaces that changed since the previous run.
+#   --keep (-k): Number of backup generations to retain in incremental mode. Defaults to 7.
 
-from pytopomojo import Topomojo, TopomojoException
+from pytopomojo import IncrementalBackup, Topomojo, TopomojoException
 import os, argparse
 
 parser = argparse.ArgumentParser(description="Download TopoMojo workspaces")
 parser.add_argument(
     "--output-directory", "-o", default=".", help="Directory to save downloaded workspaces"
 )
+parser.add_argument(
+    "--workers", "-w", type=int, default=4, help="Number of concurrent downloads"
+)
+parser.add_argument(
+    "--incremental", "-i", action="store_true", help="Only download workspaces changed since the last run"
+)
+parser.add_argument(
+    "--keep", "-k", type=int, default=7, help="Backup generations to retain with --incremental"
+)
 args = parser.parse_args()
 
 output_dir = args.output_directory
@@ -17,11 +30,21 @@ os.makedirs(output_dir, exist_ok=True)
 
 topomojo = Topomojo("https://example.com/topomojo", "<put your API Key here>")
 
-workspaces = topomojo.get_workspaces()
+if args.incremental:
+    backup = IncrementalBackup(output_dir, keep_generations=args.keep)
+    result = backup.run(topomojo, max_workers=args.workers)
+    for workspace_id, error in result.failed.items():
+        print(f"Failed to download {workspace_id}: {error}")
+    print(result.summary())
+    raise SystemExit(0)
 
-workspace_guids = [w["id"] for w in workspaces]
-workspace_slugs = [w["slug"] for w in workspaces]
+# Page through the catalog instead of loading every workspace in one response
+slugs = {w["id"]: w["slug"] for w in topomojo.iter_workspaces(page_size=100, prefetch=True)}
+
+report = topomojo.download_workspaces_parallel(
+    list(slugs), output_dir, max_workers=args.workers, filename=lambda wid: f"{slugs[wid]}.zip"
+)
 
-for workspace in workspaces:
-    output_path = os.path.join(output_dir, f"{workspace['slug']}.zip")
-    topomojo.download_workspaces([workspace["id"]], output_path)
+for result in report.failed:
+    print(f"Failed to download {slugs[result.key]}: {result.error}")
+print(report.summary())
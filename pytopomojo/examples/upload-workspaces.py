@@ -2,12 +2,10 @@
 
 import argparse
 import os
-import re
-import unicodedata
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List
 
-from pytopomojo import Topomojo, TopomojoException
+from pytopomojo import ArchiveCatalog, Topomojo, TopomojoException, UploadLedger, slugify
 
 
 def load_challenge_names(path: Path) -> List[str]:
@@ -26,37 +24,6 @@ def load_challenge_names(path: Path) -> List[str]:
     return names
 
 
-def slugify(name: str) -> str:
-    """Convert a workspace name into a slug to match export filenames."""
-
-    normalized = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
-    lowered = normalized.lower()
-    lowered = lowered.replace("&", " and ")
-    slug = re.sub(r"[^a-z0-9]+", "-", lowered)
-    slug = re.sub(r"-{2,}", "-", slug).strip("-")
-    return slug
-
-
-def build_zip_index(workspaces_dir: Path) -> Dict[str, Path]:
-    """Map lowercase zip stems to their full paths."""
-
-    if not workspaces_dir.exists():
-        raise FileNotFoundError(f"Workspaces directory not found: {workspaces_dir}")
-
-    zip_index: Dict[str, Path] = {}
-    for path in workspaces_dir.rglob("*"):
-        if path.is_file() and path.suffix.lower() == ".zip":
-            zip_index[path.stem.lower()] = path
-    return zip_index
-
-
-def resolve_archive_path(name: str, zip_index: Dict[str, Path]) -> Optional[Path]:
-    """Return the archive path for a workspace name if found."""
-
-    slug = slugify(name).lower()
-    return zip_index.get(slug)
-
-
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Upload TopoMojo workspace exports from a list of challenge names."
@@ -73,6 +40,10 @@ def main() -> None:
         default="workspaces",
         help="Directory containing workspace zip exports.",
     )
+    parser.add_argument(
+        "--index-cache",
+        help="JSON file caching the archive index between runs.",
+    )
     parser.add_argument(
         "--app-url",
         default=os.environ.get("TOPOMOJO_URL", "https://example.com/topomojo"),
@@ -86,7 +57,24 @@ def main() -> None:
     parser.add_argument(
         "--batch",
         action="store_true",
-        help="Upload all archives in one call with upload_workspaces.",
+        help="Upload all archives concurrently with upload_workspaces_parallel.",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=4,
+        help="Number of concurrent uploads in --batch mode (default: 4).",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Retries per archive for transient failures in --batch mode (default: 2).",
+    )
+    parser.add_argument(
+        "--ledger",
+        help="SQLite ledger of uploaded archives; already-imported archives are skipped in --batch mode.",
     )
     parser.add_argument(
         "--dry-run",
@@ -111,8 +99,8 @@ def main() -> None:
         print(f"No workspace names found in {workspace_file}")
         return
 
-    zip_index = build_zip_index(workspaces_dir)
-    if not zip_index:
+    catalog = ArchiveCatalog(str(workspaces_dir), cache_path=args.index_cache).scan()
+    if not len(catalog):
         print(f"No workspace zip files found in {workspaces_dir}")
         return
 
@@ -120,16 +108,18 @@ def main() -> None:
     missing: List[str] = []
 
     for name in names:
-        path = resolve_archive_path(name, zip_index)
-        if path is None:
+        entry = catalog.lookup(name)
+        if entry is None:
             missing.append(name)
             continue
-        archive_paths.append(path)
+        archive_paths.append(Path(entry.path))
 
     if missing:
         print("Missing workspace archives for:")
         for name in missing:
-            print(f"  - {name} (slug: {slugify(name)})")
+            suggestions = ", ".join(entry.stem for entry in catalog.fuzzy(name, limit=3))
+            hint = f"; did you mean: {suggestions}" if suggestions else ""
+            print(f"  - {name} (slug: {slugify(name)}{hint})")
 
     if not archive_paths:
         print("No workspace archives resolved for upload.")
@@ -145,11 +135,22 @@ def main() -> None:
 
     uploaded_ids: List[str] = []
     if args.batch:
-        try:
-            uploaded_ids = client.upload_workspaces([str(p) for p in archive_paths])
-        except TopomojoException as exc:
-            print(f"Failed to upload workspace batch: {exc}")
-            return
+        ledger = UploadLedger(args.ledger) if args.ledger else None
+        report = client.upload_workspaces_parallel(
+            [str(p) for p in archive_paths],
+            max_workers=args.workers,
+            retries=args.retries,
+            ledger=ledger,
+            check_server=ledger is not None,
+        )
+        for path, result in report.results.items():
+            if result.skipped:
+                print(f"Skipped {path}; already imported")
+            elif result.ok:
+                uploaded_ids.extend(result.value)
+            else:
+                print(f"Failed to upload {path}: {result.error}")
+        print(report.summary())
     else:
         for path in archive_paths:
             try:
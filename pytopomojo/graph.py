@@ -0,0 +1,114 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+def normalize_disk_path(path: str) -> str:
+    """Strip datastore prefixes so the same disk matches across templates."""
+
+    prefix = "ds://"
+    return path[len(prefix):] if path.startswith(prefix) else path
+
+
+def template_ids_from_workspace(workspace: Optional[Dict[str, Any]]) -> List[str]:
+    """Return the template IDs referenced by a workspace payload."""
+
+    template_entries: Iterable[dict] = (
+        (workspace or {}).get("templates") or (workspace or {}).get("templateLinks") or []
+    )
+
+    template_ids: List[str] = []
+    for template in template_entries:
+        template_id = (
+            template.get("templateId")
+            or template.get("id")
+            or (template.get("template") or {}).get("id")
+        )
+        if template_id:
+            template_ids.append(template_id)
+    return template_ids
+
+
+def extract_disks_from_detail(template_detail: Optional[Dict[str, Any]]) -> Set[str]:
+    """Return normalized disk paths referenced by a template detail payload."""
+
+    detail_payload = (template_detail or {}).get("detail")
+    if not detail_payload:
+        return set()
+
+    try:
+        parsed = json.loads(detail_payload)
+    except (TypeError, json.JSONDecodeError):
+        return set()
+
+    disks: Iterable[dict] = (parsed or {}).get("Disks") or []
+    disk_paths: Set[str] = set()
+    for disk in disks:
+        for key in ("Path", "Source"):
+            path_value = disk.get(key)
+            if path_value:
+                disk_paths.add(normalize_disk_path(path_value))
+    return disk_paths
+
+
+@dataclass
+class WorkspaceGraph:
+    """In-memory index of workspaces, the templates they link and their disks.
+
+    Built by :meth:`Topomojo.load_workspace_graph`. Forward indexes map
+    workspace → templates → disks; reverse indexes map disk → templates →
+    workspaces. Lookups are dictionary reads. Disk paths are normalized with
+    :func:`normalize_disk_path`.
+
+    ``errors`` holds the exception for every workspace or template that could
+    not be loaded, keyed ``"workspace:<id>"`` or ``"template:<id>"``.
+    """
+
+    workspaces: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    template_details: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    workspace_templates: Dict[str, Set[str]] = field(default_factory=dict)
+    template_workspaces: Dict[str, Set[str]] = field(default_factory=dict)
+    template_disks: Dict[str, Set[str]] = field(default_factory=dict)
+    disk_templates: Dict[str, Set[str]] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+
+    def add_workspace(self, workspace_id: str, workspace: Optional[Dict[str, Any]]) -> List[str]:
+        """Index a workspace payload and return its template IDs."""
+
+        template_ids = template_ids_from_workspace(workspace)
+        self.workspaces[workspace_id] = workspace or {}
+        self.workspace_templates[workspace_id] = set(template_ids)
+        for template_id in template_ids:
+            self.template_workspaces.setdefault(template_id, set()).add(workspace_id)
+        return template_ids
+
+    def add_template_detail(self, template_id: str, detail: Optional[Dict[str, Any]]) -> Set[str]:
+        """Index a template detail payload and return its disks."""
+
+        disks = extract_disks_from_detail(detail)
+        self.template_details[template_id] = detail or {}
+        self.template_disks[template_id] = disks
+        for disk in disks:
+            self.disk_templates.setdefault(disk, set()).add(template_id)
+        return disks
+
+    @property
+    def disks(self) -> Set[str]:
+        """Every unique disk referenced by the loaded templates."""
+
+        return set(self.disk_templates)
+
+    def disks_for_workspace(self, workspace_id: str) -> Set[str]:
+        disks: Set[str] = set()
+        for template_id in self.workspace_templates.get(workspace_id, ()):
+            disks |= self.template_disks.get(template_id, set())
+        return disks
+
+    def templates_for_disk(self, path: str) -> Set[str]:
+        return set(self.disk_templates.get(normalize_disk_path(path), ()))
+
+    def workspaces_for_disk(self, path: str) -> Set[str]:
+        workspaces: Set[str] = set()
+        for template_id in self.templates_for_disk(path):
+            workspaces |= self.template_workspaces.get(template_id, set())
+        return workspaces
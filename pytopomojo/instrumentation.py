@@ -0,0 +1,262 @@
+import re
+import bisect
+import logging
+import threading
+from dataclasses import dataclass
+from urllib.parse import urlparse
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover - optional dependency
+    otel_metrics = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+# Hook names and the arguments their callbacks receive.
+EVENTS: Dict[str, str] = {
+    'before_request': "(method, url)",
+    'after_request': "(RequestEvent)",
+    'retry': "(method, url, status, error)",
+    'poll_tick': "(key, value)",
+    'transfer_progress': "(direction, key, transferred, total)",
+}
+
+# Upper bounds (seconds) of the request latency histogram buckets.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_ID_SEGMENT = re.compile(r'\d')
+
+
+def endpoint_of(url: str) -> str:
+    """Collapse a request URL into an endpoint template such as ``/api/workspace/{id}``.
+
+    Everything before ``/api/`` (the application base path) is dropped and
+    path segments containing digits are treated as identifiers.
+    """
+
+    path = urlparse(url).path
+    index = path.find('/api/')
+    if index > 0:
+        path = path[index:]
+    segments = [('{id}' if _ID_SEGMENT.search(segment) or len(segment) > 24 else segment)
+                for segment in path.split('/')]
+    return '/'.join(segments) or '/'
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value (backslash, double quote and newline)."""
+
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+@dataclass
+class RequestEvent:
+    """One completed HTTP request, passed to ``after_request`` hooks."""
+
+    method: str
+    url: str
+    endpoint: str
+    status: Optional[int]
+    elapsed: float
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: Optional[BaseException] = None
+
+
+class Hooks:
+    """Registry of instrumentation callbacks.
+
+    Register with ``hooks.on("after_request", callback)``; see
+    :data:`EVENTS` for the available events and their arguments. A callback
+    that raises is logged and ignored so instrumentation can never break a
+    request.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: Dict[str, List[Callable[..., None]]] = {event: [] for event in EVENTS}
+
+    def on(self, event: str, callback: Callable[..., None]) -> Callable[..., None]:
+        if event not in self._callbacks:
+            raise ValueError(f"unknown hook {event!r}; expected one of {sorted(EVENTS)}")
+        self._callbacks[event].append(callback)
+        return callback
+
+    def off(self, event: str, callback: Callable[..., None]) -> None:
+        self._callbacks[event].remove(callback)
+
+    def has(self, event: str) -> bool:
+        """True when at least one callback listens to ``event``."""
+
+        return bool(self._callbacks[event])
+
+    def emit(self, event: str, *args: Any) -> None:
+        for callback in self._callbacks[event]:
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception("pytopomojo %s hook %r failed", event, callback)
+
+
+class _EndpointStats:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.statuses: Dict[str, int] = {}
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.latency_sum = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class MetricsCollector:
+    """In-process request metrics fed by :class:`Hooks`.
+
+    Per ``(method, endpoint)`` it keeps request, error and retry counts,
+    counts per status code, a latency histogram and bytes sent and received.
+    Attach it with :meth:`attach`; read it with :meth:`snapshot` or export it
+    with :meth:`to_prometheus`.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, hooks: Hooks) -> "MetricsCollector":
+        hooks.on('after_request', self.record_request)
+        hooks.on('retry', self.record_retry)
+        return self
+
+    def _entry(self, method: str, endpoint: str) -> _EndpointStats:
+        key = (method, endpoint)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _EndpointStats(self.buckets)
+        return stats
+
+    def record_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._entry(event.method, event.endpoint)
+            stats.count += 1
+            status = str(event.status) if event.status is not None else 'error'
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if event.error is not None or (event.status or 0) >= 400:
+                stats.errors += 1
+            stats.bucket_counts[bisect.bisect_left(self.buckets, event.elapsed)] += 1
+            stats.latency_sum += event.elapsed
+            stats.bytes_sent += event.bytes_sent
+            stats.bytes_received += event.bytes_received
+
+    def record_retry(self, method: str, url: str, status: Optional[int], error: Optional[BaseException]) -> None:
+        with self._lock:
+            self._entry(method, endpoint_of(url)).retries += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the metrics as plain data keyed by ``"METHOD /endpoint"``.
+
+        ``latency_buckets`` maps each bucket's upper bound to the cumulative
+        number of requests at or below it.
+        """
+
+        with self._lock:
+            result: Dict[str, Dict[str, Any]] = {}
+            for (method, endpoint), stats in sorted(self._stats.items(), key=lambda item: item[0][::-1]):
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.buckets + (float('inf'),), stats.bucket_counts):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                result[f"{method} {endpoint}"] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "statuses": dict(stats.statuses),
+                    "latency_sum": stats.latency_sum,
+                    "latency_mean": stats.latency_sum / stats.count if stats.count else 0.0,
+                    "latency_buckets": buckets,
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                }
+            return result
+
+    def to_prometheus(self, prefix: str = "pytopomojo") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+
+        def labels(method: str, endpoint: str, **extra: str) -> str:
+            pairs = {'method': method, 'endpoint': endpoint, **extra}
+            return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in pairs.items()) + '}'
+
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: item[0][::-1])
+            lines = [f"# HELP {prefix}_requests_total TopoMojo API requests by status.",
+                     f"# TYPE {prefix}_requests_total counter"]
+            for (method, endpoint), stats in items:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f"{prefix}_requests_total{labels(method, endpoint, status=status)} {count}")
+
+            lines += [f"# HELP {prefix}_request_duration_seconds TopoMojo API request latency.",
+                      f"# TYPE {prefix}_request_duration_seconds histogram"]
+            for (method, endpoint), stats in items:
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), stats.bucket_counts):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f"{prefix}_request_duration_seconds_bucket{labels(method, endpoint, le=le)} "
+                                 f"{cumulative}")
+                lines.append(f"{prefix}_request_duration_seconds_sum{labels(method, endpoint)} {stats.latency_sum}")
+                lines.append(f"{prefix}_request_duration_seconds_count{labels(method, endpoint)} {stats.count}")
+
+            lines += [f"# HELP {prefix}_bytes_total Request and response body bytes.",
+                      f"# TYPE {prefix}_bytes_total counter"]
+            for (method, endpoint), stats in items:
+                lines.append(f"{prefix}_bytes_total{labels(method, endpoint, direction='sent')} {stats.bytes_sent}")
+                lines.append(f"{prefix}_bytes_total{labels(method, endpoint, direction='received')} "
+                             f"{stats.bytes_received}")
+
+            lines += [f"# HELP {prefix}_retries_total Attempts retried by the transport.",
+                      f"# TYPE {prefix}_retries_total counter"]
+            for (method, endpoint), stats in items:
+                lines.append(f"{prefix}_retries_total{labels(method, endpoint)} {stats.retries}")
+        return '\n'.join(lines) + '\n'
+
+
+class OpenTelemetryExporter:
+    """Record request metrics through the OpenTelemetry metrics API.
+
+    Requires ``opentelemetry-api`` (``pip install pytopomojo[otel]``). The
+    instruments report through whatever ``MeterProvider`` the application
+    configured.
+    """
+
+    def __init__(self, hooks: Hooks, meter: Any = None) -> None:
+        if otel_metrics is None:
+            raise ImportError(
+                "OpenTelemetryExporter requires opentelemetry-api; install it with 'pip install pytopomojo[otel]'")
+        meter = meter or otel_metrics.get_meter("pytopomojo")
+        self._requests = meter.create_counter("pytopomojo.requests", unit="1",
+                                              description="TopoMojo API requests")
+        self._duration = meter.create_histogram("pytopomojo.request.duration", unit="s",
+                                                description="TopoMojo API request latency")
+        self._bytes = meter.create_counter("pytopomojo.bytes", unit="By",
+                                           description="Request and response body bytes")
+        self._retries = meter.create_counter("pytopomojo.retries", unit="1",
+                                             description="Attempts retried by the transport")
+        hooks.on('after_request', self._record_request)
+        hooks.on('retry', self._record_retry)
+
+    def _record_request(self, event: RequestEvent) -> None:
+        attributes = {'http.method': event.method, 'endpoint': event.endpoint,
+                      'http.status_code': event.status if event.status is not None else 0}
+        self._requests.add(1, attributes)
+        self._duration.record(event.elapsed, attributes)
+        self._bytes.add(event.bytes_sent, {**attributes, 'direction': 'sent'})
+        self._bytes.add(event.bytes_received, {**attributes, 'direction': 'received'})
+
+    def _record_retry(self, method: str, url: str, status: Optional[int], error: Optional[BaseException]) -> None:
+        self._retries.add(1, {'http.method': method, 'endpoint': endpoint_of(url)})
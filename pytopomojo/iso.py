@@ -0,0 +1,418 @@
+import os
+import re
+import json
+import hashlib
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Any, BinaryIO, List, Optional
+
+import pycdlib
+
+
+_ZERO_BLOCK = 1024 * 1024
+
+# Bump when the ISO layout produced by layout_iso changes so cached images
+# built by older versions are not reused.
+_LAYOUT_VERSION = 1
+
+
+def _iso9660_name(name: str, is_dir: bool) -> str:
+    """Sanitize a filename/dirname for ISO 9660 (uppercase, 8.3, A-Z0-9_ only)."""
+    name = name.upper()
+    name = re.sub(r'[^A-Z0-9_.]', '_', name)
+    if is_dir:
+        return name[:31]
+    base, _, ext = name.rpartition('.')
+    if not base:
+        base, ext = ext, ''
+    return (base[:8] + ('.' + ext[:3] if ext else '')) + ';1'
+
+
+def layout_iso(directory_path: str) -> "pycdlib.PyCdlib":
+    """Return an open ISO 9660 + Joliet layout of ``directory_path``.
+
+    Files are added by path, so pycdlib only records their names and sizes
+    here and opens each one while the image is written. Memory use therefore
+    scales with the number of entries, not with the size of the content. The
+    caller must ``close()`` the returned object.
+    """
+
+    iso = pycdlib.PyCdlib()  # type: ignore[attr-defined]
+    iso.new(joliet=3)
+
+    try:
+        for root, dirs, files in os.walk(directory_path):
+            rel_root = os.path.relpath(root, directory_path)
+
+            if rel_root == '.':
+                iso9660_dir = '/'
+                joliet_dir = '/'
+            else:
+                parts = rel_root.replace(os.sep, '/').split('/')
+                iso9660_dir = '/' + '/'.join(_iso9660_name(p, True) for p in parts)
+                joliet_dir = '/' + '/'.join(parts)
+                iso.add_directory(iso9660_dir, joliet_path=joliet_dir)
+
+            for filename in files:
+                file_path = os.path.join(root, filename)
+                iso9660_file = iso9660_dir.rstrip('/') + '/' + _iso9660_name(filename, False)
+                joliet_file = joliet_dir.rstrip('/') + '/' + filename
+                iso.add_file(file_path, iso_path=iso9660_file, joliet_path=joliet_file)
+    except BaseException:
+        iso.close()
+        raise
+    return iso
+
+
+def build_iso(directory_path: str, iso_output_path: str) -> None:
+    """Pack ``directory_path`` into an ISO 9660 + Joliet image at ``iso_output_path``.
+
+    The image is written incrementally, one source file at a time.
+    """
+
+    iso = layout_iso(directory_path)
+    try:
+        iso.write(iso_output_path)
+    finally:
+        iso.close()
+
+
+class _SequentialWriter:
+    """File-like sink that turns pycdlib's seek-and-write output into a stream.
+
+    pycdlib writes all volume descriptors, path tables and directory records
+    first (with seeks) and then the file contents. Everything below
+    ``data_start`` is collected in a buffer the size of that metadata; from
+    the first write at or beyond ``data_start`` on, bytes are passed to
+    ``sink`` in order, with skipped ranges emitted as zeros. A write behind
+    what has already been streamed raises ``IOError``.
+    """
+
+    mode = 'wb'
+
+    def __init__(self, sink: BinaryIO, data_start: int) -> None:
+        self._sink = sink
+        self._metadata: Optional[bytearray] = bytearray(data_start)
+        self._data_start = data_start
+        self._emitted = 0
+        self._pos = 0
+        self._end = 0
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            self._pos = offset
+        elif whence == os.SEEK_CUR:
+            self._pos += offset
+        else:
+            self._pos = self._end + offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def _emit_zeros(self, count: int) -> None:
+        zeros = bytes(min(count, _ZERO_BLOCK))
+        while count > 0:
+            piece = zeros[:min(count, len(zeros))]
+            self._sink.write(piece)
+            count -= len(piece)
+
+    def _advance_to(self, position: int) -> None:
+        if self._metadata is not None:
+            self._sink.write(self._metadata)
+            self._emitted = self._data_start
+            self._metadata = None
+        if position > self._emitted:
+            self._emit_zeros(position - self._emitted)
+            self._emitted = position
+
+    def write(self, data: bytes) -> int:
+        start = self._pos
+        end = start + len(data)
+        if self._metadata is not None and end <= self._data_start:
+            self._metadata[start:end] = data
+        else:
+            if start < max(self._emitted, self._data_start):
+                raise IOError(f"non-sequential ISO write at offset {start} "
+                              f"(already streamed {max(self._emitted, self._data_start)} bytes)")
+            self._advance_to(start)
+            self._sink.write(data)
+            self._emitted = end
+        self._pos = end
+        self._end = max(self._end, end)
+        return len(data)
+
+    def finish(self, size: int) -> None:
+        """Flush any remaining metadata and zero padding up to ``size`` bytes."""
+
+        self._advance_to(size)
+
+
+# pycdlib internals IsoStream relies on to predict the output layout; they
+# are private, so their absence switches it to building a temporary file.
+_STREAMING_ATTRIBUTES = ('_needs_reshuffle', '_reshuffle_extents', 'inodes', 'pvd', 'logical_block_size')
+
+
+def _supports_streaming(iso: "pycdlib.PyCdlib") -> bool:
+    if not all(hasattr(iso, name) for name in _STREAMING_ATTRIBUTES):
+        return False
+    return all(hasattr(ino, 'extent_location') and hasattr(ino, 'get_data_length') for ino in iso.inodes)
+
+
+class IsoStream:
+    """Generate the ISO image of a directory on a background thread.
+
+    The layout (and therefore :attr:`size`) is computed up front from the
+    directory metadata; :meth:`open` starts writing the image into a pipe and
+    returns its read end, so the image can be uploaded while it is produced
+    without ever touching local disk. Use as a context manager, or call
+    :meth:`close` to reap the producer thread and surface its errors.
+
+    Predicting the layout uses pycdlib internals. If the installed pycdlib
+    does not have them, the image is built with :func:`build_iso` into a
+    temporary file instead, and :meth:`open` returns that file.
+    """
+
+    def __init__(self, directory_path: str, blocksize: int = 1024 * 1024) -> None:
+        self.directory_path = directory_path
+        self.blocksize = blocksize
+        self._reader: Optional[BinaryIO] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._temp_path: Optional[str] = None
+        self._iso: Optional["pycdlib.PyCdlib"] = layout_iso(directory_path)
+        try:
+            # False when the image is served from a temporary file.
+            self.streaming = _supports_streaming(self._iso)
+            if not self.streaming:
+                self._iso.close()
+                self._iso = None
+                self._build_temp_file()
+                return
+            # File contents are written in self.inodes order; sort it by extent
+            # so the output only ever moves forward.
+            if self._iso._needs_reshuffle:
+                self._iso._reshuffle_extents()
+            self._iso.inodes.sort(
+                key=lambda ino: ino.extent_location() if ino.get_data_length() > 0 else 0)
+        except BaseException:
+            if self._iso is not None:
+                self._iso.close()
+            raise
+        block_size = self._iso.logical_block_size
+        self.size = self._iso.pvd.space_size * block_size
+        data_extents = [ino.extent_location() for ino in self._iso.inodes if ino.get_data_length() > 0]
+        self._data_start = min(data_extents) * block_size if data_extents else self.size
+
+    def _build_temp_file(self) -> None:
+        fd, self._temp_path = tempfile.mkstemp(suffix='.iso')
+        os.close(fd)
+        try:
+            build_iso(self.directory_path, self._temp_path)
+            self.size = os.path.getsize(self._temp_path)
+        except BaseException:
+            os.remove(self._temp_path)
+            self._temp_path = None
+            raise
+
+    def _produce(self, write_fd: int) -> None:
+        try:
+            with os.fdopen(write_fd, 'wb', buffering=self.blocksize) as sink:
+                writer = _SequentialWriter(sink, self._data_start)
+                self._iso.write_fp(writer, blocksize=self.blocksize)
+                writer.finish(self.size)
+        except BaseException as exc:
+            self._error = exc
+
+    def open(self) -> BinaryIO:
+        """Start producing the image and return a readable stream of it."""
+
+        if self._thread is not None or self._reader is not None:
+            raise RuntimeError("IsoStream can only be opened once")
+        if self._temp_path is not None:
+            self._reader = open(self._temp_path, 'rb')
+            return self._reader
+        read_fd, write_fd = os.pipe()
+        self._reader = os.fdopen(read_fd, 'rb')
+        self._thread = threading.Thread(target=self._produce, args=(write_fd,),
+                                        name="pytopomojo-iso-stream", daemon=True)
+        self._thread.start()
+        return self._reader
+
+    def close(self) -> None:
+        """Stop the producer, release the layout and re-raise producer errors."""
+
+        if self._reader is not None:
+            # Closing the read end makes a still-running producer fail with
+            # BrokenPipeError instead of blocking forever.
+            self._reader.close()
+        if self._thread is not None:
+            self._thread.join()
+        if self._iso is not None:
+            self._iso.close()
+            self._iso = None
+        if self._temp_path is not None:
+            os.remove(self._temp_path)
+            self._temp_path = None
+        error, self._error = self._error, None
+        if error is not None and not isinstance(error, BrokenPipeError):
+            raise error
+
+    def __enter__(self) -> "IsoStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+@dataclass
+class IsoCacheEntry:
+    """A cached ISO image."""
+
+    key: str
+    path: str
+    size: int
+    last_used: float
+    source: Optional[str] = None
+
+
+class IsoCache:
+    """On-disk cache of ISO images keyed by a manifest hash of the source tree.
+
+    The manifest covers every relative path, file size and modification
+    time in the directory (or, with ``hash_contents``, the SHA-256 of every
+    file instead of its mtime, so identical copies share one image). When
+    the cache grows beyond ``max_bytes`` the least recently used images are
+    evicted. Last use is tracked through the image file's mtime, so several
+    processes can share one cache directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 10 * 1024 ** 3, hash_contents: bool = False) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hash_contents = hash_contents
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def manifest_key(self, directory_path: str) -> str:
+        """Return the cache key for the current contents of ``directory_path``."""
+
+        digest = hashlib.sha256(f"layout-v{_LAYOUT_VERSION}\n".encode())
+        for root, dirs, files in os.walk(directory_path):
+            dirs.sort()
+            rel_root = os.path.relpath(root, directory_path).replace(os.sep, '/')
+            digest.update(f"D {rel_root}\n".encode())
+            for filename in sorted(files):
+                file_path = os.path.join(root, filename)
+                stat = os.stat(file_path)
+                if self.hash_contents:
+                    file_digest = hashlib.sha256()
+                    with open(file_path, 'rb') as f:
+                        for block in iter(lambda: f.read(1024 * 1024), b''):
+                            file_digest.update(block)
+                    fingerprint = file_digest.hexdigest()
+                else:
+                    fingerprint = str(stat.st_mtime_ns)
+                digest.update(f"F {rel_root}/{filename}\0{stat.st_size}\0{fingerprint}\n".encode())
+        return digest.hexdigest()
+
+    def _image_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.iso')
+
+    def lookup(self, directory_path: str) -> Optional[str]:
+        """Return the cached image for ``directory_path`` or ``None`` if absent."""
+
+        path = self._image_path(self.manifest_key(directory_path))
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def get_or_build(self, directory_path: str) -> str:
+        """Return the path of an ISO for ``directory_path``, building it on a miss."""
+
+        key = self.manifest_key(directory_path)
+        path = self._image_path(key)
+        try:
+            os.utime(path)
+            return path
+        except FileNotFoundError:
+            pass
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=key + '.', suffix='.part')
+        os.close(fd)
+        try:
+            build_iso(directory_path, temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        with open(os.path.join(self.directory, key + '.json'), 'w', encoding='utf-8') as f:
+            json.dump({'source': os.path.abspath(directory_path)}, f)
+        self.prune(keep=key)
+        return path
+
+    def entries(self) -> List[IsoCacheEntry]:
+        """List cached images, least recently used first."""
+
+        entries: List[IsoCacheEntry] = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.iso'):
+                continue
+            key = name[:-len('.iso')]
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            source = None
+            try:
+                with open(os.path.join(self.directory, key + '.json'), 'r', encoding='utf-8') as f:
+                    source = json.load(f).get('source')
+            except (OSError, ValueError):
+                pass
+            entries.append(IsoCacheEntry(key=key, path=path, size=stat.st_size,
+                                         last_used=stat.st_mtime, source=source))
+        entries.sort(key=lambda entry: entry.last_used)
+        return entries
+
+    def total_bytes(self) -> int:
+        return sum(entry.size for entry in self.entries())
+
+    def remove(self, key: str) -> None:
+        """Drop one image from the cache."""
+
+        for suffix in ('.iso', '.json'):
+            try:
+                os.remove(os.path.join(self.directory, key + suffix))
+            except FileNotFoundError:
+                pass
+
+    def prune(self, max_bytes: Optional[int] = None, keep: Optional[str] = None) -> List[IsoCacheEntry]:
+        """Evict least recently used images until the cache fits in ``max_bytes``.
+
+        Defaults to the cache's ``max_bytes``. ``keep`` names a key that is
+        never evicted (the image just built). Returns the evicted entries.
+        """
+
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            entries = self.entries()
+            total = sum(entry.size for entry in entries)
+            evicted: List[IsoCacheEntry] = []
+            for entry in entries:
+                if total <= limit:
+                    break
+                if entry.key == keep:
+                    continue
+                self.remove(entry.key)
+                total -= entry.size
+                evicted.append(entry)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every cached image."""
+
+        self.prune(max_bytes=0)
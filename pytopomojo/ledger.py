@@ -0,0 +1,123 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from .archives import read_archive_metadata
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    sha256 TEXT PRIMARY KEY,
+    workspace_ids TEXT NOT NULL,
+    path TEXT,
+    uploaded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+"""
+
+
+def sha256_file(path: str, block_size: int = 1024 * 1024) -> str:
+    """Stream ``path`` through SHA-256 without loading it into memory."""
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def workspace_ids_in_archive(path: str) -> List[str]:
+    """Return the IDs of the workspaces contained in an export package."""
+
+    return list(dict.fromkeys(workspace['id'] for workspace in read_archive_metadata(path)))
+
+
+class UploadLedger:
+    """Local record of uploaded archives keyed by content hash.
+
+    :meth:`Topomojo.upload_workspaces_parallel` consults the ledger to skip
+    archives whose exact bytes were already imported, whatever their file
+    name, and records every successful upload. File hashes are cached by
+    path, size and mtime, so unchanged files are not re-read on later runs.
+
+    Parameters
+    ----------
+    path: str
+        SQLite database file; ``":memory:"`` keeps the ledger in memory.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "UploadLedger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def hash_file(self, path: str) -> str:
+        """Return the SHA-256 of ``path``, reusing the cached value if the file is unchanged."""
+
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        with self._lock:
+            row = self._db.execute("SELECT size, mtime_ns, sha256 FROM file_hashes WHERE path = ?",
+                                   (key,)).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+
+        sha256 = sha256_file(path)
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                             (key, stat.st_size, stat.st_mtime_ns, sha256))
+        return sha256
+
+    def hash_files(self, paths: Iterable[str], max_workers: int = 4) -> Dict[str, str]:
+        """Hash many files concurrently; returns ``{path: sha256}``.
+
+        ``hashlib`` releases the GIL while digesting large blocks, so threads
+        overlap both the disk reads and the hashing.
+        """
+
+        paths = list(dict.fromkeys(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(self.hash_file, paths)))
+
+    def lookup(self, sha256: str) -> Optional[List[str]]:
+        """Return the workspace IDs recorded for an archive hash, or ``None``."""
+
+        with self._lock:
+            row = self._db.execute("SELECT workspace_ids FROM uploads WHERE sha256 = ?", (sha256,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def record(self, sha256: str, workspace_ids: List[str], path: Optional[str] = None) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO uploads (sha256, workspace_ids, path, uploaded_at) VALUES (?, ?, ?, ?)",
+                (sha256, json.dumps(list(workspace_ids)), path, time.time()))
+
+    def forget(self, sha256: str) -> None:
+        """Remove an archive from the ledger so it is uploaded again."""
+
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM uploads WHERE sha256 = ?", (sha256,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM uploads").fetchone()[0]
@@ -0,0 +1,62 @@
+import logging
+import reprlib
+from typing import Any
+
+
+# Marks the console handler added for ``debug=True`` so it is added once per logger.
+_HANDLER_MARKER = '_pytopomojo_console'
+
+_repr = reprlib.Repr()
+_repr.maxlevel = 3
+_repr.maxdict = 10
+_repr.maxlist = 10
+_repr.maxtuple = 10
+_repr.maxset = 10
+_repr.maxstring = 120
+_repr.maxother = 120
+
+
+class ClientLogger(logging.LoggerAdapter):
+    """Per-client view of a shared module logger.
+
+    Messages from a client created with ``debug=False`` are dropped before
+    they are formatted, without touching the shared logger, so other
+    clients keep logging.
+    """
+
+    def __init__(self, logger: logging.Logger, enabled: bool) -> None:
+        super().__init__(logger, {})
+        self.enabled = enabled
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self.enabled and self.logger.isEnabledFor(level)
+
+
+def client_logger(name: str, debug: bool) -> ClientLogger:
+    """Return the logger for a client, adding the debug console handler at most once."""
+
+    logger = logging.getLogger(name)
+    if debug:
+        logger.setLevel(logging.DEBUG)
+        if not any(getattr(handler, _HANDLER_MARKER, False) for handler in logger.handlers):
+            handler = logging.StreamHandler()
+            handler.setLevel(logging.DEBUG)
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            setattr(handler, _HANDLER_MARKER, True)
+            logger.addHandler(handler)
+    return ClientLogger(logger, debug)
+
+
+class Abbreviated:
+    """Log argument rendering a possibly large payload as a bounded ``repr``.
+
+    The ``repr`` is only built if the record is actually emitted.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        return _repr.repr(self.value)
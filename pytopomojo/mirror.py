@@ -0,0 +1,201 @@
+import json
+import time
+import sqlite3
+import hashlib
+import inspect
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from .pytopomojo import Topomojo
+
+
+# Catalog kinds and the paging iterator used to list them.
+KINDS: Dict[str, str] = {
+    'workspaces': 'iter_workspaces',
+    'templates': 'iter_templates',
+    'gamespaces': 'iter_gamespaces',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (kind, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS syncs (
+    kind TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def fingerprint(item: Dict[str, Any]) -> str:
+    """Return a stable hash of an API object used to detect changes between syncs."""
+
+    encoded = json.dumps(item, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _query_parameters(client: "Topomojo", kind: str) -> List[str]:
+    """Names of the query parameters the ``get_*`` method behind ``kind`` takes."""
+
+    method = getattr(client, 'get_' + kind)
+    return [name for name in inspect.signature(method).parameters if name not in ('Skip', 'Take')]
+
+
+@dataclass
+class ChangeEvent:
+    """One difference between the server catalog and the local mirror.
+
+    ``action`` is ``"added"``, ``"updated"`` or ``"removed"``. ``item`` is the
+    current object (``None`` when removed) and ``previous`` the mirrored one
+    (``None`` when added).
+    """
+
+    kind: str
+    action: str
+    id: str
+    item: Optional[Dict[str, Any]] = None
+    previous: Optional[Dict[str, Any]] = None
+
+
+class CatalogMirror:
+    """Local SQLite snapshot of the workspace, template and gamespace catalogs.
+
+    :meth:`sync` pages through a catalog, compares every object with the
+    mirrored copy by a content fingerprint and records only the differences,
+    returning them as :class:`ChangeEvent` objects. Fingerprints are kept in
+    memory between syncs, so an unchanged catalog costs the list requests
+    and no database writes. Downstream tools can read the mirror with
+    :meth:`get` and :meth:`items` without calling the API.
+
+    Parameters
+    ----------
+    path: str
+        SQLite database file; ``":memory:"`` keeps the mirror in memory.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._fingerprints: Dict[str, Dict[str, str]] = {}
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "CatalogMirror":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _known(self, kind: str) -> Dict[str, str]:
+        if kind not in self._fingerprints:
+            with self._lock:
+                self._fingerprints[kind] = dict(
+                    self._db.execute("SELECT id, fingerprint FROM items WHERE kind = ?", (kind,)))
+        return self._fingerprints[kind]
+
+    def _load(self, kind: str, item_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT data FROM items WHERE kind = ? AND id = ?", (kind, item_id)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def sync(self, client: "Topomojo", kinds: Iterable[str] = ('workspaces', 'templates'),
+             page_size: int = 100, on_change: Optional[Callable[[ChangeEvent], None]] = None,
+             params: Optional[Dict[str, Dict[str, Any]]] = None, **shared) -> List[ChangeEvent]:
+        """Update the mirror from the server and return what changed.
+
+        Each kind in ``kinds`` (see :data:`KINDS`) is listed in full with its
+        ``iter_*`` method. ``params`` maps a kind to the query parameters for
+        its listing, e.g. ``{'gamespaces': {'WantsAll': True}}``. Extra
+        keyword arguments are passed to every kind whose ``get_*`` method
+        accepts them. Changes for a kind are committed together once its
+        listing completes, so a failed sync leaves the previous snapshot
+        intact. ``on_change`` is called for every event after the commit.
+        """
+
+        kinds = list(kinds)
+        for kind in kinds:
+            if kind not in KINDS:
+                raise ValueError(f"unknown catalog kind {kind!r}; expected one of {sorted(KINDS)}")
+        accepted = {kind: _query_parameters(client, kind) for kind in kinds}
+        unused = set(shared) - set().union(*accepted.values())
+        if unused:
+            raise TypeError(f"no catalog kind in {kinds} accepts {sorted(unused)}")
+
+        events: List[ChangeEvent] = []
+        for kind in kinds:
+            kind_params = {name: value for name, value in shared.items() if name in accepted[kind]}
+            kind_params.update((params or {}).get(kind, {}))
+            events.extend(self._sync_kind(client, kind, page_size, kind_params, on_change))
+        return events
+
+    def _sync_kind(self, client: "Topomojo", kind: str, page_size: int, params: Dict[str, Any],
+                   on_change: Optional[Callable[[ChangeEvent], None]]) -> List[ChangeEvent]:
+        known = self._known(kind)
+        seen: Dict[str, str] = {}
+        events: List[ChangeEvent] = []
+        writes = []
+
+        for item in getattr(client, KINDS[kind])(page_size=page_size, **params):
+            item_id = item.get('id')
+            if not item_id:
+                continue
+            digest = fingerprint(item)
+            seen[item_id] = digest
+            if known.get(item_id) == digest:
+                continue
+            action = 'updated' if item_id in known else 'added'
+            previous = self._load(kind, item_id) if action == 'updated' else None
+            events.append(ChangeEvent(kind, action, item_id, item, previous))
+            writes.append((kind, item_id, digest, json.dumps(item)))
+
+        removed = [item_id for item_id in known if item_id not in seen]
+        for item_id in removed:
+            events.append(ChangeEvent(kind, 'removed', item_id, None, self._load(kind, item_id)))
+
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO items (kind, id, fingerprint, data, synced_at) VALUES (?, ?, ?, ?, ?)",
+                [write + (now,) for write in writes])
+            self._db.executemany("DELETE FROM items WHERE kind = ? AND id = ?",
+                                 [(kind, item_id) for item_id in removed])
+            self._db.execute("INSERT OR REPLACE INTO syncs (kind, synced_at) VALUES (?, ?)", (kind, now))
+        self._fingerprints[kind] = seen
+
+        if on_change is not None:
+            for event in events:
+                on_change(event)
+        return events
+
+    def last_sync(self, kind: str) -> Optional[float]:
+        """Unix time of the last completed sync of ``kind``, or ``None``."""
+
+        with self._lock:
+            row = self._db.execute("SELECT synced_at FROM syncs WHERE kind = ?", (kind,)).fetchone()
+        return row[0] if row else None
+
+    def get(self, kind: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """Return the mirrored object, or ``None`` if it is not in the mirror."""
+
+        return self._load(kind, item_id)
+
+    def items(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over every mirrored object of ``kind``."""
+
+        with self._lock:
+            rows = self._db.execute("SELECT data FROM items WHERE kind = ? ORDER BY id", (kind,)).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def count(self, kind: str) -> int:
+        return len(self._known(kind))
@@ -0,0 +1,152 @@
+import os
+import uuid
+from typing import BinaryIO, Callable, List, Optional, Tuple, Union
+
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _quote(value: str) -> str:
+    """Escape a Content-Disposition parameter the way browsers (and urllib3) do."""
+
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class MultipartEncoder:
+    """A ``multipart/form-data`` request body that is read, not built.
+
+    Text fields are held in memory; file fields are read from disk in
+    ``chunk_size`` pieces only as the HTTP layer consumes the body, so memory
+    use does not grow with file size. The total length is known up front,
+    which lets ``requests`` send a ``Content-Length`` instead of chunked
+    encoding.
+
+    Pass an instance as ``data=`` with ``headers={'Content-Type':
+    encoder.content_type}``.
+    """
+
+    def __init__(self, boundary: Optional[str] = None, chunk_size: int = 64 * 1024,
+                 progress: Optional[ProgressCallback] = None) -> None:
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._segments: List[Union[bytes, Tuple[Callable[[], BinaryIO], int]]] = []
+        self._closed = False
+        self._len = len(self._closing())
+        self._sent = 0
+        self._index = 0
+        self._buffer = b''
+        self._pos = 0
+        self._file: Optional[BinaryIO] = None
+        self._file_remaining = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _closing(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode()
+
+    def _add(self, headers: str, body: Union[bytes, Tuple[Callable[[], BinaryIO], int]], body_len: int) -> None:
+        if self._sent or self._index:
+            raise RuntimeError("cannot add fields after reading has started")
+        header_bytes = f"--{self.boundary}\r\n{headers}\r\n\r\n".encode()
+        self._segments.extend([header_bytes, body, b"\r\n"])
+        self._len += len(header_bytes) + body_len + 2
+
+    def add_field(self, name: str, value: Union[str, bytes], content_type: Optional[str] = None) -> None:
+        """Add a plain form field held in memory."""
+
+        data = value.encode() if isinstance(value, str) else value
+        headers = f'Content-Disposition: form-data; name="{_quote(name)}"'
+        if content_type:
+            headers += f"\r\nContent-Type: {content_type}"
+        self._add(headers, data, len(data))
+
+    def add_file(self, name: str, path: str, filename: Optional[str] = None,
+                 content_type: Optional[str] = None) -> None:
+        """Add a file field streamed from ``path`` at read time."""
+
+        filename = filename if filename is not None else os.path.basename(path)
+        self.add_stream(name, lambda: open(path, 'rb'), os.path.getsize(path), filename, content_type)
+
+    def add_stream(self, name: str, opener: Callable[[], BinaryIO], size: int, filename: str,
+                   content_type: Optional[str] = None) -> None:
+        """Add a file field whose ``size`` bytes are read from ``opener()``.
+
+        ``opener`` is called when the field is reached, so the source (a file,
+        a pipe, ...) is only opened while it is being sent.
+        """
+
+        headers = f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(filename)}"'
+        if content_type:
+            headers += f"\r\nContent-Type: {content_type}"
+        self._add(headers, (opener, size), size)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def len(self) -> int:
+        return self._len
+
+    def _next_chunk(self) -> bytes:
+        """Return the next piece of the body, or ``b''`` once exhausted."""
+
+        while True:
+            if self._file is not None:
+                data = self._file.read(min(self.chunk_size, self._file_remaining))
+                self._file_remaining -= len(data)
+                if not data or self._file_remaining <= 0:
+                    self._file.close()
+                    self._file = None
+                    if self._file_remaining > 0:
+                        raise IOError("stream ended before its declared size was sent")
+                if data:
+                    return data
+                continue
+
+            if self._index < len(self._segments):
+                segment = self._segments[self._index]
+                self._index += 1
+                if isinstance(segment, bytes):
+                    if segment:
+                        return segment
+                    continue
+                opener, size = segment
+                self._file = opener()
+                self._file_remaining = size
+                continue
+
+            if not self._closed:
+                self._closed = True
+                return self._closing()
+            return b''
+
+    def read(self, size: int = -1) -> bytes:
+        pieces: List[bytes] = []
+        remaining = size if size is not None and size >= 0 else None
+        while remaining is None or remaining > 0:
+            if self._pos >= len(self._buffer):
+                self._buffer = self._next_chunk()
+                self._pos = 0
+                if not self._buffer:
+                    break
+            end = len(self._buffer) if remaining is None else self._pos + remaining
+            piece = self._buffer[self._pos:end]
+            self._pos += len(piece)
+            if remaining is not None:
+                remaining -= len(piece)
+            pieces.append(piece)
+
+        data = b''.join(pieces)
+        if data:
+            self._sent += len(data)
+            if self.progress is not None:
+                self.progress(self._sent, self._len)
+        return data
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,222 @@
+import time
+import random
+import asyncio
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from .bulk import BulkReport, ItemResult
+
+
+# Marks "no previous value" so the first check never counts as a change.
+_UNSET = object()
+
+
+class PollTimeoutError(TimeoutError):
+    """Raised when a polled task does not finish before its deadline."""
+
+    def __init__(self, message: str, last_value: Any = None) -> None:
+        self.last_value = last_value
+        super().__init__(message)
+
+
+class PollCancelledError(Exception):
+    """Raised when polling is stopped through its ``cancel`` event."""
+
+
+@dataclass
+class PollPolicy:
+    """How often to poll a long-running TopoMojo task and for how long.
+
+    The first check is immediate and the first wait lasts ``initial``
+    seconds. Each later check that sees the same value as the previous one
+    multiplies the delay by
+    ``multiplier`` (up to ``maximum``); a check that sees a change keeps
+    the current delay, so tasks that are visibly progressing are followed
+    closely and stalled ones are polled less and less. Every delay is
+    reduced by a random fraction of up to ``jitter`` so many pollers do not
+    synchronize. ``timeout`` is the overall deadline in seconds (``None``
+    waits forever).
+    """
+
+    initial: float = 0.5
+    maximum: float = 5.0
+    multiplier: float = 1.5
+    jitter: float = 0.1
+    timeout: Optional[float] = None
+
+    def next_delay(self, delay: float, changed: bool) -> float:
+        """Return the base delay to use after a check."""
+
+        return delay if changed else min(self.maximum, delay * self.multiplier)
+
+    def jittered(self, delay: float) -> float:
+        return delay * (1 - self.jitter * random.random())
+
+
+def poll_until(check: Callable[[], Any], done: Callable[[Any], bool], policy: Optional[PollPolicy] = None,
+               cancel: Optional[threading.Event] = None,
+               on_tick: Optional[Callable[[Any], None]] = None) -> Any:
+    """Call ``check`` until ``done(value)`` is true and return that value.
+
+    ``on_tick`` receives every value checked. Setting ``cancel`` stops the
+    loop with :class:`PollCancelledError`; passing the policy's deadline
+    raises :class:`PollTimeoutError`.
+    """
+
+    policy = policy or PollPolicy()
+    deadline = time.monotonic() + policy.timeout if policy.timeout is not None else None
+    delay = policy.initial
+    previous: Any = _UNSET
+
+    while True:
+        value = check()
+        if on_tick is not None:
+            on_tick(value)
+        if done(value):
+            return value
+
+        if previous is not _UNSET:
+            delay = policy.next_delay(delay, changed=value != previous)
+        previous = value
+        sleep_for = policy.jittered(delay)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise PollTimeoutError(f"task did not finish within {policy.timeout}s", value)
+            sleep_for = min(sleep_for, remaining)
+        if cancel is not None:
+            if cancel.wait(sleep_for):
+                raise PollCancelledError("polling cancelled")
+        else:
+            time.sleep(sleep_for)
+
+
+async def apoll_until(check: Callable[[], Awaitable[Any]], done: Callable[[Any], bool],
+                      policy: Optional[PollPolicy] = None, cancel: Optional[asyncio.Event] = None,
+                      on_tick: Optional[Callable[[Any], None]] = None) -> Any:
+    """Asyncio counterpart of :func:`poll_until` for coroutine ``check`` functions."""
+
+    policy = policy or PollPolicy()
+    deadline = time.monotonic() + policy.timeout if policy.timeout is not None else None
+    delay = policy.initial
+    previous: Any = _UNSET
+
+    while True:
+        value = await check()
+        if on_tick is not None:
+            on_tick(value)
+        if done(value):
+            return value
+
+        if previous is not _UNSET:
+            delay = policy.next_delay(delay, changed=value != previous)
+        previous = value
+        sleep_for = policy.jittered(delay)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise PollTimeoutError(f"task did not finish within {policy.timeout}s", value)
+            sleep_for = min(sleep_for, remaining)
+        if cancel is not None:
+            try:
+                await asyncio.wait_for(cancel.wait(), sleep_for)
+            except asyncio.TimeoutError:
+                continue
+            raise PollCancelledError("polling cancelled")
+        await asyncio.sleep(sleep_for)
+
+
+def poll_many(checks: Dict[Hashable, Callable[[], Any]], done: Callable[[Any], bool],
+              policy: Optional[PollPolicy] = None, cancel: Optional[threading.Event] = None,
+              on_tick: Optional[Callable[[Hashable, Any], None]] = None,
+              max_workers: int = 1) -> BulkReport:
+    """Poll many tasks from a single loop until each is done or the deadline passes.
+
+    Each task keeps its own adaptive delay (see :class:`PollPolicy`); the
+    loop sleeps until the earliest task is due, so hundreds of outstanding
+    tasks need neither one thread each nor one request per second each.
+    Checks that fall due together run on up to ``max_workers`` threads.
+    A task whose check raises is finished with that error.
+
+    Returns a :class:`BulkReport` keyed by ``str(key)`` whose ``value`` is the
+    final checked value and ``attempts`` the number of checks. Tasks still
+    running at the deadline fail with :class:`PollTimeoutError`; if ``cancel``
+    is set they fail with :class:`PollCancelledError`.
+    """
+
+    policy = policy or PollPolicy()
+    started = time.monotonic()
+    deadline = started + policy.timeout if policy.timeout is not None else None
+
+    report = BulkReport()
+    pending: Dict[Hashable, Dict[str, Any]] = {}
+    for key in checks:
+        report.results[str(key)] = ItemResult(key=str(key), ok=False, attempts=0)
+        pending[key] = {'due': started, 'delay': policy.initial, 'previous': _UNSET}
+
+    def run_check(key: Hashable) -> Tuple[Any, Optional[Exception]]:
+        try:
+            return checks[key](), None
+        except Exception as exc:
+            return None, exc
+
+    def fail_pending(error: Callable[[ItemResult], BaseException]) -> None:
+        for key in pending:
+            result = report.results[str(key)]
+            result.error = error(result)
+            result.elapsed = time.monotonic() - started
+
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        while pending:
+            now = time.monotonic()
+            due = [key for key, state in pending.items() if state['due'] <= now]
+            outcomes = executor.map(run_check, due) if executor is not None else map(run_check, due)
+            for key, (value, error) in zip(due, outcomes):
+                state = pending[key]
+                result = report.results[str(key)]
+                result.attempts += 1
+                if error is not None:
+                    result.error = error
+                    result.elapsed = time.monotonic() - started
+                    del pending[key]
+                    continue
+                result.value = value
+                if on_tick is not None:
+                    on_tick(key, value)
+                if done(value):
+                    result.ok = True
+                    result.elapsed = time.monotonic() - started
+                    del pending[key]
+                    continue
+                if state['previous'] is not _UNSET:
+                    state['delay'] = policy.next_delay(state['delay'], changed=value != state['previous'])
+                state['previous'] = value
+                state['due'] = time.monotonic() + policy.jittered(state['delay'])
+
+            if not pending:
+                break
+
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                fail_pending(lambda result: PollTimeoutError(
+                    f"task did not finish within {policy.timeout}s", result.value))
+                break
+
+            sleep_for = max(0.0, min(state['due'] for state in pending.values()) - now)
+            if deadline is not None:
+                sleep_for = min(sleep_for, deadline - now)
+            if cancel is not None:
+                if cancel.wait(sleep_for):
+                    fail_pending(lambda result: PollCancelledError("polling cancelled"))
+                    break
+            else:
+                time.sleep(sleep_for)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    report.elapsed = time.monotonic() - started
+    return report
@@ -1,14 +1,32 @@
 import os
 import re
+import json
 import uuid
+import random
+import shutil
+import hashlib
+import zipfile
 import tempfile
+import threading
 import requests
-import logging
-import pycdlib
-from io import BytesIO
-from time import sleep
-from typing import List, Dict, Any, Optional
+from time import sleep, monotonic
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
 from urllib.parse import urlencode
+from urllib3.exceptions import NewConnectionError
+
+from .bulk import BulkReport, run_bulk
+from .cache import ResponseCache, cache_key
+from .graph import WorkspaceGraph
+from .instrumentation import Hooks
+from .logs import Abbreviated, client_logger
+from .iso import IsoCache, IsoStream, build_iso
+from .ledger import UploadLedger, workspace_ids_in_archive
+from .multipart import MultipartEncoder, ProgressCallback
+from .polling import PollPolicy, poll_many, poll_until
+from .singleflight import SingleFlight
+from .throttle import Governor, RateLimiter
+from .transport import TransportConfig, build_session
 
 
 class TopomojoException(Exception):
@@ -23,10 +41,49 @@ class TopomojoException(Exception):
             f"Topomojo API Error - Status Code: {status_code}, Response: {response_message}")
 
 
+def verify_archive(path: str, expected_size: Optional[int] = None, sha256: Optional[str] = None,
+                   test_members: bool = False) -> None:
+    """Check that ``path`` is a complete, readable export package.
+
+    Verifies the file size (when ``expected_size`` is given), that the zip
+    central directory parses and every member lies inside the file, and
+    optionally the SHA-256 digest and the CRC of every member.
+
+    Raises: ValueError when a check fails.
+    """
+
+    actual_size = os.path.getsize(path)
+    if expected_size is not None and actual_size != expected_size:
+        raise ValueError(f"{path}: expected {expected_size} bytes, found {actual_size}")
+
+    try:
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.header_offset + info.compress_size > actual_size:
+                    raise ValueError(f"{path}: member {info.filename} extends past end of file")
+            if test_members:
+                bad_member = archive.testzip()
+                if bad_member is not None:
+                    raise ValueError(f"{path}: CRC mismatch in member {bad_member}")
+    except zipfile.BadZipFile as exc:
+        raise ValueError(f"{path}: not a valid zip archive ({exc})") from exc
+
+    if sha256 is not None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        if digest.hexdigest().lower() != sha256.lower():
+            raise ValueError(f"{path}: SHA-256 mismatch (expected {sha256}, got {digest.hexdigest()})")
+
+
 class Topomojo:
     """Client for interacting with a TopoMojo instance."""
 
-    def __init__(self, app_url: Optional[str] = None, api_key: Optional[str] = None, debug: bool = False) -> None:
+    def __init__(self, app_url: Optional[str] = None, api_key: Optional[str] = None, debug: bool = False,
+                 transport: Optional[TransportConfig] = None, cache: Optional[ResponseCache] = None,
+                 coalesce: bool = True, governor: Optional[Governor] = None,
+                 hooks: Optional[Hooks] = None) -> None:
         """Create a new :class:`Topomojo` client.
 
         Parameters
@@ -39,6 +96,22 @@ class Topomojo:
             Falls back to the ``TOPOMOJO_API_KEY`` environment variable if not provided.
         debug: bool, optional
             When ``True`` debug logging is enabled.
+        transport: TransportConfig, optional
+            Connection pool sizing, timeouts and retry policy applied to every
+            request. Defaults to ``TransportConfig()``.
+        cache: ResponseCache, optional
+            Cache for read-only GET endpoints. Disabled when not provided.
+        coalesce: bool, optional
+            When ``True`` (default), identical GET requests made concurrently
+            from several threads share a single HTTP request. The number of
+            requests saved is reported by ``singleflight.stats()``.
+        governor: Governor, optional
+            Rate limit and per-class concurrency caps applied to every HTTP
+            request, slowing down automatically on 429/503 responses.
+        hooks: Hooks, optional
+            Instrumentation callbacks for requests, retries, poll ticks and
+            transfer progress. A fresh :class:`Hooks` is created when not
+            provided and is available as ``self.hooks``.
         """
 
         resolved_url = app_url if app_url is not None else os.environ.get("TOPOMOJO_URL")
@@ -49,32 +122,33 @@ class Topomojo:
             raise ValueError("api_key is required or set TOPOMOJO_API_KEY environment variable")
         self.app_url = resolved_url
         self.api_key = resolved_key
-        self.session = requests.Session()
-        self.session.headers.update(
-            {'accept': 'application/json', 'x-api-key': self.api_key})
+        self.transport = transport if transport is not None else TransportConfig()
+        self.governor = governor
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.session = build_session(
+            self.transport, {'accept': 'application/json', 'x-api-key': self.api_key}, governor, self.hooks)
+        self.cache = cache
+        self.singleflight = SingleFlight() if coalesce else None
+        # Called with the tags of every mutation, e.g. by DiskIndex.attach.
+        self.invalidation_listeners: List[Callable[[Tuple[str, ...]], None]] = []
 
         # Setup logger
-        self.logger = logging.getLogger(__name__)
+        self.logger = client_logger(__name__, debug)
+        self.logger.debug("Topomojo class initialized with logging enabled")
 
-        if debug:
-            self.logger.setLevel(logging.DEBUG)
-            # Create console handler and set level to the provided log level
-            ch = logging.StreamHandler()
-            ch.setLevel(logging.DEBUG)
+    def _transfer_progress(self, direction: str, key: str,
+                           progress: Optional[ProgressCallback]) -> Optional[ProgressCallback]:
+        """Wrap ``progress`` so ``transfer_progress`` hooks see the same updates."""
 
-            # Create formatter
-            formatter = logging.Formatter(
-                '%(asctime)s - %(levelname)s - %(message)s')
+        if not self.hooks.has('transfer_progress'):
+            return progress
 
-            # Add formatter to ch
-            ch.setFormatter(formatter)
+        def report(transferred: int, total: Optional[int]) -> None:
+            self.hooks.emit('transfer_progress', direction, key, transferred, total)
+            if progress is not None:
+                progress(transferred, total)
 
-            # Add ch to logger
-            self.logger.addHandler(ch)
-            self.logger.debug(
-                "Topomojo class initialized with logging enabled")
-        else:
-            self.logger.disabled = True
+        return report
 
     def _json_or_none(self, response: requests.Response) -> Optional[Any]:
         """Return JSON payload or None when the response body is empty."""
@@ -87,6 +161,103 @@ class Topomojo:
             raise TopomojoException(
                 response.status_code, response.text) from exc
 
+    def _get_json(self, full_url: str, params: Optional[Dict[str, Any]] = None,
+                  endpoint: Optional[str] = None, tags: Tuple[str, ...] = ()) -> Optional[Any]:
+        """GET ``full_url`` and return its JSON payload.
+
+        When the client has a :class:`ResponseCache` and ``endpoint`` names a
+        cacheable endpoint, fresh entries are served without a request and
+        stale ones are revalidated with ``If-None-Match`` if they have an ETag.
+        Identical GETs issued concurrently from several threads share one
+        request; each caller still gets its own parsed copy of the body.
+
+        Raises: TopoMojoException
+        """
+
+        key = cache_key(full_url, params)
+        cacheable = self.cache is not None and endpoint is not None
+        entry = None
+        if cacheable:
+            entry, fresh = self.cache.get(key)
+            if fresh:
+                self.logger.debug("Cache hit for %s", full_url)
+                return entry.value()
+
+        def fetch() -> Tuple[Optional[Any], bytes]:
+            # Taken before the request so a mutation that invalidates these
+            # tags while it is in flight keeps the response out of the cache.
+            generation = self.cache.generation() if cacheable else None
+            headers = {'If-None-Match': entry.etag} if entry is not None and entry.etag else None
+            response = self.session.get(full_url, params=params, headers=headers)
+            if response.status_code == 304 and entry is not None:
+                self.logger.debug("Cache revalidated for %s", full_url)
+                self.cache.refresh(key, endpoint)
+                return entry.value(), entry.content
+            if response.status_code == 200:
+                value = self._json_or_none(response)
+                if cacheable:
+                    self.cache.put(key, endpoint, response.content, response.headers.get('ETag'), tags,
+                                   since=generation)
+                return value, response.content
+            raise TopomojoException(response.status_code, response.text)
+
+        if self.singleflight is None:
+            return fetch()[0]
+        (value, content), shared = self.singleflight.do(("GET",) + key, fetch)
+        if shared:
+            self.logger.debug("Coalesced GET %s with an in-flight request", full_url)
+            return json.loads(content) if content else None
+        return value
+
+    def _invalidate(self, *tags: str) -> None:
+        """Drop cached responses affected by a mutation and notify listeners."""
+
+        if self.cache is not None:
+            removed = self.cache.invalidate(*tags)
+            self.logger.debug("Invalidated %s cached responses for %s", removed, tags)
+        for listener in self.invalidation_listeners:
+            listener(tags)
+
+    def _iter_pages(self, fetch: Callable[..., Optional[List[Any]]], page_size: int,
+                    prefetch: bool, params: Dict[str, Any]) -> Iterator[Any]:
+        """Yield items from a ``Skip``/``Take`` list endpoint one page at a time.
+
+        Pages are requested lazily. With ``prefetch`` the next page is fetched
+        on a background thread while the caller consumes the current one.
+        Iteration stops at the first empty page. A short page does not end it,
+        because the server may cap ``Take`` below ``page_size``. Each page
+        starts where the previous one ended.
+        """
+
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if 'Skip' in params or 'Take' in params:
+            raise ValueError("Skip and Take are managed by the iterator; use page_size instead")
+
+        def load(skip: int) -> List[Any]:
+            self.logger.debug("Fetching page Skip=%s Take=%s", skip, page_size)
+            return fetch(Skip=skip, Take=page_size, **params) or []
+
+        if not prefetch:
+            skip = 0
+            while True:
+                page = load(skip)
+                if not page:
+                    return
+                yield from page
+                skip += len(page)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            skip = 0
+            pending = executor.submit(load, skip)
+            while True:
+                page = pending.result()
+                if not page:
+                    return
+                skip += len(page)
+                pending = executor.submit(load, skip)
+                yield from page
+
     ################################## TEMPLATE FUNCTIONS#####################################################################################
     def get_templates(self, WantsAudience=None, WantsPublished=None, WantsParents=None,
                       aud=None, pid=None, sib=None, Term=None,
@@ -117,17 +288,19 @@ class Topomojo:
             'Filter': Filter,
         }
 
-        self.logger.debug(f"Getting templates with query params: {params}")
+        self.logger.debug("Getting templates with query params: %s", params)
         # Make a GET request to the API endpoint with the provided parameters
-        response = self.session.get(full_url, params=params)
+        return self._get_json(full_url, params=params, endpoint='templates')
 
-        # Check if the request was successful (status code 200)
-        if response.status_code == 200:
-            # Return the JSON response
-            return self._json_or_none(response)
-        else:
-            # If the request was not successful, raise a custom exception
-            raise TopomojoException(response.status_code, response.text)
+    def iter_templates(self, page_size: int = 100, prefetch: bool = False, **params) -> Iterator[Dict[str, Any]]:
+        """Iterate over templates, fetching ``page_size`` results per request.
+
+        Keyword arguments are the :meth:`get_templates` query parameters
+        (except ``Skip``/``Take``). When ``prefetch`` is True the next page is
+        requested in the background while the current page is consumed.
+        """
+
+        return self._iter_pages(self.get_templates, page_size, prefetch, params)
 
     def update_template(self, changed_template: Dict[str, Any]) -> Optional[Any]:
         """Update an existing template with new data that is passed directly to the TopoMojo API.
@@ -141,11 +314,34 @@ class Topomojo:
         full_url = f"{self.app_url}/api/template"
 
         # Make a PUT request to the API endpoint with the provided changed_template_json
-        self.logger.debug(f"Updating template with content {changed_template}")
+        self.logger.debug("Updating template with content %s", Abbreviated(changed_template))
         response = self.session.put(full_url, json=changed_template)
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            self._invalidate(f"template:{changed_template.get('id')}", "templates", "workspace")
+            return self._json_or_none(response)
+        else:
+            # If the request was not successful, raise a custom exception
+            raise TopomojoException(response.status_code, response.text)
+
+    def update_template_detail(self, changed_detail: Dict[str, Any]) -> Optional[Any]:
+        """Update a template's detail (VM configuration, disks) with data passed directly to the TopoMojo API.
+
+        Returns JSON from TopoMojo API if 200 OK was returned. Otherwise, raise a TopoMojo Exception.
+
+        Raises: TopoMojoException
+        """
+
+        # Construct the full URL
+        full_url = f"{self.app_url}/api/template-detail"
+
+        self.logger.debug("Updating template detail with content %s", Abbreviated(changed_detail))
+        response = self.session.put(full_url, json=changed_detail)
+
+        # Check if the request was successful (status code 200)
+        if response.status_code == 200:
+            self._invalidate(f"template:{changed_detail.get('id')}")
             return self._json_or_none(response)
         else:
             # If the request was not successful, raise a custom exception
@@ -162,13 +358,15 @@ class Topomojo:
         # Construct the full URL
         full_url = self.app_url + '/api/template'
 
-        self.logger.debug(f"Adding template with data {template_link_data}")
+        self.logger.debug("Adding template with data %s", Abbreviated(template_link_data))
 
         # Make a POST request to the API endpoint with the provided template_link_data
         response = self.session.post(full_url, json=template_link_data)
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            self._invalidate(f"template:{template_link_data.get('templateId')}", "templates",
+                             f"workspace:{template_link_data.get('workspaceId')}")
             # Return the JSON response
             return self._json_or_none(response)
         else:
@@ -186,12 +384,14 @@ class Topomojo:
         # Construct the full URL
         full_url = self.app_url + '/api/template/unlink'
 
-        self.logger.debug(f"Unlinking Template {template_link_data}")
+        self.logger.debug("Unlinking Template %s", Abbreviated(template_link_data))
         # Make a POST request to the API endpoint with the provided template_link_data
         response = self.session.post(full_url, json=template_link_data)
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            self._invalidate(f"template:{template_link_data.get('templateId')}", "templates",
+                             f"workspace:{template_link_data.get('workspaceId')}")
             # Return the JSON response
             return self._json_or_none(response)
         else:
@@ -209,47 +409,52 @@ class Topomojo:
         # Construct the full URL
         full_url = f"{self.app_url}/api/vm-template/{template_id}"
 
-        self.logger.debug(f"Getting template {template_id}")
+        self.logger.debug("Getting template %s", template_id)
 
         # Make a GET request to the API endpoint
-        response = self.session.get(full_url)
+        return self._get_json(full_url, endpoint='template', tags=(f"template:{template_id}",))
 
-        # Check if the request was successful (status code 200)
-        if response.status_code == 200:
-            # Return the JSON response
-            return self._json_or_none(response)
-        else:
-            # If the request was not successful, raise a custom exception
-            raise TopomojoException(response.status_code, response.text)
-
-    def get_template_detail(self, template_id) -> Optional[Any]:
+    def get_template_detail(self, template_id, use_cache: bool = True) -> Optional[Any]:
         """Get full template details by ID.
 
+        ``use_cache=False`` always asks the server, even when the client has a
+        response cache.
+
         Returns JSON from TopoMojo API if 200 OK was returned. Otherwise, raise a TopoMojo Exception.
 
         Raises: TopoMojoException
         """
 
-        self.logger.debug(
-            f"Loading template detail for template ID: {template_id}")
+        self.logger.debug("Loading template detail for template ID: %s", template_id)
         # Construct the full URL
         full_url = f"{self.app_url}/api/template-detail/{template_id}"
 
         # Make a GET request to the API endpoint
-        response = self.session.get(full_url)
-
-        # Check if the request was successful (status code 200)
-        if response.status_code == 200:
-            # Return the JSON response
-            return self._json_or_none(response)
-        else:
-            # If the request was not successful, raise a custom exception
-            raise TopomojoException(response.status_code, response.text)
+        return self._get_json(full_url, endpoint='template_detail' if use_cache else None,
+                              tags=(f"template:{template_id}",))
 
-    def initialize_template(self, template_id, wait: bool = True) -> Optional[Any]:
+    def initialize_template(self, template_id, wait: bool = True, poll: Optional[PollPolicy] = None,
+                            cancel: Optional[threading.Event] = None,
+                            on_progress: Optional[Callable[[int], None]] = None) -> Optional[Any]:
         """Initialize a template after it has been unlinked.
         Optionally wait for completion.
 
+        Parameters
+        ----------
+        template_id: str
+            ID of the template to initialize.
+        wait: bool, optional
+            When True (default), poll the template until its initialization
+            task has finished.
+        poll: PollPolicy, optional
+            Backoff and overall deadline for the wait. A task that outlives
+            the deadline raises :class:`PollTimeoutError`.
+        cancel: threading.Event, optional
+            Set from another thread to abandon the wait with
+            :class:`PollCancelledError`.
+        on_progress: callable, optional
+            Called with the task's progress percentage on every check.
+
         Returns JSON from TopoMojo API if 200 OK was returned. Otherwise, raise a TopoMojo Exception.
 
         Raises: TopoMojoException
@@ -258,33 +463,87 @@ class Topomojo:
         # Construct the full URL
         full_url = f"{self.app_url}/api/vm-template/{template_id}"
 
-        self.logger.debug(f"Initializing template {template_id}")
+        self.logger.debug("Initializing template %s", template_id)
 
         # Make a PUT request to the API endpoint
         response = self.session.put(full_url)
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            self._invalidate(f"template:{template_id}")
             # if wait is true, then wait for the disk to be done initializing before returning
             if wait:
-                while True:
-                    check = self.get_template(template_id)
-                    task = check.get('task') if check is not None else None
-                    if task:
-                        self.logger.debug(f"Initializing {task['progress']}%")
-                        sleep(1)
-                    else:
-                        if task is None:
-                            self.logger.debug("No initialization task found")
-                        else:
-                            self.logger.debug("Done Initializing")
-                        break
+                self.wait_for_template(template_id, poll=poll, cancel=cancel, on_progress=on_progress)
             # Return the JSON response
             return self._json_or_none(response)
         else:
             # If the request was not successful, raise a custom exception
             raise TopomojoException(response.status_code, response.text)
 
+    @staticmethod
+    def _template_task_done(template: Optional[Dict[str, Any]]) -> bool:
+        """True once a template no longer reports a running task."""
+
+        return not (template or {}).get('task')
+
+    @staticmethod
+    def _template_progress(template: Optional[Dict[str, Any]]) -> int:
+        task = (template or {}).get('task')
+        return task.get('progress', 0) if task else 100
+
+    def _poll_template(self, template_id) -> Optional[Any]:
+        """Load a template for task polling, always bypassing the response cache."""
+
+        template = self._get_json(f"{self.app_url}/api/vm-template/{template_id}")
+        self._invalidate(f"template:{template_id}")
+        return template
+
+    def wait_for_template(self, template_id, poll: Optional[PollPolicy] = None,
+                          cancel: Optional[threading.Event] = None,
+                          on_progress: Optional[Callable[[int], None]] = None) -> Optional[Dict[str, Any]]:
+        """Block until a template has no running task and return the template.
+
+        See :meth:`initialize_template` for the parameters.
+
+        Raises: TopoMojoException, PollTimeoutError, PollCancelledError
+        """
+
+        def tick(template: Optional[Dict[str, Any]]) -> None:
+            percent = self._template_progress(template)
+            self.logger.debug("Template %s task at %s%%", template_id, percent)
+            self.hooks.emit('poll_tick', template_id, percent)
+            if on_progress is not None:
+                on_progress(percent)
+
+        return poll_until(lambda: self._poll_template(template_id), self._template_task_done,
+                          policy=poll, cancel=cancel, on_tick=tick)
+
+    def wait_for_templates(self, template_ids: List[str], poll: Optional[PollPolicy] = None,
+                           cancel: Optional[threading.Event] = None,
+                           on_progress: Optional[Callable[[str, int], None]] = None,
+                           max_workers: int = 4) -> BulkReport:
+        """Wait for many templates' tasks from one polling loop.
+
+        Each template is polled on its own adaptive schedule (see
+        :func:`poll_many`); checks that fall due together are sent on up to
+        ``max_workers`` threads. ``on_progress`` is called as
+        ``on_progress(template_id, percent)``. Returns a :class:`BulkReport`
+        keyed by template ID; templates that fail to load or miss the
+        deadline are reported as failures rather than raised.
+        """
+
+        def tick(template_id: str, template: Optional[Dict[str, Any]]) -> None:
+            percent = self._template_progress(template)
+            self.logger.debug("Template %s task at %s%%", template_id, percent)
+            self.hooks.emit('poll_tick', template_id, percent)
+            if on_progress is not None:
+                on_progress(template_id, percent)
+
+        checks = {template_id: (lambda template_id=template_id: self._poll_template(template_id))
+                  for template_id in template_ids}
+        return poll_many(checks, self._template_task_done, policy=poll, cancel=cancel, on_tick=tick,
+                         max_workers=max_workers)
+
     def deploy_vm_from_template(self, template_id) -> Optional[Any]:
         """Deploy a VM from an existing template.
 
@@ -296,19 +555,82 @@ class Topomojo:
         # Construct the full URL
         full_url = f"{self.app_url}/api/vm-template/{template_id}"
 
-        self.logger.debug(f"Deploying VM template {template_id}")
+        self.logger.debug("Deploying VM template %s", template_id)
 
         # Make a POST request to the API endpoint
         response = self.session.post(full_url)
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            self._invalidate(f"template:{template_id}", "templates", "workspace")
             # Return the JSON response
             return self._json_or_none(response)
         else:
             # If the request was not successful, raise a custom exception
             raise TopomojoException(response.status_code, response.text)
 
+    def unlink_templates(self, template_links: List[Dict[str, Any]], concurrency: int = 4) -> BulkReport:
+        """Unlink many templates in parallel.
+
+        ``template_links`` holds :meth:`unlink_template` payloads
+        (``{"workspaceId": ..., "templateId": ...}``). Returns a
+        :class:`BulkReport` keyed by ``templateId`` whose ``value`` is the
+        unlinked template; failures do not stop the batch.
+        """
+
+        self.logger.debug("Unlinking %s templates with concurrency %s", len(template_links), concurrency)
+        return run_bulk(template_links, self.unlink_template, max_workers=concurrency,
+                        key=lambda link: str(link.get('templateId')))
+
+    def initialize_templates(self, template_ids: List[str], concurrency: int = 4, wait: bool = True,
+                             poll: Optional[PollPolicy] = None, cancel: Optional[threading.Event] = None,
+                             on_progress: Optional[Callable[[str, int], None]] = None) -> BulkReport:
+        """Initialize many templates and track them through one polling loop.
+
+        The initialization requests are sent on ``concurrency`` threads. With
+        ``wait`` the templates whose request succeeded are then followed by
+        :meth:`wait_for_templates` until every task has finished, failed or
+        passed the ``poll`` deadline.
+
+        Returns a :class:`BulkReport` keyed by template ID. ``value`` is the
+        final template when waiting, otherwise the initialization response,
+        and ``attempts`` counts the initialization request plus every status
+        check. Failures are recorded per template and do not stop the batch.
+        """
+
+        self.logger.debug("Initializing %s templates with concurrency %s", len(template_ids), concurrency)
+        started = monotonic()
+        report = run_bulk(template_ids, lambda template_id: self.initialize_template(template_id, wait=False),
+                          max_workers=concurrency)
+
+        if wait:
+            started_ids = [result.key for result in report.succeeded]
+            waited = self.wait_for_templates(started_ids, poll=poll, cancel=cancel,
+                                             on_progress=on_progress, max_workers=concurrency)
+            for template_id, outcome in waited.results.items():
+                result = report.results[template_id]
+                result.ok = outcome.ok
+                result.value = outcome.value
+                result.error = outcome.error
+                result.attempts += outcome.attempts
+                result.elapsed += outcome.elapsed
+
+        report.elapsed = monotonic() - started
+        self.logger.debug("Template initialization finished: %s", report.summary())
+        return report
+
+    def deploy_templates(self, template_ids: List[str], concurrency: int = 4) -> BulkReport:
+        """Deploy VMs from many templates in parallel.
+
+        Returns a :class:`BulkReport` keyed by template ID whose ``value`` is
+        the deployed VM; failures do not stop the batch.
+        """
+
+        self.logger.debug("Deploying %s templates with concurrency %s", len(template_ids), concurrency)
+        report = run_bulk(template_ids, self.deploy_vm_from_template, max_workers=concurrency)
+        self.logger.debug("Template deployment finished: %s", report.summary())
+        return report
+
     ################################## WORKSPACE FUNCTIONS#####################################################################################
 
     def get_workspaces(self, aud: Optional[str] = None, scope: Optional[str] = None, doc: Optional[int] = None,
@@ -341,13 +663,77 @@ class Topomojo:
             "Sort": Sort,
             "Filter": Filter
         }
-        self.logger.debug(f"Calling get_workspaces API with params: {params}")
+        self.logger.debug("Calling get_workspaces API with params: %s", params)
 
-        response = self.session.get(full_url, params=params)
-        if response.status_code == 200:
-            return self._json_or_none(response)
-        else:
-            raise TopomojoException(response.status_code, response.text)
+        return self._get_json(full_url, params=params, endpoint='workspaces')
+
+    def iter_workspaces(self, page_size: int = 100, prefetch: bool = False, **params) -> Iterator[Dict[str, Any]]:
+        """Iterate over workspaces, fetching ``page_size`` results per request.
+
+        Keyword arguments are the :meth:`get_workspaces` query parameters
+        (except ``Skip``/``Take``). When ``prefetch`` is True the next page is
+        requested in the background while the current page is consumed.
+        """
+
+        return self._iter_pages(self.get_workspaces, page_size, prefetch, params)
+
+    def get_workspace(self, workspace_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Get a workspace, including its linked templates, by ID.
+
+        ``use_cache=False`` always asks the server, even when the client has a
+        response cache.
+
+        Returns JSON from TopoMojo API if 200 OK was returned. Otherwise, raise a TopoMojo Exception.
+
+        Raises: TopoMojoException
+        """
+
+        self.logger.debug("Getting workspace %s", workspace_id)
+        full_url = f"{self.app_url}/api/workspace/{workspace_id}"
+        return self._get_json(full_url, endpoint='workspace' if use_cache else None,
+                              tags=(f"workspace:{workspace_id}",))
+
+    def load_workspace_graph(self, workspace_ids: List[str], max_workers: int = 8) -> WorkspaceGraph:
+        """Load workspaces, their templates' details and disks into a :class:`WorkspaceGraph`.
+
+        Workspaces are fetched concurrently on ``max_workers`` threads, and
+        each template's detail is requested as soon as the first workspace
+        linking it arrives, so templates shared between workspaces are
+        fetched once. Items that fail to load are recorded in
+        ``graph.errors`` instead of stopping the load.
+        """
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        graph = WorkspaceGraph()
+        requested = set()
+        self.logger.debug("Loading graph for %s workspaces with %s workers", len(workspace_ids), max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self.get_workspace, workspace_id): ('workspace', workspace_id)
+                       for workspace_id in dict.fromkeys(workspace_ids)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, item_id = pending.pop(future)
+                    try:
+                        value = future.result()
+                    except Exception as exc:
+                        self.logger.debug("Failed to load %s %s: %s", kind, item_id, exc)
+                        graph.errors[f"{kind}:{item_id}"] = exc
+                        continue
+                    if kind == 'template':
+                        graph.add_template_detail(item_id, value)
+                        continue
+                    for template_id in graph.add_workspace(item_id, value):
+                        if template_id not in requested:
+                            requested.add(template_id)
+                            pending[executor.submit(self.get_template_detail, template_id)] = ('template', template_id)
+
+        self.logger.debug(
+            "Loaded %s workspaces, %s templates and %s disks (%s errors)",
+            len(graph.workspaces), len(graph.template_details), len(graph.disk_templates), len(graph.errors))
+        return graph
 
     def create_workspace(self, new_workspace_data: Dict[str, Any]) -> Optional[Any]:
         """Create a new workspace.
@@ -360,13 +746,14 @@ class Topomojo:
         # Construct the full URL
         full_url = self.app_url + '/api/workspace'
 
-        self.logger.debug(f"Creating workspace {new_workspace_data}")
+        self.logger.debug("Creating workspace %s", Abbreviated(new_workspace_data))
 
         # Make a POST request to the API endpoint with the provided new_workspace_data
         response = self.session.post(full_url, json=new_workspace_data)
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            self._invalidate("workspaces")
             # Return the JSON response
             return self._json_or_none(response)
         else:
@@ -400,21 +787,17 @@ class Topomojo:
         # Fields allowed by RestrictedChangedWorkspace
         allowed_fields = ["name", "description", "tags", "author", "audience"]
 
-        # Try to load existing workspace to preserve unspecified fields
+        # Try to load existing workspace to preserve unspecified fields. This
+        # read bypasses the response cache so stale values are never written back.
         current: Dict[str, Any] = {}
         try:
-            load_resp = self.session.get(
-                f"{self.app_url}/api/workspace/{workspace_id}")
-            if load_resp.status_code == 200:
-                current = self._json_or_none(load_resp) or {}
-            else:
-                self.logger.debug(
-                    f"Could not load current workspace {workspace_id} (status {load_resp.status_code}); "
-                    f"will require 'name' in changes."
-                )
-        except Exception as e:
+            current = self.get_workspace(workspace_id, use_cache=False) or {}
+        except TopomojoException as e:
             self.logger.debug(
-                f"Error loading current workspace {workspace_id}: {e}")
+                "Could not load current workspace %s (status %s); will require 'name' in changes.",
+                workspace_id, e.status_code)
+        except Exception as e:
+            self.logger.debug("Error loading current workspace %s: %s", workspace_id, e)
 
         # Merge: explicit changes take precedence; otherwise fall back to current values
         for field in allowed_fields:
@@ -429,12 +812,12 @@ class Topomojo:
                 raise ValueError(
                     "Workspace name is required for update and could not be loaded from server.")
 
-        self.logger.debug(
-            f"Updating workspace {workspace_id} with payload {payload}")
+        self.logger.debug("Updating workspace %s with payload %s", workspace_id, Abbreviated(payload))
 
         response = self.session.put(full_url, json=payload)
 
         if response.status_code == 200:
+            self._invalidate("workspaces", f"workspace:{workspace_id}")
             return self._json_or_none(response)
         else:
             raise TopomojoException(response.status_code, response.text)
@@ -447,8 +830,7 @@ class Topomojo:
         Raises: TopoMojoException
         """
 
-        self.logger.debug(
-            f"Generating invitation code for workspace ID: {workspace_id}")
+        self.logger.debug("Generating invitation code for workspace ID: %s", workspace_id)
         # Construct the full URL
         full_url = f"{self.app_url}/api/workspace/{workspace_id}/invite"
 
@@ -471,7 +853,7 @@ class Topomojo:
         Raises: TopoMojoException
         """
 
-        self.logger.debug(f"Deleting workspace with ID: {workspace_id}")
+        self.logger.debug("Deleting workspace with ID: %s", workspace_id)
         # Construct the full URL
         full_url = f"{self.app_url}/api/workspace/{workspace_id}"
 
@@ -481,6 +863,7 @@ class Topomojo:
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
             self.logger.debug("Workspace deleted successfully")
+            self._invalidate("workspaces", f"workspace:{workspace_id}", "templates")
             return self._json_or_none(response)
         else:
             # If the request was not successful, raise a custom exception
@@ -494,7 +877,7 @@ class Topomojo:
         Raises: TopoMojoException
         """
 
-        self.logger.debug(f"Exporting {len(ids)} workspaces with IDs: {ids}")
+        self.logger.debug("Exporting %s workspaces with IDs: %s", len(ids), Abbreviated(ids))
         # Construct the full URL
         full_url = f"{self.app_url}/api/admin/export"
 
@@ -517,7 +900,7 @@ class Topomojo:
         Raises: TopoMojoException
         """
 
-        self.logger.debug(f"Exporting workspace with ID: {workspace_id}")
+        self.logger.debug("Exporting workspace with ID: %s", workspace_id)
         return self.export_workspaces([workspace_id])
 
     def download_workspaces(self, workspace_ids: List[str], output_file: str) -> bool:
@@ -529,21 +912,196 @@ class Topomojo:
         Raises: TopoMojoException
         """
 
-        self.logger.debug(
-            f"Downloading an export package for workspaces: {workspace_ids}")
+        self.logger.debug("Downloading an export package for workspaces: %s", Abbreviated(workspace_ids))
+
+        self._download_to_file(workspace_ids, output_file)
+        return True
+
+    def _download_to_file(self, workspace_ids: List[str], output_file: str) -> int:
+        """Stream an export package to ``output_file`` and return the bytes written.
+
+        The package is written to a temporary file in the same directory and
+        renamed into place once complete, so ``output_file`` never holds a
+        partial download.
+        """
 
         url = f"{self.app_url}/api/admin/download"
         response = self.session.post(url, json=workspace_ids, stream=True)
 
-        if response.status_code == 200:
-            self.logger.debug(f"Saving export package to file: {output_file}")
-            with open(output_file, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
-            return True
-        else:
-            # If the request was not successful, raise a custom exception
-            raise TopomojoException(response.status_code, response.text)
+        try:
+            if response.status_code != 200:
+                # If the request was not successful, raise a custom exception
+                raise TopomojoException(response.status_code, response.text)
+
+            self.logger.debug("Saving export package to file: %s", output_file)
+            directory = os.path.dirname(os.path.abspath(output_file))
+            fd, temp_path = tempfile.mkstemp(
+                dir=directory, prefix=os.path.basename(output_file) + '.', suffix='.part')
+            progress = self._transfer_progress('download', output_file, None)
+            total = int(response.headers['Content-Length']) if 'Content-Length' in response.headers else None
+            written = 0
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        file.write(chunk)
+                        written += len(chunk)
+                        if progress is not None:
+                            progress(written, total)
+                os.replace(temp_path, output_file)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+            return written
+        finally:
+            response.close()
+
+    def download_workspaces_resumable(self, workspace_ids: List[str], output_file: str,
+                                      max_retries: int = 5, backoff: float = 1.0, max_backoff: float = 60.0,
+                                      sha256: Optional[str] = None, test_members: bool = False) -> bool:
+        """Download an export package, surviving dropped connections.
+
+        Data is streamed into ``<output_file>.part`` with a JSON sidecar
+        (``<output_file>.part.json``) recording the request and progress, so a
+        later call with the same ``workspace_ids`` continues where the last one
+        stopped. Resumption uses an HTTP ``Range`` request; if the server
+        answers with the full body instead of ``206 Partial Content``, or
+        rejects the range with ``416``, the download restarts from zero. Connection errors and 5xx responses are
+        retried with jittered exponential backoff.
+
+        Before the ``.part`` file is renamed to ``output_file`` the archive is
+        checked with :func:`verify_archive` (size, zip central directory and
+        optionally ``sha256`` / member CRCs).
+
+        Parameters
+        ----------
+        workspace_ids: list of str
+            Workspaces included in the export package.
+        output_file: str
+            Final path of the archive.
+        max_retries: int, optional
+            Consecutive failed attempts allowed before giving up. Attempts that
+            receive data reset the count. Defaults to 5.
+        backoff: float, optional
+            Initial retry delay in seconds, doubled per failure. Defaults to 1.
+        max_backoff: float, optional
+            Upper bound on the retry delay in seconds. Defaults to 60.
+        sha256: str, optional
+            Expected hex digest of the finished archive.
+        test_members: bool, optional
+            When True, also CRC-check every member of the archive.
+
+        Returns True on success.
+
+        Raises: TopomojoException, ValueError (verification failure)
+        """
+
+        part_file = output_file + '.part'
+        state_file = part_file + '.json'
+        url = f"{self.app_url}/api/admin/download"
+
+        state: Dict[str, Any] = {}
+        if os.path.exists(state_file) and os.path.exists(part_file):
+            with open(state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('workspace_ids') != list(workspace_ids):
+                state = {}
+        if not state:
+            state = {'workspace_ids': list(workspace_ids), 'total': None, 'etag': None}
+            open(part_file, 'wb').close()
+
+        def save_state() -> None:
+            with open(state_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+
+        failures = 0
+        while True:
+            offset = os.path.getsize(part_file)
+            headers: Dict[str, str] = {}
+            if offset:
+                headers['Range'] = f"bytes={offset}-"
+                if state.get('etag'):
+                    headers['If-Range'] = state['etag']
+
+            self.logger.debug("Downloading export package %s from offset %s", Abbreviated(workspace_ids), offset)
+            received = 0
+            try:
+                response = self.session.post(url, json=workspace_ids, headers=headers, stream=True)
+                try:
+                    if response.status_code == 416 and state.get('total') == offset:
+                        break
+                    if response.status_code == 416 and offset:
+                        # The package changed size or the server lost it;
+                        # the partial data cannot be resumed.
+                        self.logger.debug("Server rejected offset %s; restarting download", offset)
+                        open(part_file, 'wb').close()
+                        state['total'] = state['etag'] = None
+                        save_state()
+                        continue
+                    if response.status_code not in (200, 206):
+                        if response.status_code < 500:
+                            raise TopomojoException(response.status_code, response.text)
+                        raise requests.exceptions.HTTPError(
+                            f"Server error {response.status_code}", response=response)
+
+                    mode = 'ab'
+                    if response.status_code == 200:
+                        if offset:
+                            self.logger.debug("Server ignored Range request; restarting download")
+                        mode = 'wb'
+                        length = response.headers.get('Content-Length')
+                        state['total'] = int(length) if length is not None else None
+                    else:
+                        content_range = response.headers.get('Content-Range', '')
+                        match = re.match(r'bytes (\d+)-\d+/(\d+|\*)', content_range)
+                        if not match or int(match.group(1)) != offset:
+                            response.close()
+                            open(part_file, 'wb').close()
+                            raise requests.exceptions.ContentDecodingError(
+                                f"Unexpected Content-Range {content_range!r} for offset {offset}")
+                        if match.group(2) != '*':
+                            state['total'] = int(match.group(2))
+                    state['etag'] = response.headers.get('ETag')
+                    save_state()
+
+                    progress = self._transfer_progress('download', output_file, None)
+                    start = offset if mode == 'ab' else 0
+                    with open(part_file, mode) as file:
+                        for chunk in response.iter_content(chunk_size=8192):
+                            file.write(chunk)
+                            received += len(chunk)
+                            if progress is not None:
+                                progress(start + received, state.get('total'))
+                finally:
+                    response.close()
+
+                if state.get('total') is not None and os.path.getsize(part_file) < state['total']:
+                    raise requests.exceptions.ChunkedEncodingError(
+                        f"Connection closed after {os.path.getsize(part_file)} of {state['total']} bytes")
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError,
+                    requests.exceptions.HTTPError) as exc:
+                failures = 1 if received else failures + 1
+                if failures > max_retries:
+                    self.logger.debug("Giving up on export package %s: %s", Abbreviated(workspace_ids), exc)
+                    raise
+                delay = min(max_backoff, backoff * (2 ** (failures - 1)))
+                delay = delay / 2 + random.uniform(0, delay / 2)
+                self.logger.debug("Download interrupted (%s); retrying in %.1fs", exc, delay)
+                sleep(delay)
+
+        try:
+            verify_archive(part_file, expected_size=state.get('total'), sha256=sha256,
+                           test_members=test_members)
+        except ValueError:
+            os.remove(part_file)
+            os.remove(state_file)
+            raise
+
+        os.replace(part_file, output_file)
+        os.remove(state_file)
+        self.logger.debug("Export package saved to %s", output_file)
+        return True
 
     def download_workspace(self, workspace_id: str, output_file: str) -> bool:
         """Download a single workspace export package.
@@ -553,26 +1111,75 @@ class Topomojo:
         Raises: TopoMojoException
         """
 
-        self.logger.debug(
-            f"Downloading an export package for workspace: {workspace_id}")
+        self.logger.debug("Downloading an export package for workspace: %s", workspace_id)
         return self.download_workspaces([workspace_id], output_file)
 
-    def upload_workspace(self, archive_path: str) -> Optional[List[str]]:
+    def download_workspaces_parallel(self, workspace_ids: List[str], output_dir: str, max_workers: int = 4,
+                                     filename: Optional[Callable[[str], str]] = None) -> BulkReport:
+        """Download one export package per workspace, several at a time.
+
+        Parameters
+        ----------
+        workspace_ids: list of str
+            Workspaces to export. Each one is written to its own archive.
+        output_dir: str
+            Directory the archives are written to. Created if missing.
+        max_workers: int, optional
+            Number of concurrent downloads. Defaults to 4.
+        filename: callable, optional
+            Maps a workspace ID to the archive file name. Defaults to
+            ``"<workspace_id>.zip"``.
+
+        Every archive is written atomically (temporary file plus rename).
+        Failures do not stop the batch; returns a :class:`BulkReport` keyed by
+        workspace ID whose ``value`` is the written path, with aggregate
+        byte counts and throughput.
+        """
+
+        os.makedirs(output_dir, exist_ok=True)
+        name_for = filename or (lambda workspace_id: f"{workspace_id}.zip")
+
+        self.logger.debug(
+            "Downloading %s export packages to %s with %s workers", len(workspace_ids), output_dir, max_workers)
+
+        sizes: Dict[str, int] = {}
+
+        def download(workspace_id: str) -> str:
+            output_file = os.path.join(output_dir, name_for(workspace_id))
+            sizes[workspace_id] = self._download_to_file([workspace_id], output_file)
+            return output_file
+
+        report = run_bulk(workspace_ids, download, max_workers=max_workers,
+                          size=lambda workspace_id, _: sizes.get(workspace_id, 0))
+        self.logger.debug("Parallel download finished: %s", report.summary())
+        return report
+
+    def upload_workspace(self, archive_path: str,
+                         progress: Optional[ProgressCallback] = None) -> Optional[List[str]]:
         """Upload a single workspace export package.
 
+        The archive is streamed from disk rather than loaded into memory.
+        ``progress``, if given, is called as ``progress(bytes_sent, total_bytes)``.
+
         Returns JSON from TopoMojo API if 200 OK was returned. Otherwise, raise a TopoMojo Exception.
 
         Raises: TopoMojoException
         """
 
-        self.logger.debug(f"Uploading workspace archive: {archive_path}")
+        self.logger.debug("Uploading workspace archive: %s", archive_path)
 
         url = f"{self.app_url}/api/admin/upload"
 
-        with open(archive_path, "rb") as archive:
-            response = self.session.post(url, files={"files": archive})
+        body = MultipartEncoder(progress=self._transfer_progress('upload', archive_path, progress))
+        body.add_file("files", archive_path)
+        try:
+            response = self.session.post(
+                url, data=body, headers={'Content-Type': body.content_type})
+        finally:
+            body.close()
 
         if response.status_code == 200:
+            self._invalidate("workspaces", "templates")
             return self._json_or_none(response)
         else:
             raise TopomojoException(response.status_code, response.text)
@@ -590,7 +1197,158 @@ class Topomojo:
                 uploaded_ids.extend(uploaded)
         return uploaded_ids
 
-    def upload_iso(self, iso_path: str, workspace_id: str, is_global: bool = False, wait: bool = False) -> Optional[Any]:
+    def upload_workspaces_parallel(self, archive_paths: List[str], max_workers: int = 4, retries: int = 2,
+                                   backoff: float = 1.0, max_backoff: float = 30.0,
+                                   largest_first: bool = True, ledger: Optional[UploadLedger] = None,
+                                   check_server: bool = False) -> BulkReport:
+        """Upload many workspace export packages concurrently.
+
+        Parameters
+        ----------
+        archive_paths: list of str
+            Archives to upload. Each one is sent in its own request; a path
+            listed more than once is uploaded once.
+        max_workers: int, optional
+            Number of concurrent uploads. Defaults to 4.
+        retries: int, optional
+            Extra attempts per archive. Defaults to 2. See below for which
+            failures are retried.
+        backoff: float, optional
+            Base of the jittered exponential delay between attempts, in seconds.
+        max_backoff: float, optional
+            Upper bound on a single delay, in seconds.
+        largest_first: bool, optional
+            Start the biggest archives first so one large upload does not
+            run alone at the end of the batch. Defaults to True.
+        ledger: UploadLedger, optional
+            Each archive is hashed before it is uploaded; archives whose
+            hash is already in the ledger are skipped, and every successful
+            upload is recorded.
+        check_server: bool, optional
+            With a ledger, also skip an unrecorded archive when every
+            workspace ID inside it already exists on the server, and record
+            it. Costs one GET per workspace in the archive.
+
+        Skipped archives are reported as successful with ``skipped`` set and
+        the known workspace IDs as ``value``.
+
+        A failed upload may still have been imported by the server, so only
+        failures that show the request was not processed (a connection that
+        could not be opened, 429 or 503) are retried directly. After other
+        connection errors, timeouts and 502/504 responses, the workspaces in
+        the archive are looked up on the server first: if they all exist the
+        archive counts as uploaded, otherwise it is retried. Archives without
+        readable workspace IDs are not retried after such failures.
+
+        Failures do not stop the batch; returns a :class:`BulkReport` keyed by
+        archive path (in the order given) whose ``value`` is the list of
+        workspace IDs returned for that archive.
+        """
+
+        archive_paths = list(dict.fromkeys(archive_paths))
+        sizes: Dict[str, int] = {}
+        unreadable: Dict[str, OSError] = {}
+        for path in archive_paths:
+            try:
+                sizes[path] = os.path.getsize(path)
+            except OSError as exc:
+                sizes[path] = 0
+                unreadable[path] = exc
+        order = sorted(archive_paths, key=sizes.get, reverse=True) if largest_first else list(archive_paths)
+        attempts: Dict[str, int] = {}
+        skipped = set()
+        # Copies of the same archive in one batch wait for the first upload instead of repeating it.
+        hash_locks: Dict[str, threading.Lock] = {}
+        hash_locks_guard = threading.Lock()
+
+        def imported_on_server(path: str) -> Optional[List[str]]:
+            """Return the archive's workspace IDs if all of them exist on the server, else ``None``."""
+
+            workspace_ids = workspace_ids_in_archive(path)
+            if not workspace_ids:
+                return None
+            for workspace_id in workspace_ids:
+                try:
+                    self.get_workspace(workspace_id, use_cache=False)
+                except TopomojoException as exc:
+                    if exc.status_code in (400, 404):
+                        return None
+                    raise
+            return workspace_ids
+
+        def upload(path: str) -> List[str]:
+            if path in unreadable:
+                raise unreadable[path]
+            if ledger is None:
+                return send(path)
+            sha256 = ledger.hash_file(path)
+            with hash_locks_guard:
+                lock = hash_locks.setdefault(sha256, threading.Lock())
+            with lock:
+                known = ledger.lookup(sha256)
+                if known is None and check_server:
+                    known = imported_on_server(path)
+                    if known is not None:
+                        ledger.record(sha256, known, path)
+                if known is not None:
+                    self.logger.debug("Skipping %s; already imported as %s", path, known)
+                    skipped.add(path)
+                    return known
+                uploaded = send(path)
+                ledger.record(sha256, uploaded, path)
+                return uploaded
+
+        def not_processed(exc: Exception) -> bool:
+            """True for failures that guarantee the server did not import the archive."""
+
+            if isinstance(exc, TopomojoException):
+                return exc.status_code in (429, 503)
+            if isinstance(exc, requests.exceptions.ConnectTimeout):
+                return True
+            reason = getattr(exc.args[0], 'reason', None) if exc.args else None
+            return isinstance(reason, NewConnectionError)
+
+        def send(path: str) -> List[str]:
+            """Upload one archive with retries and return the workspace IDs it was imported as."""
+
+            failures = 0
+            while True:
+                attempts[path] = failures + 1
+                try:
+                    return self.upload_workspace(path) or []
+                except (requests.ConnectionError, requests.Timeout, TopomojoException) as exc:
+                    failures += 1
+                    if isinstance(exc, TopomojoException) and exc.status_code not in self.transport.retry_statuses:
+                        raise
+                    if failures > retries:
+                        raise
+                    if not not_processed(exc):
+                        # The server may have imported the archive before the failure.
+                        if not workspace_ids_in_archive(path):
+                            raise
+                        known = imported_on_server(path)
+                        if known is not None:
+                            self.logger.debug("Upload of %s failed (%s) but it was imported as %s", path, exc, known)
+                            return known
+                    delay = min(max_backoff, backoff * (2 ** (failures - 1)))
+                    delay = delay / 2 + random.uniform(0, delay / 2)
+                    self.logger.debug(
+                        "Upload of %s failed (%s); retry %s/%s in %.1fs", path, exc, failures, retries, delay)
+                    sleep(delay)
+
+        self.logger.debug("Uploading %s archives with %s workers", len(archive_paths), max_workers)
+        report = run_bulk(order, upload, max_workers=max_workers, size=lambda path, _: sizes[path])
+        report.results = {path: report.results[path] for path in archive_paths}
+        for path, result in report.results.items():
+            result.attempts = attempts.get(path, 0 if path in skipped or path in unreadable else 1)
+            if path in skipped:
+                result.skipped = True
+                result.bytes = 0
+        self.logger.debug("Parallel upload finished: %s", report.summary())
+        return report
+
+    def upload_iso(self, iso_path: str, workspace_id: str, is_global: bool = False, wait: bool = False,
+                   progress: Optional[ProgressCallback] = None, poll: Optional[PollPolicy] = None) -> Optional[Any]:
         """Upload a file to a workspace. Non-ISO files are automatically
         wrapped in an ISO 9660 container by the server after upload.
 
@@ -606,19 +1364,35 @@ class Topomojo:
         wait: bool, optional
             When True, poll until the server has finished processing the
             uploaded file before returning. Defaults to False.
+        progress: callable, optional
+            Called as ``progress(bytes_sent, total_bytes)`` while the file is
+            streamed to the server.
+        poll: PollPolicy, optional
+            Backoff and overall deadline used when ``wait`` is True.
 
         Returns True on success. Raises TopomojoException on failure.
 
         Raises: TopomojoException
         """
 
-        self.logger.debug(f"Uploading ISO {iso_path} to workspace {workspace_id} (is_global={is_global})")
+        self.logger.debug("Uploading ISO %s to workspace %s (is_global=%s)", iso_path, workspace_id, is_global)
 
         if not os.path.isfile(iso_path):
             raise ValueError(f"iso_path must be a file, not a directory or missing path: {iso_path}")
 
-        url = f"{self.app_url}/api/file/upload"
         size = os.path.getsize(iso_path)
+        return self._upload_file(lambda body: body.add_file("file", iso_path), size,
+                                 workspace_id, is_global, wait, progress, poll, name=iso_path)
+
+    def _upload_file(self, add_file: Callable[[MultipartEncoder], None], size: int, workspace_id: str,
+                     is_global: bool, wait: bool, progress: Optional[ProgressCallback],
+                     poll: Optional[PollPolicy] = None, name: str = '') -> Optional[Any]:
+        """POST one file to ``/api/file/upload``; ``add_file`` adds the file part to the body.
+
+        ``name`` identifies the file in ``transfer_progress`` hooks.
+        """
+
+        url = f"{self.app_url}/api/file/upload"
         monitor_key = str(uuid.uuid4()) if wait else None
 
         params: Dict[str, Any] = {"size": size}
@@ -632,37 +1406,43 @@ class Topomojo:
         # causes each one to overwrite the previous, so encode them all into one section.
         encoded_params = urlencode(params)
 
-        filename = os.path.basename(iso_path)
-        with open(iso_path, "rb") as iso_file:
+        body = MultipartEncoder(progress=self._transfer_progress('upload', name, progress))
+        body.add_field("data", encoded_params, "text/plain")
+        add_file(body)
+        try:
             response = self.session.post(
-                url,
-                files=[
-                    ("data", (None, encoded_params, "text/plain")),
-                    ("file", (filename, iso_file)),
-                ],
-            )
+                url, data=body, headers={'Content-Type': body.content_type})
+        finally:
+            body.close()
 
         if response.status_code != 200:
             raise TopomojoException(response.status_code, response.text)
 
         if wait and monitor_key:
             progress_url = f"{self.app_url}/api/file/progress/{monitor_key}"
-            while True:
+
+            def check() -> Optional[Any]:
                 progress_response = self.session.get(progress_url)
-                if progress_response.status_code == 200:
-                    progress = self._json_or_none(progress_response)
-                    self.logger.debug(f"ISO upload progress: {progress}%")
-                    if progress is None or progress >= 100 or progress < 0:
-                        break
-                else:
-                    break
-                sleep(1)
+                if progress_response.status_code != 200:
+                    return None
+                return self._json_or_none(progress_response)
+
+            def tick(percent: Optional[int]) -> None:
+                self.logger.debug("ISO upload progress: %s%%", percent)
+                self.hooks.emit('poll_tick', monitor_key, percent)
+
+            poll_until(check, lambda percent: percent is None or percent >= 100 or percent < 0,
+                       policy=poll, on_tick=tick)
 
         return self._json_or_none(response)
 
     def upload_directory(self, directory_path: str, workspace_id: str,
                          is_global: bool = False, wait: bool = False,
-                         save_iso: Optional[str] = None) -> Optional[Any]:
+                         save_iso: Optional[str] = None,
+                         progress: Optional[ProgressCallback] = None,
+                         stream: bool = False,
+                         iso_cache: Optional[IsoCache] = None,
+                         poll: Optional[PollPolicy] = None) -> Optional[Any]:
         """Pack a local directory into an ISO and upload it to a workspace.
 
         Parameters
@@ -681,6 +1461,19 @@ class Topomojo:
             If provided, the generated ISO is written to this path and kept
             after upload. If omitted, the ISO is written to a temporary file
             and deleted after upload.
+        progress: callable, optional
+            Upload progress callback, see :meth:`upload_iso`.
+        stream: bool, optional
+            When True, the ISO is generated on a background thread and piped
+            straight into the upload request, so it is never written to
+            local disk (see :class:`IsoStream` for the fallback). Its size is
+            computed from the directory layout beforehand. Cannot be combined
+            with ``save_iso`` or ``iso_cache``.
+        iso_cache: IsoCache, optional
+            Reuse a previously built ISO when the directory tree is unchanged,
+            and store newly built images for later calls.
+        poll: PollPolicy, optional
+            Backoff and overall deadline used when ``wait`` is True.
 
         Returns True on success. Raises TopomojoException on failure.
 
@@ -690,6 +1483,25 @@ class Topomojo:
         if not os.path.isdir(directory_path):
             raise ValueError(f"directory_path must be a directory: {directory_path}")
 
+        if stream:
+            if save_iso or iso_cache is not None:
+                raise ValueError("save_iso and iso_cache cannot be used with stream=True")
+            filename = os.path.basename(os.path.normpath(directory_path)) + '.iso'
+            with IsoStream(directory_path) as image:
+                self.logger.debug(
+                    "Streaming %s-byte ISO of %s to workspace %s", image.size, directory_path, workspace_id)
+                return self._upload_file(
+                    lambda body: body.add_stream("file", image.open, image.size, filename),
+                    image.size, workspace_id, is_global, wait, progress, poll, name=filename)
+
+        if iso_cache is not None:
+            iso_output_path = iso_cache.get_or_build(directory_path)
+            self.logger.debug("Using cached ISO %s for %s", iso_output_path, directory_path)
+            if save_iso:
+                shutil.copyfile(iso_output_path, save_iso)
+            return self.upload_iso(iso_output_path, workspace_id, is_global=is_global, wait=wait,
+                                   progress=progress, poll=poll)
+
         if save_iso:
             iso_output_path = save_iso
             cleanup = False
@@ -698,54 +1510,13 @@ class Topomojo:
             os.close(fd)
             cleanup = True
 
-        self.logger.debug(f"Building ISO from directory {directory_path} -> {iso_output_path}")
-
-        def _iso9660_name(name: str, is_dir: bool) -> str:
-            """Sanitize a filename/dirname for ISO 9660 (uppercase, 8.3, A-Z0-9_ only)."""
-            name = name.upper()
-            name = re.sub(r'[^A-Z0-9_.]', '_', name)
-            if is_dir:
-                return name[:31]
-            base, _, ext = name.rpartition('.')
-            if not base:
-                base, ext = ext, ''
-            return (base[:8] + ('.' + ext[:3] if ext else '')) + ';1'
-
-        open_files: List[BytesIO] = []
-        iso = pycdlib.PyCdlib()  # type: ignore[attr-defined]
-        iso.new(joliet=3)
-
-        try:
-            for root, dirs, files in os.walk(directory_path):
-                rel_root = os.path.relpath(root, directory_path)
-
-                if rel_root == '.':
-                    iso9660_dir = '/'
-                    joliet_dir = '/'
-                else:
-                    parts = rel_root.replace(os.sep, '/').split('/')
-                    iso9660_dir = '/' + '/'.join(_iso9660_name(p, True) for p in parts)
-                    joliet_dir = '/' + '/'.join(parts)
-                    iso.add_directory(iso9660_dir, joliet_path=joliet_dir)
-
-                for filename in files:
-                    file_path = os.path.join(root, filename)
-                    with open(file_path, 'rb') as f:
-                        data = f.read()
-                    fp = BytesIO(data)
-                    open_files.append(fp)
-                    iso9660_file = iso9660_dir.rstrip('/') + '/' + _iso9660_name(filename, False)
-                    joliet_file = joliet_dir.rstrip('/') + '/' + filename
-                    iso.add_fp(fp, len(data), iso_path=iso9660_file, joliet_path=joliet_file)
-
-            iso.write(iso_output_path)
-        finally:
-            iso.close()
-
-        self.logger.debug(f"ISO written to {iso_output_path}, uploading")
+        self.logger.debug("Building ISO from directory %s -> %s", directory_path, iso_output_path)
 
         try:
-            return self.upload_iso(iso_output_path, workspace_id, is_global=is_global, wait=wait)
+            build_iso(directory_path, iso_output_path)
+            self.logger.debug("ISO written to %s, uploading", iso_output_path)
+            return self.upload_iso(iso_output_path, workspace_id, is_global=is_global, wait=wait,
+                                   progress=progress, poll=poll)
         finally:
             if cleanup:
                 os.remove(iso_output_path)
@@ -779,18 +1550,20 @@ class Topomojo:
             "Filter": Filter
         }
 
-        self.logger.debug(f"Listing gamespaces with params: {params}")
+        self.logger.debug("Listing gamespaces with params: %s", params)
 
         # Make a GET request to the API endpoint with the provided query parameters
-        response = self.session.get(full_url, params=params)
+        return self._get_json(full_url, params=params, endpoint='gamespaces')
 
-        # Check if the request was successful (status code 200)
-        if response.status_code == 200:
-            # Return the JSON response
-            return self._json_or_none(response)
-        else:
-            # If the request was not successful, raise a custom exception
-            raise TopomojoException(response.status_code, response.text)
+    def iter_gamespaces(self, page_size: int = 100, prefetch: bool = False, **params) -> Iterator[Dict[str, Any]]:
+        """Iterate over gamespaces, fetching ``page_size`` results per request.
+
+        Keyword arguments are the :meth:`get_gamespaces` query parameters
+        (except ``Skip``/``Take``). When ``prefetch`` is True the next page is
+        requested in the background while the current page is consumed.
+        """
+
+        return self._iter_pages(self.get_gamespaces, page_size, prefetch, params)
 
     def stop_gamespace(self, gamespace_id: str) -> Optional[Any]:
         """Stop a running gamespace.
@@ -800,7 +1573,7 @@ class Topomojo:
         Raises: TopoMojoException
         """
 
-        self.logger.debug(f"Stopping gamespace {gamespace_id}")
+        self.logger.debug("Stopping gamespace %s", gamespace_id)
         # Construct the full URL
         full_url = f"{self.app_url}/api/gamespace/{gamespace_id}/stop"
 
@@ -809,6 +1582,7 @@ class Topomojo:
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            self._invalidate("gamespaces")
             # Return the JSON response
             return self._json_or_none(response)
         else:
@@ -823,7 +1597,7 @@ class Topomojo:
         Raises: TopoMojoException
         """
 
-        self.logger.debug(f"Completing gamespace {gamespace_id}")
+        self.logger.debug("Completing gamespace %s", gamespace_id)
         # Construct the full URL
         full_url = f"{self.app_url}/api/gamespace/{gamespace_id}/complete"
 
@@ -832,8 +1606,70 @@ class Topomojo:
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            self._invalidate("gamespaces")
             # Return the JSON response
             return self._json_or_none(response)
         else:
             # If the request was not successful, raise a custom exception
             raise TopomojoException(response.status_code, response.text)
+
+    def stop_gamespaces(self, gamespace_ids: List[str], concurrency: int = 8,
+                        rate: Optional[float] = None) -> BulkReport:
+        """Stop many gamespaces in parallel.
+
+        Parameters
+        ----------
+        gamespace_ids: list of str
+            Gamespaces to stop.
+        concurrency: int, optional
+            Number of requests in flight at once. Defaults to 8.
+        rate: float, optional
+            Upper bound on requests started per second across all threads.
+            Unlimited by default.
+
+        Returns a :class:`BulkReport` keyed by gamespace ID; failures do not
+        stop the batch.
+        """
+
+        return self._gamespace_bulk(self.stop_gamespace, gamespace_ids, concurrency, rate)
+
+    def complete_gamespaces(self, gamespace_ids: List[str], concurrency: int = 8,
+                            rate: Optional[float] = None) -> BulkReport:
+        """Mark many gamespaces complete in parallel. See :meth:`stop_gamespaces`."""
+
+        return self._gamespace_bulk(self.complete_gamespace, gamespace_ids, concurrency, rate)
+
+    def apply_to_gamespaces(self, action: str, where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                            concurrency: int = 8, rate: Optional[float] = None,
+                            page_size: int = 100, **params) -> BulkReport:
+        """List gamespaces, keep those matching ``where`` and stop or complete them.
+
+        ``action`` is ``"stop"`` or ``"complete"``. Gamespaces are listed with
+        :meth:`iter_gamespaces` using ``params`` (e.g. ``WantsAll=True``);
+        ``where`` receives each gamespace and defaults to selecting all of
+        them. See :meth:`stop_gamespaces` for ``concurrency`` and ``rate``.
+        """
+
+        actions = {'stop': self.stop_gamespace, 'complete': self.complete_gamespace}
+        if action not in actions:
+            raise ValueError(f"action must be one of {sorted(actions)}")
+
+        gamespace_ids = [gamespace['id'] for gamespace in self.iter_gamespaces(page_size=page_size, **params)
+                         if gamespace.get('id') and (where is None or where(gamespace))]
+        return self._gamespace_bulk(actions[action], gamespace_ids, concurrency, rate)
+
+    def _gamespace_bulk(self, func: Callable[[str], Optional[Any]], gamespace_ids: List[str],
+                        concurrency: int, rate: Optional[float]) -> BulkReport:
+        limiter = RateLimiter(rate, burst=concurrency) if rate else None
+
+        def call(gamespace_id: str) -> Optional[Any]:
+            if limiter is not None:
+                limiter.acquire()
+            return func(gamespace_id)
+
+        self.logger.debug(
+            "Running %s on %s gamespaces with concurrency %s, rate %s",
+            func.__name__, len(gamespace_ids), concurrency, rate or 'unlimited')
+        report = run_bulk(gamespace_ids, call, max_workers=concurrency)
+        self.logger.debug("%s finished: %s", func.__name__, report.summary())
+        return report
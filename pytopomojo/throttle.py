@@ -0,0 +1,198 @@
+import time
+import threading
+from urllib.parse import urlparse
+from typing import Any, Dict, Optional, Tuple
+
+
+# Endpoints whose requests carry whole archives or images.
+TRANSFER_PATHS: Tuple[str, ...] = ('/api/admin/download', '/api/admin/upload', '/api/file/upload')
+READ_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``; each
+    :meth:`acquire` takes one token and blocks until one is available, so
+    any number of threads sharing a limiter together stay under ``rate``
+    calls per second after an initial burst.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate; tokens already accrued are kept."""
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` if available right now, without waiting."""
+
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available and take them; returns the time waited."""
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class Governor:
+    """Client-side rate limit and concurrency caps with AIMD adaptation.
+
+    Pass an instance as ``Topomojo(governor=...)``; it then applies to every
+    HTTP request the client makes. One governor may be shared by several
+    clients to give them a common budget.
+
+    Transport retries happen inside a single request: the request keeps its
+    concurrency slot across its retries, but every retried attempt waits for
+    its own rate token (:meth:`pace`) and reports its status to
+    :meth:`record`.
+
+    Requests are classified as ``"read"`` (GET/HEAD), ``"transfer"`` (export
+    downloads and archive/ISO uploads) or ``"mutation"`` (everything else),
+    and each class may have its own cap on requests in flight. A streamed
+    response holds its slot until it is closed or fully read.
+
+    With ``rate`` set, request starts are paced by a token bucket. Every
+    ``throttle_statuses`` response (or connection error) halves the rate
+    (``decrease``), at most once per ``decrease_interval`` seconds so a burst
+    of rejections counts once, down to ``min_rate``. Every other response
+    adds ``increase`` requests per second back, up to ``rate``.
+
+    Parameters
+    ----------
+    rate: float, optional
+        Maximum requests started per second. ``None`` disables pacing and
+        adaptation.
+    burst: float, optional
+        Token bucket size. Defaults to ``rate``.
+    read_concurrency, mutation_concurrency, transfer_concurrency: int, optional
+        Caps on requests in flight per class. ``None`` means unlimited.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None,
+                 read_concurrency: Optional[int] = None, mutation_concurrency: Optional[int] = None,
+                 transfer_concurrency: Optional[int] = None, min_rate: float = 0.5,
+                 increase: float = 0.5, decrease: float = 0.5, decrease_interval: float = 1.0,
+                 throttle_statuses: Tuple[int, ...] = (429, 503)) -> None:
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.decrease_interval = decrease_interval
+        self.throttle_statuses = throttle_statuses
+        self.limiter = RateLimiter(rate, burst) if rate else None
+        self._slots: Dict[str, Optional[threading.BoundedSemaphore]] = {
+            'read': threading.BoundedSemaphore(read_concurrency) if read_concurrency else None,
+            'mutation': threading.BoundedSemaphore(mutation_concurrency) if mutation_concurrency else None,
+            'transfer': threading.BoundedSemaphore(transfer_concurrency) if transfer_concurrency else None,
+        }
+        self._lock = threading.Lock()
+        self._last_decrease = 0.0
+        self._in_flight = {kind: 0 for kind in self._slots}
+        self.throttled = 0
+        self.decreases = 0
+        self.wait_time = 0.0
+
+    @staticmethod
+    def classify(method: str, url: str) -> str:
+        """Return the endpoint class (``read``, ``mutation`` or ``transfer``) of a request."""
+
+        path = urlparse(url).path.rstrip('/')
+        if path.endswith(TRANSFER_PATHS):
+            return 'transfer'
+        return 'read' if method.upper() in READ_METHODS else 'mutation'
+
+    @property
+    def rate(self) -> Optional[float]:
+        """The current, adapted request rate."""
+
+        return self.limiter.rate if self.limiter is not None else None
+
+    def acquire(self, kind: str) -> None:
+        """Wait for a slot in ``kind`` and a rate token."""
+
+        started = time.monotonic()
+        slot = self._slots[kind]
+        if slot is not None:
+            slot.acquire()
+        if self.limiter is not None:
+            self.limiter.acquire()
+        with self._lock:
+            self._in_flight[kind] += 1
+            self.wait_time += time.monotonic() - started
+
+    def pace(self) -> None:
+        """Wait for a rate token without taking a slot (used before a retry)."""
+
+        if self.limiter is None:
+            return
+        waited = self.limiter.acquire()
+        with self._lock:
+            self.wait_time += waited
+
+    def release(self, kind: str) -> None:
+        with self._lock:
+            self._in_flight[kind] -= 1
+        slot = self._slots[kind]
+        if slot is not None:
+            slot.release()
+
+    def record(self, status: Optional[int], error: Optional[BaseException] = None) -> None:
+        """Adapt the rate to one response status (``None`` with ``error`` for failures)."""
+
+        throttled = error is not None or status in self.throttle_statuses
+        if throttled:
+            with self._lock:
+                self.throttled += 1
+        if self.limiter is None:
+            return
+        if not throttled:
+            if self.limiter.rate < self.max_rate:
+                self.limiter.set_rate(min(self.max_rate, self.limiter.rate + self.increase))
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.decrease_interval:
+                return
+            self._last_decrease = now
+            self.decreases += 1
+        self.limiter.set_rate(max(self.min_rate, self.limiter.rate * self.decrease))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "in_flight": dict(self._in_flight),
+                "throttled": self.throttled,
+                "decreases": self.decreases,
+                "wait_time": round(self.wait_time, 3),
+            }
@@ -0,0 +1,289 @@
+import random
+import threading
+from time import monotonic
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .instrumentation import Hooks, RequestEvent, endpoint_of
+from .throttle import Governor
+
+
+# Methods that are safe to repeat. Mutations are excluded: several TopoMojo
+# PUT endpoints (template initialization, invitations) are not idempotent, so
+# the transport never sends a POST, PUT or DELETE twice.
+SAFE_METHODS: FrozenSet[str] = frozenset(["GET", "HEAD", "OPTIONS"])
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool, timeout and retry settings for :class:`Topomojo`.
+
+    Attributes
+    ----------
+    pool_connections: int
+        Number of host pools to cache. Defaults to 10.
+    pool_maxsize: int
+        Connections kept per host. Size this to the number of threads that
+        share the client (e.g. ``max_workers`` of the bulk helpers).
+    pool_block: bool
+        When True, callers wait for a free connection instead of opening a
+        throwaway one once ``pool_maxsize`` is reached.
+    connect_timeout: float, optional
+        Seconds to wait for a TCP/TLS connection. ``None`` waits forever.
+    read_timeout: float, optional
+        Seconds to wait between bytes from the server. ``None`` waits forever.
+    retries: int
+        Retries for connection errors and ``retry_statuses`` responses.
+        ``0`` disables retries.
+    retry_methods: frozenset of str
+        Methods retried after a request has reached the server. Defaults to
+        :data:`SAFE_METHODS`.
+    retry_statuses: tuple of int
+        Response codes that trigger a retry.
+    backoff_factor: float
+        Base for the exponential backoff (``factor * 2 ** (retry - 1)``).
+    backoff_max: float
+        Upper bound on a single backoff sleep in seconds.
+    backoff_jitter: float
+        Fraction (0-1) of each backoff randomly removed to spread out clients.
+    respect_retry_after: bool
+        Sleep for the server's ``Retry-After`` header when present.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = 300.0
+    retries: int = 3
+    retry_methods: FrozenSet[str] = SAFE_METHODS
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    backoff_jitter: float = 0.5
+    respect_retry_after: bool = True
+
+    @property
+    def timeout(self) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """The ``(connect, read)`` timeout tuple passed to ``requests``."""
+
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return (self.connect_timeout, self.read_timeout)
+
+
+class JitteredRetry(Retry):
+    """:class:`urllib3.util.retry.Retry` with capped, jittered backoff.
+
+    Implemented here rather than via urllib3's ``backoff_jitter`` so it works
+    with urllib3 1.26 as well as 2.x.
+
+    ``observer`` sees every failed attempt, including the last one. ``on_retry``
+    is only called when another attempt will actually be made, and ``pacer``
+    is called after the backoff sleep, right before that attempt is sent.
+    """
+
+    def __init__(self, *args: Any, jitter: float = 0.0, max_backoff: float = 30.0,
+                 observer: Optional[Callable[[str, str, Optional[int], Optional[Exception]], None]] = None,
+                 on_retry: Optional[Callable[[str, str, Optional[int], Optional[Exception]], None]] = None,
+                 pacer: Optional[Callable[[], None]] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.observer = observer
+        self.on_retry = on_retry
+        self.pacer = pacer
+
+    def new(self, **kw: Any) -> "JitteredRetry":
+        retry = super().new(**kw)
+        retry.jitter = self.jitter
+        retry.max_backoff = self.max_backoff
+        retry.observer = self.observer
+        retry.on_retry = self.on_retry
+        retry.pacer = self.pacer
+        return retry
+
+    def increment(self, method: Optional[str] = None, url: Optional[str] = None, response: Any = None,
+                  error: Optional[Exception] = None, _pool: Any = None, _stacktrace: Any = None) -> "JitteredRetry":
+        # Report every failed attempt, including ones that are retried and
+        # never surface to the caller.
+        status = response.status if response is not None else None
+        if self.observer is not None:
+            self.observer(method or '', url or '', status, error)
+        # Raises MaxRetryError (or re-raises ``error``) once retries run out.
+        retry = super().increment(method, url, response=response, error=error, _pool=_pool,
+                                  _stacktrace=_stacktrace)
+        if self.on_retry is not None:
+            self.on_retry(method or '', url or '', status, error)
+        return retry
+
+    def sleep(self, response: Any = None) -> None:
+        super().sleep(response)
+        if self.pacer is not None:
+            self.pacer()
+
+    def get_backoff_time(self) -> float:
+        backoff = min(self.max_backoff, super().get_backoff_time())
+        if backoff <= 0:
+            return 0
+        return backoff * (1 - self.jitter * random.random())
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies a default timeout to every request.
+
+    With a :class:`Governor`, every request first waits for a slot and a rate
+    token, and its final status is reported back for rate adaptation. With
+    :class:`Hooks`, ``before_request`` and ``after_request`` fire around every
+    request; for non-streamed responses the body is read before
+    ``after_request`` so its latency and size are included.
+    """
+
+    def __init__(self, timeout: Optional[Tuple[Optional[float], Optional[float]]] = None,
+                 governor: Optional[Governor] = None, hooks: Optional[Hooks] = None, **kwargs: Any) -> None:
+        self.timeout = timeout
+        self.governor = governor
+        self.hooks = hooks
+        super().__init__(**kwargs)
+
+    def _reported_by_retry(self, method: str, status: int) -> bool:
+        """True if the retry policy's observer already saw this final status.
+
+        urllib3 only consults the retry policy for statuses in
+        ``status_forcelist`` on methods in ``allowed_methods`` (``None`` means
+        every method); a POST answered with 429 never reaches it.
+        """
+
+        retry = self.max_retries
+        if status not in (retry.status_forcelist or ()):
+            return False
+        allowed = retry.allowed_methods
+        return allowed is None or method.upper() in allowed
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        hooks = self.hooks
+        if hooks is not None and not (hooks.has('before_request') or hooks.has('after_request')):
+            hooks = None
+        if self.governor is None and hooks is None:
+            return super().send(request, **kwargs)
+
+        method, url = request.method or 'GET', request.url or ''
+        stream = kwargs.get('stream')
+        kind = None
+        if self.governor is not None:
+            kind = self.governor.classify(method, url)
+            self.governor.acquire(kind)
+        if hooks is not None:
+            hooks.emit('before_request', method, url)
+        started = monotonic()
+        try:
+            response = super().send(request, **kwargs)
+            if hooks is not None and not stream:
+                response.content  # noqa: B018 - load the body inside the timed section
+        except Exception as exc:
+            if kind is not None:
+                self.governor.release(kind)
+            if hooks is not None:
+                hooks.emit('after_request', RequestEvent(method, url, endpoint_of(url), None, monotonic() - started,
+                                                         _body_size(request), error=exc))
+            raise
+
+        if hooks is not None:
+            received = (len(response.content) if not stream
+                        else int(response.headers.get('Content-Length') or 0))
+            hooks.emit('after_request', RequestEvent(method, url, endpoint_of(url), response.status_code,
+                                                     monotonic() - started, _body_size(request), received))
+        if kind is None:
+            return response
+        if not self._reported_by_retry(method, response.status_code):
+            self.governor.record(response.status_code)
+        if stream:
+            _release_on_close(response, lambda: self.governor.release(kind))
+        else:
+            self.governor.release(kind)
+        return response
+
+
+def _body_size(request: requests.PreparedRequest) -> int:
+    length = request.headers.get('Content-Length')
+    if length is not None:
+        return int(length)
+    return len(request.body) if isinstance(request.body, (bytes, str)) else 0
+
+
+def _release_on_close(response: requests.Response, release: Callable[[], None]) -> None:
+    """Call ``release`` once, when a streamed response gives its connection back."""
+
+    lock = threading.Lock()
+    released = [False]
+    original = response.raw.release_conn
+
+    def release_conn() -> None:
+        try:
+            original()
+        finally:
+            with lock:
+                if released[0]:
+                    return
+                released[0] = True
+            release()
+
+    response.raw.release_conn = release_conn
+
+
+def build_retry(config: TransportConfig, governor: Optional[Governor] = None,
+                hooks: Optional[Hooks] = None) -> Retry:
+    """Create the urllib3 retry policy described by ``config``."""
+
+    def observer(method: str, url: str, status: Optional[int], error: Optional[Exception]) -> None:
+        if governor is not None:
+            governor.record(status, error)
+
+    def on_retry(method: str, url: str, status: Optional[int], error: Optional[Exception]) -> None:
+        if hooks is not None:
+            hooks.emit('retry', method, url, status, error)
+
+    return JitteredRetry(
+        total=config.retries,
+        connect=config.retries,
+        read=config.retries,
+        status=config.retries,
+        other=0,
+        allowed_methods=config.retry_methods,
+        status_forcelist=config.retry_statuses,
+        backoff_factor=config.backoff_factor,
+        respect_retry_after_header=config.respect_retry_after,
+        raise_on_status=False,
+        jitter=config.backoff_jitter,
+        max_backoff=config.backoff_max,
+        observer=observer if governor is not None else None,
+        on_retry=on_retry if hooks is not None else None,
+        pacer=governor.pace if governor is not None else None,
+    )
+
+
+def build_session(config: TransportConfig, headers: Optional[Dict[str, str]] = None,
+                  governor: Optional[Governor] = None, hooks: Optional[Hooks] = None) -> requests.Session:
+    """Create a :class:`requests.Session` configured according to ``config``."""
+
+    session = requests.Session()
+    adapter = TimeoutHTTPAdapter(
+        timeout=config.timeout,
+        governor=governor,
+        hooks=hooks,
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+        max_retries=build_retry(config, governor, hooks),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
@@ -0,0 +1,65 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+
+
+class StubServer:
+    """Minimal HTTP server whose responses are set per test.
+
+    ``routes`` maps ``(method, path)`` to a function called with the request
+    handler and the request body; it returns ``(status, body, headers)``
+    where ``body`` is bytes or a JSON-serializable value. ``requests`` records
+    ``(method, path, headers, body)`` for every request received. A route
+    whose path ends in ``/*`` matches any last path segment.
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], Callable[[BaseHTTPRequestHandler, bytes], Tuple[int, Any, Dict[str, str]]]] = {}
+        self.requests: List[Tuple[str, str, Dict[str, str], bytes]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def handle_method(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                path = self.path.split("?", 1)[0]
+                stub.requests.append((method, self.path, dict(self.headers), body))
+                route = stub.routes.get((method, path)) or stub.routes.get((method, path.rsplit("/", 1)[0] + "/*"))
+                status, payload, headers = route(self, body) if route else (404, {"message": "no route"}, {})
+                data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                lines = [f"HTTP/1.1 {status} X", f"Content-Length: {len(data)}"]
+                lines += [f"{name}: {value}" for name, value in headers.items()]
+                self.wfile.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + data)
+
+            def do_GET(self) -> None:
+                self.handle_method("GET")
+
+            def do_POST(self) -> None:
+                self.handle_method("POST")
+
+            def do_PUT(self) -> None:
+                self.handle_method("PUT")
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    yield server
+    server.close()
@@ -0,0 +1,63 @@
+import json
+import os
+import zipfile
+
+from pytopomojo import archives
+from pytopomojo.archives import ArchiveCatalog
+
+
+def write_export(path, workspace_id, name):
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(f"{workspace_id}/topo.json", json.dumps({"id": workspace_id, "name": name}))
+
+
+def test_lookup_by_stem_slug_and_embedded_id(tmp_path):
+    (tmp_path / "nested").mkdir()
+    write_export(tmp_path / "nested" / "forensics.zip", "ws-1", "Network Forensics & Triage")
+
+    catalog = ArchiveCatalog(str(tmp_path)).scan()
+
+    entry = catalog.lookup("Network Forensics & Triage")
+    assert entry is not None and entry.stem == "forensics"
+    assert catalog.lookup("ws-1") is entry
+    assert catalog.lookup("FORENSICS") is entry
+    assert catalog.lookup("missing") is None
+
+
+def test_unchanged_archives_are_not_reopened(tmp_path, monkeypatch):
+    root = tmp_path / "exports"
+    root.mkdir()
+    write_export(root / "a.zip", "ws-a", "Alpha")
+    write_export(root / "b.zip", "ws-b", "Bravo")
+    cache = str(tmp_path / "index.json")
+    ArchiveCatalog(str(root), cache_path=cache).scan()
+
+    opened = []
+    original = archives.read_archive_metadata
+    monkeypatch.setattr(archives, "read_archive_metadata", lambda path: opened.append(path) or original(path))
+    write_export(root / "c.zip", "ws-c", "Charlie")
+    catalog = ArchiveCatalog(str(root), cache_path=cache).scan()
+
+    assert opened == [str(root / "c.zip")]
+    assert {e.stem for e in catalog.entries.values()} == {"a", "b", "c"}
+
+
+def test_zip_rewritten_in_place_is_reread(tmp_path):
+    root = tmp_path / "exports"
+    root.mkdir()
+    archive = root / "lab.zip"
+    write_export(archive, "old-id", "Old Lab")
+    cache = str(tmp_path / "index.json")
+    assert ArchiveCatalog(str(root), cache_path=cache).scan().lookup("old-id") is not None
+
+    directory_stat = os.stat(root)
+    file_stat = os.stat(archive)
+    write_export(archive, "new-id", "New Lab")
+    os.utime(archive, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+    # Rewriting a file in place leaves its directory's mtime alone.
+    os.utime(root, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns))
+
+    catalog = ArchiveCatalog(str(root), cache_path=cache).scan()
+
+    assert catalog.lookup("old-id") is None
+    assert catalog.lookup("new-id").path == str(archive)
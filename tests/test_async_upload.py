@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from pytopomojo import AsyncTopomojo
+
+
+def test_async_upload_streams_archive_with_content_length(stub_server, tmp_path):
+    stub_server.routes[("POST", "/api/admin/upload")] = lambda handler, body: (200, ["ws1"], {})
+    archive = tmp_path / "a.zip"
+    archive.write_bytes(b"PK" + bytes(range(256)) * 1000)
+
+    async def main():
+        async with AsyncTopomojo(stub_server.url, "key") as client:
+            return await client.upload_workspace(str(archive))
+
+    assert asyncio.run(main()) == ["ws1"]
+    method, path, headers, body = stub_server.requests[0]
+    assert int(headers["Content-Length"]) == len(body)
+    assert archive.read_bytes() in body
+    assert 'filename="a.zip"' in body.decode("latin-1")
+
+
+def test_async_upload_workspaces_finishes_every_upload_before_raising(stub_server, tmp_path):
+    stub_server.routes[("POST", "/api/admin/upload")] = lambda handler, body: (200, ["ws1"], {})
+    archive = tmp_path / "a.zip"
+    archive.write_bytes(b"PK")
+
+    async def main():
+        async with AsyncTopomojo(stub_server.url, "key") as client:
+            await client.upload_workspaces([str(tmp_path / "missing.zip"), str(archive)])
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(main())
+    assert len(stub_server.requests) == 1
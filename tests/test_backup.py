@@ -0,0 +1,98 @@
+import json
+import os
+
+from pytopomojo import IncrementalBackup, Topomojo
+
+
+class Catalog:
+    """Workspaces listed and exported by the stub server."""
+
+    def __init__(self, stub_server, workspaces):
+        self.workspaces = workspaces  # id -> (name, archive bytes)
+        self.failing = set()
+        stub_server.routes[("GET", "/api/workspaces")] = self.list
+        stub_server.routes[("POST", "/api/admin/download")] = self.download
+
+    def list(self, handler, body):
+        skip = int(handler.path.split("Skip=")[1].split("&")[0])
+        items = [{"id": workspace_id, "name": name} for workspace_id, (name, _) in sorted(self.workspaces.items())]
+        return 200, items[skip:], {}
+
+    def download(self, handler, body):
+        (workspace_id,) = json.loads(body)
+        if workspace_id in self.failing:
+            return 500, {"message": "export failed"}, {}
+        return 200, self.workspaces[workspace_id][1], {}
+
+
+def downloads(stub_server):
+    return sorted(json.loads(request[3])[0] for request in stub_server.requests if request[0] == "POST")
+
+
+def objects(directory):
+    return sorted(name for _, _, files in os.walk(os.path.join(directory, "objects")) for name in files)
+
+
+def test_unchanged_workspace_is_not_downloaded_again(stub_server, tmp_path):
+    catalog = Catalog(stub_server, {"w1": ("one", b"archive-1"), "w2": ("two", b"archive-2")})
+    client = Topomojo(stub_server.url, "key")
+    backup = IncrementalBackup(str(tmp_path))
+
+    backup.run(client)
+    catalog.workspaces["w2"] = ("renamed", b"archive-2b")
+    stub_server.requests.clear()
+    result = backup.run(client)
+
+    assert downloads(stub_server) == ["w2"]
+    assert result.unchanged == ["w1"] and result.downloaded == ["w2"]
+    with open(backup.archive_path("w2"), "rb") as f:
+        assert f.read() == b"archive-2b"
+    assert len(backup.generations()) == 2
+
+
+def test_identical_archives_are_stored_once(stub_server, tmp_path):
+    Catalog(stub_server, {"w1": ("one", b"same"), "w2": ("two", b"same")})
+    backup = IncrementalBackup(str(tmp_path))
+
+    result = backup.run(Topomojo(stub_server.url, "key"), max_workers=1)
+
+    assert sorted(result.downloaded) == ["w1", "w2"] and len(result.deduplicated) == 1
+    assert len(objects(str(tmp_path))) == 1
+    assert backup.archive_path("w1") == backup.archive_path("w2")
+    assert not [name for name in os.listdir(tmp_path) if name.startswith(".staging-")]
+
+
+def test_pruning_removes_only_unreferenced_archives(stub_server, tmp_path):
+    catalog = Catalog(stub_server, {"w1": ("one", b"old"), "w2": ("two", b"kept")})
+    client = Topomojo(stub_server.url, "key")
+    backup = IncrementalBackup(str(tmp_path), keep_generations=1)
+
+    backup.run(client)
+    old_archive, kept_archive = backup.archive_path("w1"), backup.archive_path("w2")
+    catalog.workspaces["w1"] = ("one v2", b"new")
+    result = backup.run(client)
+
+    assert len(result.pruned_generations) == 1 and result.pruned_bytes == len(b"old")
+    assert not os.path.exists(old_archive)
+    assert os.path.exists(kept_archive) and os.path.exists(backup.archive_path("w1"))
+    assert len(objects(str(tmp_path))) == 2
+
+
+def test_failed_download_keeps_the_previous_archive(stub_server, tmp_path):
+    catalog = Catalog(stub_server, {"w1": ("one", b"good")})
+    client = Topomojo(stub_server.url, "key")
+    backup = IncrementalBackup(str(tmp_path), keep_generations=1)
+
+    backup.run(client)
+    catalog.workspaces["w1"] = ("changed", b"never stored")
+    catalog.failing.add("w1")
+    result = backup.run(client)
+
+    assert list(result.failed) == ["w1"]
+    assert result.pruned_bytes == 0
+    with open(backup.archive_path("w1"), "rb") as f:
+        assert f.read() == b"good"
+
+    catalog.failing.clear()
+    retry = IncrementalBackup(str(tmp_path)).run(client)
+    assert retry.downloaded == ["w1"]
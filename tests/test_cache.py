@@ -0,0 +1,45 @@
+from pytopomojo import ResponseCache, Topomojo
+
+
+def test_response_fetched_across_an_invalidation_is_not_cached(stub_server):
+    client = Topomojo(stub_server.url, "key", cache=ResponseCache())
+
+    def get_template(handler, body):
+        # A mutation completes while this GET is still in flight.
+        client._invalidate("template:t1")
+        return 200, {"id": "t1", "name": "old"}, {}
+
+    stub_server.routes[("GET", "/api/vm-template/t1")] = get_template
+
+    client.get_template("t1")
+    client.get_template("t1")
+
+    assert len(stub_server.requests) == 2
+    assert len(client.cache) == 0
+
+
+def test_unrelated_invalidation_does_not_block_caching(stub_server):
+    client = Topomojo(stub_server.url, "key", cache=ResponseCache())
+
+    def get_template(handler, body):
+        client._invalidate("template:other", "gamespaces")
+        return 200, {"id": "t1"}, {}
+
+    stub_server.routes[("GET", "/api/vm-template/t1")] = get_template
+
+    client.get_template("t1")
+    client.get_template("t1")
+
+    assert len(stub_server.requests) == 1
+
+
+def test_deploy_vm_from_template_invalidates_the_template(stub_server):
+    stub_server.routes[("GET", "/api/vm-template/t1")] = lambda handler, body: (200, {"id": "t1"}, {})
+    stub_server.routes[("POST", "/api/vm-template/t1")] = lambda handler, body: (200, {"id": "vm1"}, {})
+    client = Topomojo(stub_server.url, "key", cache=ResponseCache())
+
+    client.get_template("t1")
+    client.deploy_vm_from_template("t1")
+    client.get_template("t1")
+
+    assert [request[0] for request in stub_server.requests] == ["GET", "POST", "GET"]
@@ -0,0 +1,52 @@
+import json
+
+from pytopomojo import DiskIndex, Topomojo
+
+
+def serve_templates(stub_server, details):
+    def templates(handler, body):
+        skip = int(handler.path.split("Skip=")[1].split("&")[0]) if "Skip=" in handler.path else 0
+        items = [{"id": template_id, "name": template_id, "workspaceId": "w1"} for template_id in sorted(details)]
+        return 200, items[skip:], {}
+
+    def detail(template_id):
+        return lambda handler, body: (200, {"id": template_id,
+                                            "detail": json.dumps({"Disks": [{"Path": details[template_id]}]})}, {})
+
+    stub_server.routes[("GET", "/api/templates")] = templates
+    for template_id in details:
+        stub_server.routes[("GET", f"/api/template-detail/{template_id}")] = detail(template_id)
+
+
+def test_refresh_picks_up_detail_edits_made_on_the_server(stub_server):
+    details = {"t1": "ds://store/old.vmdk", "t2": "ds://store/other.vmdk"}
+    serve_templates(stub_server, details)
+    client = Topomojo(stub_server.url, "key")
+
+    with DiskIndex() as index:
+        assert index.refresh(client)["added"] == 2
+        details["t1"] = "ds://store/new.vmdk"
+
+        counts = index.refresh(client)
+
+        assert counts["updated"] == 1 and counts["unchanged"] == 1
+        assert index.templates_for_disk("store/new.vmdk") == ["t1"]
+        assert index.templates_for_disk("store/old.vmdk") == []
+
+
+def test_update_template_detail_marks_attached_index_stale(stub_server):
+    details = {"t1": "ds://store/old.vmdk"}
+    serve_templates(stub_server, details)
+    stub_server.routes[("PUT", "/api/template-detail")] = lambda handler, body: (200, json.loads(body), {})
+    client = Topomojo(stub_server.url, "key")
+
+    with DiskIndex() as index:
+        index.attach(client)
+        index.refresh(client, check_details=False)
+        details["t1"] = "ds://store/new.vmdk"
+        client.update_template_detail({"id": "t1", "detail": "{}"})
+
+        counts = index.refresh(client, check_details=False)
+
+        assert counts["updated"] == 1
+        assert index.disks_for_template("t1") == ["store/new.vmdk"]
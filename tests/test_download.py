@@ -0,0 +1,66 @@
+import io
+import json
+import os
+import zipfile
+
+from pytopomojo import Topomojo
+
+
+def make_package():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("ws1/topo.json", json.dumps({"id": "ws1"}))
+    return buffer.getvalue()
+
+
+def test_resumable_download_restarts_when_range_is_rejected(stub_server, tmp_path):
+    package = make_package()
+
+    def download(handler, body):
+        if handler.headers.get("Range"):
+            return 416, b"", {"Content-Range": f"bytes */{len(package)}"}
+        return 200, package, {}
+
+    stub_server.routes[("POST", "/api/admin/download")] = download
+    output = str(tmp_path / "export.zip")
+    with open(output + ".part", "wb") as f:
+        f.write(b"stale partial data")
+    with open(output + ".part.json", "w") as f:
+        json.dump({"workspace_ids": ["ws1"], "total": 4096, "etag": '"old"'}, f)
+    client = Topomojo(stub_server.url, "key")
+
+    assert client.download_workspaces_resumable(["ws1"], output, backoff=0)
+
+    with open(output, "rb") as f:
+        assert f.read() == package
+    assert [r[2].get("Range") for r in stub_server.requests] == ["bytes=18-", None]
+
+
+def test_parallel_download_reports_a_failed_workspace_and_writes_the_rest(stub_server, tmp_path):
+    packages = {workspace_id: make_package() + workspace_id.encode() for workspace_id in ("ws1", "ws3", "ws4")}
+
+    def download(handler, body):
+        [workspace_id] = json.loads(body)
+        if workspace_id not in packages:
+            return 500, {"message": "export failed"}, {}
+        return 200, packages[workspace_id], {}
+
+    stub_server.routes[("POST", "/api/admin/download")] = download
+    output_dir = tmp_path / "exports"
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.download_workspaces_parallel(["ws1", "ws2", "ws3", "ws4"], str(output_dir), max_workers=2,
+                                                 filename=lambda workspace_id: f"export-{workspace_id}.zip")
+
+    assert list(report.results) == ["ws1", "ws2", "ws3", "ws4"]
+    assert [r.key for r in report.failed] == ["ws2"]
+    assert report.results["ws2"].error.status_code == 500
+    assert report.results["ws2"].bytes == 0
+    for workspace_id, package in packages.items():
+        result = report.results[workspace_id]
+        assert result.value == str(output_dir / f"export-{workspace_id}.zip")
+        assert result.bytes == len(package)
+        with open(result.value, "rb") as f:
+            assert f.read() == package
+    assert report.total_bytes == sum(len(package) for package in packages.values())
+    assert sorted(os.listdir(output_dir)) == ["export-ws1.zip", "export-ws3.zip", "export-ws4.zip"]
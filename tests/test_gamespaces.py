@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from pytopomojo import Topomojo, TopomojoException
+
+
+def gamespace_routes(stub_server, action, statuses):
+    """Answer ``POST /api/gamespace/<id>/<action>`` with ``statuses[id]``."""
+
+    for gamespace_id, status in statuses.items():
+        payload = {"id": gamespace_id} if status == 200 else {"message": "boom"}
+        stub_server.routes[("POST", f"/api/gamespace/{gamespace_id}/{action}")] = (
+            lambda handler, body, status=status, payload=payload: (status, payload, {}))
+
+
+def posted(stub_server):
+    return sorted(path.split("/")[3] for method, path, _, _ in stub_server.requests if method == "POST")
+
+
+def test_stop_gamespaces_reports_a_failure_and_finishes_the_batch(stub_server):
+    gamespace_routes(stub_server, "stop", {"g1": 200, "g2": 500, "g3": 200, "g4": 200})
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.stop_gamespaces(["g1", "g2", "g3", "g4"], concurrency=2)
+
+    assert list(report.results) == ["g1", "g2", "g3", "g4"]
+    assert [r.key for r in report.succeeded] == ["g1", "g3", "g4"]
+    error = report.results["g2"].error
+    assert isinstance(error, TopomojoException) and error.status_code == 500
+    assert posted(stub_server) == ["g1", "g2", "g3", "g4"]
+
+
+def test_apply_to_gamespaces_filters_the_listing_and_reports_failures(stub_server):
+    gamespaces = [{"id": "g1", "isActive": True}, {"id": "g2", "isActive": False},
+                  {"id": "g3", "isActive": True}, {"id": "g4", "isActive": True}]
+    stub_server.routes[("GET", "/api/gamespaces")] = (
+        lambda handler, body: (200, gamespaces if "Skip=0" in handler.path else [], {}))
+    gamespace_routes(stub_server, "complete", {"g1": 200, "g3": 404, "g4": 200})
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.apply_to_gamespaces("complete", where=lambda g: g["isActive"], WantsAll=True)
+
+    assert list(report.results) == ["g1", "g3", "g4"]
+    assert report.results["g3"].error.status_code == 404
+    assert [r.key for r in report.succeeded] == ["g1", "g4"]
+    assert posted(stub_server) == ["g1", "g3", "g4"]
+
+
+def test_apply_to_gamespaces_rejects_an_unknown_action(stub_server):
+    client = Topomojo(stub_server.url, "key")
+
+    with pytest.raises(ValueError):
+        client.apply_to_gamespaces("delete")
+    assert stub_server.requests == []
+
+
+def test_gamespace_rate_bounds_requests_per_second(stub_server):
+    ids = [f"g{i}" for i in range(12)]
+    gamespace_routes(stub_server, "stop", {gamespace_id: 200 for gamespace_id in ids})
+    client = Topomojo(stub_server.url, "key")
+
+    started = time.monotonic()
+    report = client.stop_gamespaces(ids, concurrency=2, rate=50)
+    elapsed = time.monotonic() - started
+
+    assert len(report.succeeded) == 12
+    # The first ``concurrency`` requests use the burst; the other ten wait 1/50 s each.
+    assert elapsed >= 10 / 50 * 0.9
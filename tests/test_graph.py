@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+import pytest
+
+from pytopomojo import AsyncTopomojo, Topomojo, TopomojoException
+
+WORKSPACES = {
+    "ws1": {"id": "ws1", "templates": [{"templateId": "t1"}, {"templateId": "t2"}]},
+    "ws2": {"id": "ws2", "templates": [{"id": "t2"}, {"template": {"id": "t3"}}]},
+}
+DETAILS = {
+    "t1": {"id": "t1", "detail": json.dumps({"Disks": [{"Path": "ds://base/a.vmdk"}]})},
+    "t2": {"id": "t2", "detail": json.dumps({"Disks": [{"Path": "ds://base/shared.vmdk"}, {"Source": "base/b.vmdk"}]})},
+}
+
+
+def lookup(table):
+    def route(handler, body):
+        item_id = handler.path.rsplit("/", 1)[1]
+        if item_id in table:
+            return 200, table[item_id], {}
+        return 404, {"message": "missing"}, {}
+    return route
+
+
+def load_graph(stub_server, use_async, workspace_ids):
+    if not use_async:
+        return Topomojo(stub_server.url, "key").load_workspace_graph(workspace_ids, max_workers=4)
+
+    async def main():
+        async with AsyncTopomojo(stub_server.url, "key") as client:
+            return await client.load_workspace_graph(workspace_ids, max_workers=4)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+def test_graph_indexes_workspaces_templates_and_disks(stub_server, use_async):
+    stub_server.routes[("GET", "/api/workspace/*")] = lookup(WORKSPACES)
+    stub_server.routes[("GET", "/api/template-detail/*")] = lookup(DETAILS)
+
+    graph = load_graph(stub_server, use_async, ["ws1", "ws2", "ws3", "ws1"])
+
+    assert set(graph.workspaces) == {"ws1", "ws2"}
+    assert graph.workspace_templates == {"ws1": {"t1", "t2"}, "ws2": {"t2", "t3"}}
+    assert graph.template_workspaces["t2"] == {"ws1", "ws2"}
+    assert graph.disks == {"base/a.vmdk", "base/shared.vmdk", "base/b.vmdk"}
+    assert graph.disks_for_workspace("ws2") == {"base/shared.vmdk", "base/b.vmdk"}
+    assert graph.workspaces_for_disk("ds://base/shared.vmdk") == {"ws1", "ws2"}
+    assert graph.workspaces_for_disk("base/a.vmdk") == {"ws1"}
+
+    assert set(graph.errors) == {"workspace:ws3", "template:t3"}
+    assert isinstance(graph.errors["workspace:ws3"], TopomojoException)
+    assert graph.errors["workspace:ws3"].status_code == 404
+
+    fetched = [path for method, path, _, _ in stub_server.requests]
+    assert fetched.count("/api/workspace/ws1") == 1
+    assert fetched.count("/api/template-detail/t2") == 1
+
+
+def test_graph_rejects_zero_workers(stub_server):
+    with pytest.raises(ValueError):
+        Topomojo(stub_server.url, "key").load_workspace_graph(["ws1"], max_workers=0)
@@ -0,0 +1,31 @@
+import pytest
+
+from pytopomojo import Hooks, MetricsCollector, RequestEvent, Topomojo, TopomojoException, TransportConfig
+
+
+def test_retry_hook_fires_only_for_attempts_that_are_retried(stub_server):
+    stub_server.routes[("GET", "/api/templates")] = lambda handler, body: (503, {"message": "busy"}, {})
+    hooks = Hooks()
+    retries = []
+    hooks.on("retry", lambda method, url, status, error: retries.append(status))
+    metrics = MetricsCollector().attach(hooks)
+    client = Topomojo(stub_server.url, "key", hooks=hooks,
+                      transport=TransportConfig(retries=2, backoff_factor=0, respect_retry_after=False))
+
+    with pytest.raises(TopomojoException):
+        client.get_templates()
+
+    assert len(stub_server.requests) == 3
+    assert retries == [503, 503]
+    assert metrics.snapshot()["GET /api/templates"]["retries"] == 2
+
+
+def test_prometheus_label_values_are_escaped():
+    metrics = MetricsCollector()
+    metrics.record_request(RequestEvent(method="GET", url="", endpoint='/api/a"b\\c\nd', status=200,
+                                        elapsed=0.01, bytes_sent=0, bytes_received=0))
+
+    text = metrics.to_prometheus()
+
+    assert "\n" not in text.split("endpoint=")[1].split("}")[0]
+    assert 'endpoint="/api/a\\"b\\\\c\\nd"' in text
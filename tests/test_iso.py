@@ -0,0 +1,96 @@
+import os
+import time
+
+import pytest
+
+from pytopomojo import iso
+from pytopomojo.iso import IsoCache, IsoStream, build_iso
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    # pycdlib stamps volume and directory records with the current time.
+    monkeypatch.setattr(time, "time", lambda: 1700000000.0)
+    root = tmp_path / "tree"
+    (root / "docs" / "nested").mkdir(parents=True)
+    (root / "readme.txt").write_bytes(b"hello\n")
+    (root / "docs" / "large.bin").write_bytes(bytes(range(256)) * 9000)
+    (root / "docs" / "nested" / "empty.dat").write_bytes(b"")
+    return root
+
+
+def read_stream(directory):
+    with IsoStream(str(directory)) as image:
+        data = image.open().read()
+        streaming = image.streaming
+    assert len(data) == image.size
+    return data, streaming
+
+
+def test_streamed_iso_matches_built_iso(tree, tmp_path):
+    built = tmp_path / "built.iso"
+    build_iso(str(tree), str(built))
+
+    data, streaming = read_stream(tree)
+
+    assert streaming
+    assert data == built.read_bytes()
+
+
+def test_stream_falls_back_without_pycdlib_internals(tree, tmp_path, monkeypatch):
+    monkeypatch.setattr(iso, "_STREAMING_ATTRIBUTES", iso._STREAMING_ATTRIBUTES + ("_missing",))
+    built = tmp_path / "built.iso"
+    build_iso(str(tree), str(built))
+
+    data, streaming = read_stream(tree)
+
+    assert not streaming
+    assert data == built.read_bytes()
+
+
+def test_iso_cache_hits_rebuilds_on_change_and_evicts_least_recently_used(tmp_path):
+    trees = []
+    for name in ("a", "b", "c"):
+        tree = tmp_path / name
+        tree.mkdir()
+        (tree / "file.bin").write_bytes(name.encode() * 40000)
+        trees.append(str(tree))
+    cache = IsoCache(str(tmp_path / "cache"), max_bytes=10 ** 9)
+
+    first = cache.get_or_build(trees[0])
+    assert cache.lookup(trees[0]) == first
+    assert cache.get_or_build(trees[0]) == first
+
+    (tmp_path / "a" / "file.bin").write_bytes(b"A" * 40000)
+    os.utime(tmp_path / "a" / "file.bin", ns=(1, 1))
+    assert cache.lookup(trees[0]) is None
+    changed = cache.get_or_build(trees[0])
+    assert changed != first
+
+    size = os.path.getsize(changed)
+    other = cache.get_or_build(trees[1])
+    # Make the stale image the least recently used, then touch the changed one.
+    os.utime(first, (1, 1))
+    os.utime(other, (2, 2))
+    os.utime(changed, (3, 3))
+    cache.max_bytes = 2 * size
+
+    newest = cache.get_or_build(trees[2])
+
+    assert [entry.path for entry in cache.entries()] == [changed, newest]
+    assert not os.path.exists(first) and not os.path.exists(other)
+    assert cache.entries()[1].source == os.path.abspath(trees[2])
+
+
+def test_iso_cache_prune_keeps_the_named_image(tmp_path):
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    (tree / "file.bin").write_bytes(b"x" * 40000)
+    cache = IsoCache(str(tmp_path / "cache"))
+    path = cache.get_or_build(str(tree))
+    key = cache.entries()[0].key
+
+    assert cache.prune(max_bytes=0, keep=key) == []
+    assert os.path.exists(path)
+    assert [entry.key for entry in cache.prune(max_bytes=0)] == [key]
+    assert cache.entries() == [] and cache.total_bytes() == 0
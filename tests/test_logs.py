@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+
+from pytopomojo import Topomojo
+from pytopomojo.logs import _HANDLER_MARKER, Abbreviated, client_logger
+
+
+@pytest.fixture
+def logger_name(request):
+    name = f"pytopomojo.tests.{request.node.name}"
+    yield name
+    logger = logging.getLogger(name)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+
+def test_debug_handler_is_added_once(logger_name):
+    for _ in range(10):
+        client_logger(logger_name, debug=True)
+        client_logger(logger_name, debug=False)
+
+    handlers = [handler for handler in logging.getLogger(logger_name).handlers
+                if getattr(handler, _HANDLER_MARKER, False)]
+    assert len(handlers) == 1
+
+
+def test_client_without_debug_stays_quiet_while_another_logs(logger_name, caplog):
+    loud = client_logger(logger_name, debug=True)
+    quiet = client_logger(logger_name, debug=False)
+
+    class Exploding:
+        def __repr__(self):
+            raise AssertionError("formatted a message that is never emitted")
+
+    with caplog.at_level(logging.DEBUG, logger=logger_name):
+        quiet.debug("quiet %r", Exploding())
+        loud.debug("loud %s", "message")
+
+    assert [record.getMessage() for record in caplog.records] == ["loud message"]
+
+
+@pytest.fixture
+def restore_client_logger():
+    logger = logging.getLogger("pytopomojo.pytopomojo")
+    handlers, level = list(logger.handlers), logger.level
+    yield
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+def test_clients_share_the_module_logger_without_silencing_each_other(caplog, restore_client_logger):
+    Topomojo("http://127.0.0.1:9", "key", debug=True)
+    quiet = Topomojo("http://127.0.0.1:9", "key")
+
+    with caplog.at_level(logging.DEBUG, logger="pytopomojo.pytopomojo"):
+        quiet.logger.debug("from quiet client")
+        Topomojo("http://127.0.0.1:9", "key", debug=True).logger.debug("from debug client")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert "from debug client" in messages and "from quiet client" not in messages
+
+
+def test_abbreviated_bounds_the_repr():
+    payload = {"items": list(range(10000)), "text": "x" * 10000, "nested": [[[[["deep"]]]]]}
+
+    rendered = str(Abbreviated(payload))
+
+    assert len(rendered) < 400
+    assert "..." in rendered
+    assert str(Abbreviated("short")) == "'short'"
@@ -0,0 +1,30 @@
+import pytest
+
+from pytopomojo import CatalogMirror, Topomojo
+
+
+def first_page(items):
+    return lambda handler, body: (200, items if "Skip=0" in handler.path else [], {})
+
+
+def test_sync_passes_each_kind_only_the_parameters_it_accepts(stub_server, tmp_path):
+    stub_server.routes[("GET", "/api/workspaces")] = first_page([{"id": "w1"}])
+    stub_server.routes[("GET", "/api/gamespaces")] = first_page([{"id": "g1"}])
+    client = Topomojo(stub_server.url, "key")
+
+    with CatalogMirror(str(tmp_path / "catalog.db")) as mirror:
+        events = mirror.sync(client, kinds=["workspaces", "gamespaces"], Term="lab",
+                             params={"gamespaces": {"WantsAll": True}, "workspaces": {"scope": "mine"}})
+
+    assert sorted((event.kind, event.id) for event in events) == [("gamespaces", "g1"), ("workspaces", "w1")]
+    paths = sorted(request[1] for request in stub_server.requests if "Skip=0" in request[1])
+    assert "WantsAll=True" in paths[0] and "scope" not in paths[0] and "Term=lab" in paths[0]
+    assert "scope=mine" in paths[1] and "WantsAll" not in paths[1] and "Term=lab" in paths[1]
+
+
+def test_sync_rejects_parameters_no_kind_accepts(tmp_path):
+    client = Topomojo("http://127.0.0.1:9", "key")
+
+    with CatalogMirror(str(tmp_path / "catalog.db")) as mirror:
+        with pytest.raises(TypeError):
+            mirror.sync(client, kinds=["workspaces"], WantsAll=True)
@@ -0,0 +1,60 @@
+import io
+from urllib.parse import parse_qs
+
+import pytest
+
+from pytopomojo import Topomojo
+from pytopomojo.multipart import MultipartEncoder
+
+
+def read_all(encoder, size):
+    return b"".join(iter(lambda: encoder.read(size), b""))
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 4096, -1])
+def test_length_matches_the_bytes_produced(tmp_path, read_size):
+    path = tmp_path / "archive.zip"
+    path.write_bytes(bytes(range(256)) * 1000)
+    stream_data = b"streamed" * 5000
+    progress = []
+    encoder = MultipartEncoder(chunk_size=1000, progress=lambda sent, total: progress.append((sent, total)))
+    encoder.add_field("data", "size=1&group-key=w1", "text/plain")
+    encoder.add_field("empty", b"")
+    encoder.add_file("file", str(path))
+    encoder.add_stream("stream", lambda: io.BytesIO(stream_data), len(stream_data), 'na"me.bin',
+                       "application/octet-stream")
+    expected = len(encoder)
+
+    body = read_all(encoder, read_size) if read_size > 0 else encoder.read()
+
+    assert len(body) == expected == encoder.len
+    assert progress[-1] == (expected, expected)
+    assert body.endswith(f"--{encoder.boundary}--\r\n".encode())
+    assert path.read_bytes() in body and stream_data in body
+    assert b'filename="na%22me.bin"' in body
+
+
+def test_short_stream_raises_instead_of_sending_a_truncated_body():
+    encoder = MultipartEncoder()
+    encoder.add_stream("file", lambda: io.BytesIO(b"abc"), 10, "f.bin")
+
+    with pytest.raises(IOError):
+        read_all(encoder, 4096)
+
+
+def test_upload_iso_sends_one_data_section(stub_server, tmp_path):
+    stub_server.routes[("POST", "/api/file/upload")] = lambda handler, body: (200, {"ok": True}, {})
+    iso = tmp_path / "image.iso"
+    iso.write_bytes(b"\1" * 4096)
+    client = Topomojo(stub_server.url, "key")
+
+    client.upload_iso(str(iso), "w1")
+
+    _, _, headers, body = stub_server.requests[0]
+    assert int(headers["Content-Length"]) == len(body)
+    boundary = headers["Content-Type"].split("boundary=")[1].encode()
+    parts = [part for part in body.split(b"--" + boundary) if part.strip(b"-\r\n")]
+    data_parts = [part for part in parts if b'name="data"' in part]
+    assert len(parts) == 2 and len(data_parts) == 1
+    fields = parse_qs(data_parts[0].split(b"\r\n\r\n", 1)[1].rstrip(b"\r\n").decode())
+    assert fields == {"size": ["4096"], "group-key": ["w1"]}
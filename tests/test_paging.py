@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from pytopomojo import AsyncTopomojo, Topomojo
+
+
+def capped_catalog(stub_server, total, cap):
+    items = [{"id": f"w{index:03d}"} for index in range(total)]
+
+    def workspaces(handler, body):
+        query = dict(part.split("=", 1) for part in handler.path.split("?", 1)[1].split("&"))
+        skip, take = int(query["Skip"]), int(query["Take"])
+        return 200, items[skip:skip + min(take, cap)], {}
+
+    stub_server.routes[("GET", "/api/workspaces")] = workspaces
+    return [item["id"] for item in items]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iteration_continues_past_pages_capped_by_the_server(stub_server, prefetch):
+    expected = capped_catalog(stub_server, total=25, cap=10)
+    client = Topomojo(stub_server.url, "key")
+
+    ids = [workspace["id"] for workspace in client.iter_workspaces(page_size=50, prefetch=prefetch)]
+
+    assert ids == expected
+    assert [request[1].split("Skip=")[1].split("&")[0] for request in stub_server.requests] == ["0", "10", "20", "25"]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_async_iteration_continues_past_pages_capped_by_the_server(stub_server, prefetch):
+    expected = capped_catalog(stub_server, total=25, cap=10)
+
+    async def main():
+        async with AsyncTopomojo(stub_server.url, "key") as client:
+            return [workspace["id"] async for workspace in client.iter_workspaces(page_size=50, prefetch=prefetch)]
+
+    assert asyncio.run(main()) == expected
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from pytopomojo import PollCancelledError, PollPolicy, PollTimeoutError, Topomojo
+from pytopomojo import polling
+
+
+def template_with_progress(values):
+    """Serve a template whose task reports ``values`` in turn, then no task."""
+
+    remaining = list(values)
+
+    def route(handler, body):
+        if remaining:
+            return 200, {"id": "t1", "task": {"progress": remaining.pop(0)}}, {}
+        return 200, {"id": "t1", "task": None}, {}
+
+    return route
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(polling.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_backoff_grows_while_stalled_and_is_capped(stub_server, sleeps):
+    stub_server.routes[("GET", "/api/vm-template/t1")] = template_with_progress([10, 10, 10, 10, 10])
+    client = Topomojo(stub_server.url, "key")
+    ticks = []
+
+    template = client.wait_for_template("t1", poll=PollPolicy(initial=1, multiplier=2, maximum=4, jitter=0),
+                                        on_progress=ticks.append)
+
+    assert template["task"] is None
+    assert sleeps == [1, 2, 4, 4, 4]
+    assert ticks == [10, 10, 10, 10, 10, 100]
+
+
+def test_backoff_holds_while_progress_changes(stub_server, sleeps):
+    stub_server.routes[("GET", "/api/vm-template/t1")] = template_with_progress([10, 20, 30, 30])
+    client = Topomojo(stub_server.url, "key")
+
+    client.wait_for_template("t1", poll=PollPolicy(initial=1, multiplier=2, maximum=4, jitter=0))
+
+    assert sleeps == [1, 1, 1, 2]
+
+
+def test_timeout_raises_with_last_value(stub_server):
+    stub_server.routes[("GET", "/api/vm-template/t1")] = template_with_progress([50] * 1000)
+    client = Topomojo(stub_server.url, "key")
+
+    started = time.monotonic()
+    with pytest.raises(PollTimeoutError) as info:
+        client.wait_for_template("t1", poll=PollPolicy(initial=0.01, maximum=0.01, timeout=0.1))
+
+    assert time.monotonic() - started < 2
+    assert info.value.last_value["task"]["progress"] == 50
+
+
+def test_cancel_stops_polling(stub_server):
+    stub_server.routes[("GET", "/api/vm-template/t1")] = template_with_progress([50] * 1000)
+    client = Topomojo(stub_server.url, "key")
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(PollCancelledError):
+        client.wait_for_template("t1", poll=PollPolicy(initial=5), cancel=cancel)
+
+    assert len(stub_server.requests) == 1
+
+
+def test_iso_wait_treats_missing_progress_as_done(stub_server, tmp_path):
+    stub_server.routes[("POST", "/api/file/upload")] = lambda handler, body: (200, {"ok": True}, {})
+    iso = tmp_path / "image.iso"
+    iso.write_bytes(b"\0" * 2048)
+    client = Topomojo(stub_server.url, "key")
+
+    assert client.upload_iso(str(iso), "w1", wait=True) == {"ok": True}
+
+    assert [request[1].rsplit("/", 1)[0] for request in stub_server.requests] == ["/api/file", "/api/file/progress"]
+
+
+def test_iso_wait_polls_until_complete(stub_server, tmp_path, sleeps):
+    progress = iter([20, 60, 100])
+    stub_server.routes[("POST", "/api/file/upload")] = lambda handler, body: (200, {"ok": True}, {})
+    stub_server.routes[("GET", "/api/file/progress/*")] = lambda handler, body: (200, next(progress), {})
+    iso = tmp_path / "image.iso"
+    iso.write_bytes(b"\0" * 2048)
+    client = Topomojo(stub_server.url, "key")
+
+    client.upload_iso(str(iso), "w1", wait=True, poll=PollPolicy(initial=1, jitter=0))
+
+    assert len(stub_server.requests) == 4
+    assert sleeps == [1, 1]
+
+
+def test_poll_many_reports_each_task(sleeps):
+    values = {"fast": iter([100]), "slow": iter([0, 0, 100]), "broken": iter([])}
+    policy = PollPolicy(initial=1, multiplier=2, jitter=0)
+
+    report = polling.poll_many({key: (lambda it=it: next(it)) for key, it in values.items()},
+                               lambda value: value >= 100, policy=policy)
+
+    assert report.results["fast"].ok and report.results["fast"].attempts == 1
+    assert report.results["slow"].ok and report.results["slow"].attempts == 3
+    assert not report.results["broken"].ok and isinstance(report.results["broken"].error, StopIteration)
+
+
+def test_poll_many_times_out_pending_tasks():
+    report = polling.poll_many({"stuck": lambda: 0}, lambda value: value >= 100,
+                               policy=PollPolicy(initial=0.01, maximum=0.01, timeout=0.05))
+
+    assert isinstance(report.results["stuck"].error, PollTimeoutError)
+    assert report.results["stuck"].attempts >= 2
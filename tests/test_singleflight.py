@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pytopomojo import AsyncSingleFlight, SingleFlight, Topomojo
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def run_concurrently(flight, func, callers):
+    """Call ``flight.do`` from ``callers`` threads while the leader is blocked in ``func``."""
+
+    release = threading.Event()
+
+    def leader_func():
+        release.wait(5)
+        return func()
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(flight.do, "key", leader_func) for _ in range(callers)]
+        wait_for(lambda: flight.stats()["deduplicated"] == callers - 1)
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    results = run_concurrently(flight, lambda: calls.append(1) or "value", callers=8)
+
+    assert calls == [1]
+    assert sorted(results, key=lambda result: result[1]) == [("value", False)] + [("value", True)] * 7
+    assert flight.stats() == {"executed": 1, "deduplicated": 7, "in_flight": 0}
+
+
+def test_leader_exception_reaches_every_follower():
+    flight = SingleFlight()
+    error = ValueError("boom")
+
+    def fail():
+        raise error
+
+    results = run_concurrently(flight, fail, callers=5)
+
+    assert results == [error] * 5
+
+
+def test_key_is_not_shared_after_the_leader_finishes():
+    flight = SingleFlight()
+
+    assert flight.do("key", lambda: 1) == (1, False)
+    assert flight.do("key", lambda: 2) == (2, False)
+    assert flight.stats() == {"executed": 2, "deduplicated": 0, "in_flight": 0}
+
+
+def test_async_concurrent_calls_share_one_execution_and_errors():
+    async def main():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(6)))
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        errors = await asyncio.gather(*(flight.do("other", fail) for _ in range(3)), return_exceptions=True)
+        after = await flight.do("key", fetch)
+        return calls, results, errors, after, flight.stats()
+
+    calls, results, errors, after, stats = asyncio.run(main())
+
+    assert len(calls) == 2
+    assert results == [("value", False)] + [("value", True)] * 5
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert after == ("value", False)
+    assert stats == {"executed": 3, "deduplicated": 7, "in_flight": 0}
+
+
+def test_concurrent_identical_gets_send_one_request(stub_server):
+    release = threading.Event()
+
+    def templates(handler, body):
+        release.wait(5)
+        return 200, [{"id": "t1"}], {}
+
+    stub_server.routes[("GET", "/api/templates")] = templates
+    client = Topomojo(stub_server.url, "key")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(client.get_templates) for _ in range(4)]
+        wait_for(lambda: client.singleflight.stats()["deduplicated"] == 3)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [[{"id": "t1"}]] * 4
+    assert results[0] is not results[1]
+    assert len(stub_server.requests) == 1
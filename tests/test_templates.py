@@ -0,0 +1,95 @@
+import pytest
+
+from pytopomojo import PollPolicy, Topomojo, TopomojoException
+from pytopomojo import polling
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Run the polling loop on a fake clock that ``time.sleep`` advances."""
+
+    now = [1000.0]
+    monkeypatch.setattr(polling.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(polling.time, "sleep", lambda seconds: now.__setitem__(0, now[0] + seconds))
+    return now
+
+
+def template_routes(stub_server, init_status, checks):
+    """Route template initialization and polling.
+
+    ``init_status`` maps template IDs to the PUT status; ``checks`` maps them
+    to the ``(status, task)`` answers served to successive GETs, the last
+    one repeating.
+    """
+
+    remaining = {template_id: list(answers) for template_id, answers in checks.items()}
+
+    def initialize(handler, body):
+        template_id = handler.path.rsplit("/", 1)[1]
+        status = init_status[template_id]
+        return status, {"id": template_id} if status == 200 else {"message": "boom"}, {}
+
+    def load(handler, body):
+        template_id = handler.path.rsplit("/", 1)[1]
+        answers = remaining[template_id]
+        status, task = answers.pop(0) if len(answers) > 1 else answers[0]
+        return status, {"id": template_id, "task": task} if status == 200 else {"message": "boom"}, {}
+
+    stub_server.routes[("PUT", "/api/vm-template/*")] = initialize
+    stub_server.routes[("GET", "/api/vm-template/*")] = load
+
+
+def test_initialize_templates_reports_a_failed_request_and_continues(stub_server, clock):
+    template_routes(stub_server, {"t1": 200, "t2": 500, "t3": 200},
+                    {"t1": [(200, {"progress": 50}), (200, None)], "t3": [(200, None)]})
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.initialize_templates(["t1", "t2", "t3"], poll=PollPolicy(initial=1, jitter=0))
+
+    assert list(report.results) == ["t1", "t2", "t3"]
+    assert [r.key for r in report.succeeded] == ["t1", "t3"]
+    failed = report.results["t2"]
+    assert isinstance(failed.error, TopomojoException) and failed.error.status_code == 500
+    assert failed.attempts == 1
+    assert not any(r[0] == "GET" and r[1].endswith("/t2") for r in stub_server.requests)
+    assert report.results["t1"].value["task"] is None
+
+
+def test_initialize_templates_counts_the_request_and_every_check(stub_server, clock):
+    template_routes(stub_server, {"t1": 200, "t2": 200},
+                    {"t1": [(200, {"progress": 10}), (200, {"progress": 60}), (200, None)], "t2": [(200, None)]})
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.initialize_templates(["t1", "t2"], poll=PollPolicy(initial=1, jitter=0))
+
+    assert report.results["t1"].attempts == 1 + 3
+    assert report.results["t2"].attempts == 1 + 1
+
+
+def test_initialize_templates_reports_a_failed_check_without_stopping_the_others(stub_server, clock):
+    template_routes(stub_server, {"t1": 200, "t2": 200},
+                    {"t1": [(200, {"progress": 10}), (200, {"progress": 20}), (200, None)],
+                     "t2": [(200, {"progress": 10}), (500, None)]})
+    client = Topomojo(stub_server.url, "key")
+    progress = []
+
+    report = client.initialize_templates(["t1", "t2"], poll=PollPolicy(initial=1, jitter=0),
+                                         on_progress=lambda template_id, percent: progress.append((template_id, percent)))
+
+    assert report.results["t1"].ok and report.results["t1"].attempts == 1 + 3
+    failed = report.results["t2"]
+    assert not failed.ok and failed.error.status_code == 500
+    assert failed.attempts == 1 + 2
+    assert ("t1", 100) in progress and ("t2", 100) not in progress
+
+
+def test_initialize_templates_reports_templates_past_the_deadline(stub_server, clock):
+    template_routes(stub_server, {"t1": 200, "t2": 200},
+                    {"t1": [(200, None)], "t2": [(200, {"progress": 10})]})
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.initialize_templates(["t1", "t2"], poll=PollPolicy(initial=1, maximum=1, jitter=0, timeout=5))
+
+    assert report.results["t1"].ok
+    assert isinstance(report.results["t2"].error, polling.PollTimeoutError)
+    assert report.results["t2"].error.last_value["task"] == {"progress": 10}
@@ -0,0 +1,62 @@
+import pytest
+
+from pytopomojo import Governor, Topomojo, TopomojoException, TransportConfig
+
+
+def test_post_throttle_status_decreases_rate(stub_server):
+    stub_server.routes[("POST", "/api/gamespace/g1/stop")] = lambda handler, body: (429, {"message": "slow"}, {})
+    governor = Governor(rate=10)
+    client = Topomojo(stub_server.url, "key", governor=governor, transport=TransportConfig(backoff_factor=0))
+
+    with pytest.raises(TopomojoException):
+        client.stop_gamespace("g1")
+
+    # POST is not retried, so the adapter must report the 429 itself.
+    assert len(stub_server.requests) == 1
+    assert governor.throttled == 1
+    assert governor.rate == 5
+
+
+def test_retried_get_is_reported_once_per_attempt(stub_server):
+    stub_server.routes[("GET", "/api/templates")] = lambda handler, body: (503, {"message": "busy"}, {})
+    governor = Governor(rate=10)
+    client = Topomojo(stub_server.url, "key", governor=governor,
+                      transport=TransportConfig(retries=2, backoff_factor=0, respect_retry_after=False))
+
+    with pytest.raises(TopomojoException):
+        client.get_templates()
+
+    assert len(stub_server.requests) == 3
+    assert governor.throttled == 3
+
+
+def test_put_is_not_retried_by_default(stub_server):
+    stub_server.routes[("PUT", "/api/vm-template/t1")] = lambda handler, body: (503, {"message": "busy"}, {})
+    client = Topomojo(stub_server.url, "key", transport=TransportConfig(retries=2, backoff_factor=0))
+
+    with pytest.raises(TopomojoException):
+        client.initialize_template("t1")
+
+    assert len(stub_server.requests) == 1
+
+
+def test_each_retried_attempt_waits_for_a_rate_token(stub_server):
+    stub_server.routes[("GET", "/api/templates")] = lambda handler, body: (503, {"message": "busy"}, {})
+
+    class CountingGovernor(Governor):
+        paced = 0
+
+        def pace(self):
+            self.paced += 1
+            super().pace()
+
+    governor = CountingGovernor(rate=1000, read_concurrency=1)
+    client = Topomojo(stub_server.url, "key", governor=governor,
+                      transport=TransportConfig(retries=2, backoff_factor=0, respect_retry_after=False))
+
+    with pytest.raises(TopomojoException):
+        client.get_templates()
+
+    assert len(stub_server.requests) == 3
+    assert governor.paced == 2
+    assert governor.stats()["in_flight"]["read"] == 0
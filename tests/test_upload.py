@@ -0,0 +1,84 @@
+import os
+import zipfile
+
+from pytopomojo import Topomojo
+
+
+def make_archive(path, workspace_id):
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(f"{workspace_id}/topo.json", '{"id": "%s", "name": "%s"}' % (workspace_id, workspace_id))
+    return str(path)
+
+
+def test_parallel_upload_reports_missing_archive_and_continues(stub_server, tmp_path):
+    stub_server.routes[("POST", "/api/admin/upload")] = lambda handler, body: (200, ["ws1"], {})
+    good = make_archive(tmp_path / "good.zip", "ws1")
+    missing = str(tmp_path / "missing.zip")
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.upload_workspaces_parallel([missing, good, good], retries=0)
+
+    assert list(report.results) == [missing, good]
+    assert report.results[good].ok and report.results[good].value == ["ws1"]
+    assert isinstance(report.results[missing].error, FileNotFoundError)
+    assert report.results[missing].attempts == 0
+    assert len(stub_server.requests) == 1
+
+
+def test_parallel_upload_does_not_repeat_an_upload_the_server_imported(stub_server, tmp_path):
+    stub_server.routes[("POST", "/api/admin/upload")] = lambda handler, body: (502, {"message": "gateway"}, {})
+    stub_server.routes[("GET", "/api/workspace/ws1")] = lambda handler, body: (200, {"id": "ws1"}, {})
+    archive = make_archive(tmp_path / "a.zip", "ws1")
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.upload_workspaces_parallel([archive], retries=2, backoff=0)
+
+    assert report.results[archive].ok and report.results[archive].value == ["ws1"]
+    assert [r[0] for r in stub_server.requests] == ["POST", "GET"]
+
+
+def test_parallel_upload_retries_when_the_server_did_not_import(stub_server, tmp_path):
+    responses = iter([(502, {"message": "gateway"}, {}), (200, ["ws1"], {})])
+    stub_server.routes[("POST", "/api/admin/upload")] = lambda handler, body: next(responses)
+    stub_server.routes[("GET", "/api/workspace/ws1")] = lambda handler, body: (404, {"message": "missing"}, {})
+    archive = make_archive(tmp_path / "a.zip", "ws1")
+    client = Topomojo(stub_server.url, "key")
+
+    report = client.upload_workspaces_parallel([archive], retries=2, backoff=0)
+
+    assert report.results[archive].ok and report.results[archive].attempts == 2
+    assert [r[0] for r in stub_server.requests] == ["POST", "GET", "POST"]
+
+
+def test_parallel_upload_with_ledger_reports_unreadable_archive(stub_server, tmp_path):
+    from pytopomojo import UploadLedger
+
+    stub_server.routes[("POST", "/api/admin/upload")] = lambda handler, body: (200, ["ws1"], {})
+    good = make_archive(tmp_path / "good.zip", "ws1")
+    unreadable = tmp_path / "dir.zip"
+    os.mkdir(unreadable)
+    client = Topomojo(stub_server.url, "key")
+
+    with UploadLedger() as ledger:
+        report = client.upload_workspaces_parallel([str(unreadable), good], ledger=ledger)
+
+    assert report.results[good].ok
+    assert not report.results[str(unreadable)].ok
+
+
+def test_parallel_upload_records_an_upload_the_server_imported_in_the_ledger(stub_server, tmp_path):
+    from pytopomojo import UploadLedger
+
+    stub_server.routes[("POST", "/api/admin/upload")] = lambda handler, body: (502, {"message": "gateway"}, {})
+    stub_server.routes[("GET", "/api/workspace/ws1")] = lambda handler, body: (200, {"id": "ws1"}, {})
+    archive = make_archive(tmp_path / "a.zip", "ws1")
+    client = Topomojo(stub_server.url, "key")
+
+    with UploadLedger() as ledger:
+        first = client.upload_workspaces_parallel([archive], retries=2, backoff=0, ledger=ledger)
+        second = client.upload_workspaces_parallel([archive], ledger=ledger)
+        assert ledger.lookup(ledger.hash_file(archive)) == ["ws1"]
+
+    assert first.results[archive].value == ["ws1"] and not first.results[archive].skipped
+    assert second.results[archive].skipped and second.results[archive].value == ["ws1"]
+    assert [r[0] for r in stub_server.requests] == ["POST", "GET"]